@@ -1,24 +1,206 @@
 from flask import Blueprint, render_template, request, current_app
-import pymysql
-from pymysql.cursors import DictCursor
+import json
 import math
 import logging
+from pagination import decode_cursor, encode_cursor, fetch_page, count_cache
+from db_pool import get_db
+from result_cache import TieredCache, create_shared_backend, register_cache
+from data_version import data_versions
+from pill_index import INDEX_COLUMNS, get_pill_index, invalidate_pill_index
+from imprint_matcher import IMPRINT_COLUMNS, get_imprint_matcher, invalidate_imprint_matcher
 
 # 블루프린트 생성
 advanced_search_bp = Blueprint('advanced_search', __name__)
 
+# 낱알식별 검색 결과 캐시 (정규화된 검색 조건 + 페이지 단위)
+search_result_cache = register_cache('advanced_search', TieredCache(
+    'advanced_search', max_entries=2048, ttl=600, shared_backend=create_shared_backend()
+))
+
+# 로더가 drug_identification 에 데이터를 기록하면 캐시 무효화
+data_versions.on_change('drug_identification', search_result_cache.clear)
+data_versions.on_change('drug_identification', count_cache.clear)
+data_versions.on_change('drug_identification', invalidate_pill_index)
+data_versions.on_change('drug_identification', invalidate_imprint_matcher)
+
+# 비트맵 인덱스만으로 처리할 수 없는 (텍스트) 검색 조건
+TEXT_FILTERS = ('item_name', 'entp_name', 'print_front', 'print_back')
+
 def get_db_connection():
-    """데이터베이스 연결 생성 함수"""
-    return pymysql.connect(
-        host=current_app.config.get('DB_HOST', 'localhost'),
-        user=current_app.config.get('DB_USER', 'root'),
-        password=current_app.config.get('DB_PASSWORD', '1234'), #1234 입력하니 오류 해결됨
-        db=current_app.config.get('DB_NAME', 'medicine_db'),
-        charset='utf8mb4',
-        cursorclass=DictCursor,
-        auth_plugin_map={'mysql_native_password': 'mysql_native_password'}
+    """데이터베이스 연결 (커넥션 풀에서 요청 단위로 대여, 요청 종료 시 자동 반납)"""
+    return get_db()
+
+def normalize_search_filters(args):
+    """요청 파라미터를 정규화된 검색 조건으로 변환 (캐시 키로도 사용)"""
+    def clean(value):
+        return ' '.join((value or '').split())
+
+    shapes = [shape for shape in args.getlist('drug_shape') if shape]
+    if 'all' in shapes:
+        shapes = []
+
+    return {
+        'item_name': clean(args.get('item_name')),
+        'entp_name': clean(args.get('entp_name')),
+        'drug_shape': sorted(set(shapes)),
+        'colors': sorted(set(color for color in args.getlist('color') if color)),
+        # 각인은 대소문자 구분 없이 비교되므로 대문자로 통일
+        'print_front': clean(args.get('print_front')).upper(),
+        'print_back': clean(args.get('print_back')).upper(),
+        'line_front': clean(args.get('line_front')),
+        'line_back': clean(args.get('line_back'))
+    }
+
+def build_line_condition(column, value, query_parts, params):
+    """분할선 검색 조건 추가"""
+    # + 기호를 선택했을 때 '십자분할선'도 함께 검색
+    if value == '+':
+        query_parts.append(f"({column} = %s OR {column} LIKE %s)")
+        params.append('+')
+        params.append('%십자%')
+    # 기타를 선택했을 때
+    elif value == '기타':
+        query_parts.append(f"({column} != '+' AND {column} != '-' AND {column} IS NOT NULL)")
+    # 다른 값(예: -)을 선택했을 때
+    else:
+        query_parts.append(f"{column} = %s")
+        params.append(value)
+
+def build_where_clause(filters):
+    """검색 조건으로 WHERE 절과 파라미터 구성"""
+    query_parts = []
+    params = []
+    
+    # 제품명 검색 (부분 검색)
+    if filters['item_name']:
+        query_parts.append("(item_name LIKE %s OR item_eng_name LIKE %s)")
+        search_name = f"%{filters['item_name']}%"
+        params.extend([search_name, search_name])
+    
+    # 제조사 검색 (부분 검색)
+    if filters['entp_name']:
+        query_parts.append("entp_name LIKE %s")
+        params.append(f"%{filters['entp_name']}%")
+    
+    # 모양 검색 (복수 선택 가능)
+    if filters['drug_shape']:
+        shape_conditions = " OR ".join(["drug_shape = %s"] * len(filters['drug_shape']))
+        query_parts.append(f"({shape_conditions})")
+        params.extend(filters['drug_shape'])
+    
+    # 색상 검색 (복수 선택 가능)
+    if filters['colors']:
+        color_conditions = " OR ".join(["color_class1 = %s"] * len(filters['colors']))
+        query_parts.append(f"({color_conditions})")
+        params.extend(filters['colors'])
+    
+    # 앞면 마크 검색
+    if filters['print_front']:
+        query_parts.append("(print_front LIKE %s OR mark_code_front LIKE %s)")
+        front_mark = f"%{filters['print_front']}%"
+        params.extend([front_mark, front_mark])
+    
+    # 뒷면 마크 검색
+    if filters['print_back']:
+        query_parts.append("(print_back LIKE %s OR mark_code_back LIKE %s)")
+        back_mark = f"%{filters['print_back']}%"
+        params.extend([back_mark, back_mark])
+        
+    # 앞면/뒷면 분할선 검색
+    if filters['line_front']:
+        build_line_condition('line_front', filters['line_front'], query_parts, params)
+    if filters['line_back']:
+        build_line_condition('line_back', filters['line_back'], query_parts, params)
+    
+    # 최종 쿼리 구성
+    where_clause = " AND ".join(query_parts) if query_parts else "1=1"
+    return where_clause, params
+
+def make_cache_key(filters, page, cursor_token, exact_count, data_version):
+    """검색 결과 캐시 키"""
+    return json.dumps(
+        [data_version, filters, page, cursor_token or '', exact_count],
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
     )
 
+def load_pill_index_rows():
+    """비트맵 인덱스 생성용 데이터 조회"""
+    with get_db().cursor() as cursor:
+        cursor.execute(f"SELECT {INDEX_COLUMNS} FROM drug_identification")
+        return cursor.fetchall()
+
+def load_imprint_rows():
+    """각인 인덱스 생성용 데이터 조회"""
+    with get_db().cursor() as cursor:
+        cursor.execute(f"SELECT {IMPRINT_COLUMNS} FROM drug_identification")
+        return cursor.fetchall()
+
+def fetch_rows_by_ids(conn, row_ids):
+    """id 목록 순서대로 drug_identification 행 조회"""
+    if not row_ids:
+        return []
+    placeholders = ', '.join(['%s'] * len(row_ids))
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT * FROM drug_identification WHERE id IN ({placeholders})", row_ids)
+        rows_by_id = {row['id']: row for row in cursor.fetchall()}
+    return [rows_by_id[row_id] for row_id in row_ids if row_id in rows_by_id]
+
+def search_with_imprint_index(conn, filters, page, per_page):
+    """각인 조건이 있는 경우 각인 인덱스로 근사 검색 (불가능하면 None)
+
+    결과는 일치 점수순이며, 모양/색상/분할선 조건은 비트맵 인덱스로 거른다.
+    """
+    if not (filters['print_front'] or filters['print_back']):
+        return None
+    if filters['item_name'] or filters['entp_name']:
+        return None
+
+    matcher = get_imprint_matcher(load_imprint_rows)
+    if matcher is None:
+        return None
+    ranked = matcher.lookup(filters['print_front'], filters['print_back'])
+
+    if any(filters[key] for key in ('drug_shape', 'colors', 'line_front', 'line_back')):
+        index = get_pill_index(load_pill_index_rows)
+        if index is None:
+            return None
+        bitmap = index.query(filters)
+        ranked = [(row_id, score) for row_id, score in ranked if index.contains(bitmap, row_id)]
+
+    offset = (page - 1) * per_page
+    page_ids = [row_id for row_id, _ in ranked[offset:offset + per_page]]
+
+    return {
+        'rows': fetch_rows_by_ids(conn, page_ids),
+        'total_count': len(ranked),
+        'count_is_estimate': False,
+        # 점수순 결과는 페이지 번호로 이동 (인메모리 목록이므로 깊이와 무관)
+        'next_cursor': None
+    }
+
+def search_with_bitmap_index(conn, filters, page, per_page, after):
+    """모양/색상/분할선 조건만 있는 경우 비트맵 인덱스로 검색 (불가능하면 None)"""
+    if any(filters[key] for key in TEXT_FILTERS):
+        return None
+
+    index = get_pill_index(load_pill_index_rows)
+    if index is None:
+        return None
+
+    bitmap = index.query(filters)
+    total_count = index.count(bitmap)
+    page_ids, has_next, last_key = index.page(
+        bitmap, per_page, offset=(page - 1) * per_page, after=after
+    )
+
+    # 최종 페이지의 행만 DB에서 조회
+    return {
+        'rows': fetch_rows_by_ids(conn, page_ids),
+        'total_count': total_count,
+        'count_is_estimate': False,
+        'next_cursor': encode_cursor(*last_key) if has_next and last_key else None
+    }
+
 @advanced_search_bp.route('/')
 def index():
     """고급 검색 페이지"""
@@ -28,121 +210,63 @@ def index():
 def advanced_search():
     """고급 검색 결과 페이지"""
     # 검색 파라미터 가져오기
+    filters = normalize_search_filters(request.args)
     search_params = {
-        'item_name': request.args.get('item_name', ''),
-        'entp_name': request.args.get('entp_name', ''),
-        'drug_shape': request.args.getlist('drug_shape'),
-        'colors': request.args.getlist('color'),
-        'print_front': request.args.get('print_front', ''),
-        'print_back': request.args.get('print_back', ''),
+        'item_name': filters['item_name'],
+        'entp_name': filters['entp_name'],
+        'drug_shape': filters['drug_shape'],
+        'colors': filters['colors'],
+        'print_front': filters['print_front'],
+        'print_back': filters['print_back'],
     }
     
     # 페이지네이션 파라미터
     page = int(request.args.get('page', 1))
     per_page = 12
-    offset = (page - 1) * per_page
+    # 키셋 커서 (다음 페이지 이동 시 사용) 및 정확한 결과 수 요청 여부
+    cursor_token = request.args.get('cursor')
+    after = decode_cursor(cursor_token)
+    exact_count = request.args.get('exact_count') == '1'
     
     # 데이터베이스 연결
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 검색 쿼리 구성
-        query_parts = []
-        params = []
-        
-        # 제품명 검색 (부분 검색)
-        if search_params['item_name']:
-            query_parts.append("(item_name LIKE %s OR item_eng_name LIKE %s)")
-            search_name = f"%{search_params['item_name']}%"
-            params.extend([search_name, search_name])
-        
-        # 제조사 검색 (부분 검색)
-        if search_params['entp_name']:
-            query_parts.append("entp_name LIKE %s")
-            params.append(f"%{search_params['entp_name']}%")
-        
-        # 모양 검색 (복수 선택 가능)
-        if search_params['drug_shape'] and 'all' not in search_params['drug_shape']:
-            shape_conditions = " OR ".join(["drug_shape = %s"] * len(search_params['drug_shape']))
-            query_parts.append(f"({shape_conditions})")
-            params.extend(search_params['drug_shape'])
         
-        # 색상 검색 (복수 선택 가능)
-        if search_params['colors']:
-            color_conditions = " OR ".join(["color_class1 = %s"] * len(search_params['colors']))
-            query_parts.append(f"({color_conditions})")
-            params.extend(search_params['colors'])
+        # 캐시 조회 (로더가 데이터를 기록하면 버전이 바뀌어 자동 무효화)
+        data_version = data_versions.version('drug_identification', conn)
+        cache_key = make_cache_key(filters, page, cursor_token if after else None, exact_count, data_version)
+        page_result = search_result_cache.get(cache_key)
         
-        # 앞면 마크 검색
-        if search_params['print_front']:
-            query_parts.append("(print_front LIKE %s OR mark_code_front LIKE %s)")
-            front_mark = f"%{search_params['print_front']}%"
-            params.extend([front_mark, front_mark])
-        
-        # 뒷면 마크 검색
-        if search_params['print_back']:
-            query_parts.append("(print_back LIKE %s OR mark_code_back LIKE %s)")
-            back_mark = f"%{search_params['print_back']}%"
-            params.extend([back_mark, back_mark])
+        if page_result is None:
+            # 각인 조건은 각인 인덱스, 모양/색상/분할선 조합은 비트맵 인덱스로 처리
+            page_result = search_with_imprint_index(conn, filters, page, per_page)
             
-        # 앞면 분할선 검색
-        if 'line_front' in request.args and request.args.get('line_front'):
-            line_front_value = request.args.get('line_front')
+            if page_result is None:
+                page_result = search_with_bitmap_index(conn, filters, page, per_page, after)
             
-            # + 기호를 선택했을 때 '십자분할선'도 함께 검색
-            if line_front_value == '+':
-                query_parts.append("(line_front = %s OR line_front LIKE %s)")
-                params.append('+')
-                params.append('%십자%')
-            # 기타를 선택했을 때
-            elif line_front_value == '기타':
-                query_parts.append("(line_front != '+' AND line_front != '-' AND line_front IS NOT NULL)")
-            # 다른 값(예: -)을 선택했을 때
-            else:
-                query_parts.append("line_front = %s")
-                params.append(line_front_value)
-
-        # 뒷면 분할선 검색 (동일한 로직)
-        if 'line_back' in request.args and request.args.get('line_back'):
-            line_back_value = request.args.get('line_back')
+            if page_result is None:
+                where_clause, params = build_where_clause(filters)
+                
+                # 페이지 조회 및 총 결과 개수 (캐시/추정치 사용, exact_count=1 일 때만 정확히 계산)
+                with conn.cursor() as cursor:
+                    page_result = fetch_page(
+                        cursor, '*', 'drug_identification', where_clause, params, per_page,
+                        page=page, after=after, exact=exact_count
+                    )
             
-            if line_back_value == '+':
-                query_parts.append("(line_back = %s OR line_back LIKE %s)")
-                params.append('+')
-                params.append('%십자%')
-            elif line_back_value == '기타':
-                query_parts.append("(line_back != '+' AND line_back != '-' AND line_back IS NOT NULL)")
-            else:
-                query_parts.append("line_back = %s")
-                params.append(line_back_value)
-        
-        # 최종 쿼리 구성
-        where_clause = " AND ".join(query_parts) if query_parts else "1=1"
+            # 새로 계산한 결과만 저장 (캐시 적중 시 다시 쓰면 공유 캐시 TTL 이 계속 연장됨)
+            search_result_cache.set(cache_key, page_result)
         
-        # 총 결과 개수 쿼리
-        count_query = f"SELECT COUNT(*) as total FROM drug_identification WHERE {where_clause}"
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()['total']
+        results = page_result['rows']
+        total_count = page_result['total_count']
         
         # 총 페이지 수 계산
         total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
         
-        # 결과가 있는 경우만 메인 쿼리 실행
-        results = []
-        if total_count > 0:
-            # 메인 검색 쿼리
-            query = f"""
-            SELECT * FROM drug_identification 
-            WHERE {where_clause}
-            ORDER BY item_name
-            LIMIT %s OFFSET %s
-            """
-            cursor.execute(query, params + [per_page, offset])
-            results = cursor.fetchall()
-        
         # 페이지네이션 URL 구성
-        pagination_url = request.base_url + '?' + '&'.join([f"{k}={v}" for k, v in request.args.items() if k != 'page'])
+        pagination_url = request.base_url + '?' + '&'.join(
+            [f"{k}={v}" for k, v in request.args.items() if k not in ('page', 'cursor')]
+        )
         
         return render_template(
             'advanced_search_results.html',
@@ -150,6 +274,8 @@ def advanced_search():
             total_count=total_count,
             current_page=page,
             total_pages=total_pages,
+            count_is_estimate=page_result['count_is_estimate'],
+            next_cursor=page_result['next_cursor'],
             search_params=search_params,
             pagination_url=pagination_url
         )
@@ -157,7 +283,3 @@ def advanced_search():
     except Exception as e:
         current_app.logger.error(f"고급 검색 오류: {str(e)}")
         return f"검색 중 오류가 발생했습니다: {str(e)}", 500
-    
-    finally:
-        if 'conn' in locals():
-            conn.close()
\ No newline at end of file
@@ -0,0 +1,182 @@
+import os
+import re
+import json
+import threading
+import time
+import logging
+
+logger = logging.getLogger('app')
+
+# 가용 모델 리스트 (앞에서부터 순서대로 시도)
+GEMINI_MODELS = [
+    'models/gemini-1.5-pro',
+    'models/gemini-1.5-flash',
+    'models/gemini-1.5-flash-8b',
+    'models/gemini-pro-vision'
+]
+
+# 모델 백엔드 선택: gemini, local, auto (auto 는 GEMINI_API_KEY 가 있으면 gemini)
+AI_MODEL_BACKEND = os.getenv('AI_MODEL_BACKEND', 'auto').lower()
+
+# 앱 시작 시 백그라운드에서 모델을 미리 준비할지 여부
+AI_MODEL_WARMUP = os.getenv('AI_MODEL_WARMUP', '0') == '1'
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+MODEL_RETRY_DELAY = 60
+
+
+class LocalResponse:
+    """generate_content 응답 (Gemini 응답과 같은 text 속성만 제공)"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class LocalModel:
+    """네트워크 없이 동작하는 대체 모델
+
+    키워드 추출 프롬프트에는 질문을 약품명으로 하는 JSON 을, 그 외
+    프롬프트(결과 요약)에는 고정 안내 문구를 돌려준다. 개발/테스트 환경이나
+    API 키가 없을 때 사용한다.
+    """
+
+    model_name = 'local'
+
+    _QUESTION_PATTERN = re.compile(r'질문:\s*(.*?)\s*분석 결과:', re.DOTALL)
+
+    def generate_content(self, prompt):
+        if isinstance(prompt, dict):
+            prompt = ' '.join(
+                part.get('text', '')
+                for content in prompt.get('contents', [])
+                for part in content.get('parts', [])
+            )
+        match = self._QUESTION_PATTERN.search(prompt)
+        if match:
+            return LocalResponse(json.dumps({
+                "item_name": match.group(1),
+                "efficacy": None,
+                "symptom": None,
+                "form": None,
+                "color": None,
+                "shape": None,
+                "manufacturer": None
+            }, ensure_ascii=False))
+        return LocalResponse(
+            "AI 요약을 사용할 수 없어 검색 결과만 안내해 드립니다. "
+            "이 정보는 단순한 검색 결과이며 실제 의학적 조언이 아닙니다."
+        )
+
+
+def create_gemini_model():
+    """Gemini 모델 생성 (google.generativeai 는 이 시점에 import)"""
+    import google.generativeai as genai
+
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+
+    for model_name in GEMINI_MODELS:
+        try:
+            logger.info(f"{model_name} 모델 로드 시도 중...")
+            model = genai.GenerativeModel(model_name)
+            logger.info(f"{model_name} 모델 로드 성공!")
+            return model
+        except Exception as e:
+            logger.error(f"{model_name} 모델 로드 실패: {str(e)}")
+    raise RuntimeError("모든 Gemini 모델 로드 실패")
+
+
+def create_local_model():
+    return LocalModel()
+
+
+# 백엔드 이름별 모델 생성 함수 (register_model_factory 로 추가 가능)
+_model_factories = {
+    'gemini': create_gemini_model,
+    'local': create_local_model
+}
+
+
+def register_model_factory(name, factory):
+    """모델 백엔드 등록 (factory() 는 generate_content(prompt) 를 제공하는 객체 반환)"""
+    _model_factories[name] = factory
+
+
+def resolve_backend():
+    """사용할 모델 백엔드 이름"""
+    if AI_MODEL_BACKEND != 'auto':
+        return AI_MODEL_BACKEND
+    return 'gemini' if os.getenv("GEMINI_API_KEY") else 'local'
+
+
+# 애플리케이션 전역 모델 (최초 사용 시 생성 후 계속 재사용)
+_model = None
+_model_lock = threading.Lock()
+_last_failure = 0.0
+_status = {
+    'backend': None,
+    'model_name': None,
+    'ready': False,
+    'init_seconds': None,
+    'error': None
+}
+
+
+def get_model():
+    """전역 모델 반환, 없으면 생성
+
+    Returns:
+        모델 객체 또는 생성 실패 시 None (MODEL_RETRY_DELAY 이후 재시도)
+    """
+    global _model, _last_failure
+    if _model is not None:
+        return _model
+
+    if time.time() - _last_failure < MODEL_RETRY_DELAY:
+        return None
+
+    with _model_lock:
+        if _model is not None:
+            return _model
+
+        backend = resolve_backend()
+        started = time.perf_counter()
+        try:
+            factory = _model_factories[backend]
+            model = factory()
+        except Exception as e:
+            _last_failure = time.time()
+            _status.update(backend=backend, ready=False, error=str(e))
+            logger.warning(f"AI 모델({backend}) 초기화 실패. 기본 검색 기능만 사용합니다: {e}")
+            return None
+
+        _status.update(
+            backend=backend,
+            model_name=getattr(model, 'model_name', backend),
+            ready=True,
+            init_seconds=time.perf_counter() - started,
+            error=None
+        )
+        logger.info(f"AI 모델({backend}) 준비 완료: {_status['init_seconds']:.2f}초")
+        _model = model
+        return _model
+
+
+def warm_up_model():
+    """백그라운드 스레드에서 모델 미리 생성 (요청 처리를 막지 않음)"""
+    thread = threading.Thread(target=get_model, name='ai_model_warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def reset_model():
+    """전역 모델 폐기 (다음 사용 시 다시 생성)"""
+    global _model, _last_failure
+    with _model_lock:
+        _model = None
+        _last_failure = 0.0
+        _status.update(ready=False)
+
+
+def model_status():
+    """모델 초기화 상태 (지표용)"""
+    return dict(_status)
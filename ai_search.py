@@ -1,10 +1,15 @@
 import os
-import google.generativeai as genai
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import pymysql
-from pymysql.cursors import DictCursor
 import re
 import logging
+from db_pool import get_pool
+from ai_model import get_model
+from result_cache import LRUCache, register_cache
+from data_version import data_versions
+from retrieval_index import EFFICACY_JOIN, RETRIEVAL_INDEX_QUERY, get_retrieval_index, invalidate_retrieval_index
 
 # 환경 변수 로드
 load_dotenv()
@@ -13,48 +18,35 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Gemini API 초기화
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+# 모델 호출 설정 (응답 대기 시간(초), 동시 호출 스레드 수)
+AI_MODEL_TIMEOUT = float(os.getenv('AI_MODEL_TIMEOUT', 20))
+AI_MAX_WORKERS = int(os.getenv('AI_MAX_WORKERS', 4))
 
-# 가용 모델 리스트
-gemini_models = [
-    'models/gemini-1.5-pro',
-    'models/gemini-1.5-flash',
-    'models/gemini-1.5-flash-8b',
-    'models/gemini-pro-vision'
-]
+# 모델 호출 전용 스레드 풀 (Flask 워커가 모델 응답을 직접 기다리지 않도록 분리)
+_model_executor = ThreadPoolExecutor(max_workers=AI_MAX_WORKERS, thread_name_prefix='ai_model')
 
-# 모델 로드 시도
-model = None
-for model_name in gemini_models:
-    try:
-        logger.info(f"{model_name} 모델 로드 시도 중...")
-        model = genai.GenerativeModel(model_name)
-        logger.info(f"{model_name} 모델 로드 성공!")
-        break  # 성공하면 반복 중단
-    except Exception as e:
-        logger.error(f"{model_name} 모델 로드 실패: {str(e)}")
+# 키워드 추출 결과(정규화된 질의 기준)와 요약 결과(질의 + 결과 id 기준) 캐시
+extraction_cache = register_cache('ai_extraction', LRUCache(max_entries=2048, ttl=24 * 3600, name='ai_extraction'))
+summary_cache = register_cache('ai_summary', LRUCache(max_entries=2048, ttl=6 * 3600, name='ai_summary'))
 
-# 모든 모델 로드 실패 시
-if model is None:
-    logger.warning("경고: 모든 모델 로드 실패. 기본 검색 기능만 사용합니다.")
+# AI 검색 결과 개수
+AI_SEARCH_LIMIT = 10
 
-def get_db_connection():
-    """데이터베이스 연결 생성 함수"""
-    return pymysql.connect(
-        host=os.getenv('DB_HOST', 'localhost'),
-        user=os.getenv('DB_USER', 'root'),
-        password=os.getenv('DB_PASSWORD', '1234'),
-        db=os.getenv('DB_NAME', 'medicine_db'),
-        charset='utf8mb4',
-        cursorclass=DictCursor
-    )
+# AI 검색 결과 컬럼 (효능 설명은 EFFICACY_JOIN 으로 unified_medicines 에서 가져옴)
+AI_RESULT_COLUMNS = """d.id, d.item_name, d.item_eng_name, d.entp_name, d.chart,
+                   d.class_name, d.class_no, d.etc_otc_name, d.drug_shape, d.color_class1,
+                   d.form_code_name, d.item_image, u.efcy_qesitm"""
 
-def ai_search_medicine(query):
-    """AI를 활용한 의약품 검색 함수"""
-    try:
-        # 1. 시스템 프롬프트와 사용자 질의를 하나의 프롬프트로 합침
-        system_prompt = """
+# 데이터 변경 시 BM25 색인 재생성
+data_versions.on_change('drug_identification', invalidate_retrieval_index)
+data_versions.on_change('unified_medicines', invalidate_retrieval_index)
+
+# 같은 키로 진행 중인 모델 호출 (동시에 들어온 같은 질의는 한 번만 호출)
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# 1단계: 키워드 추출 프롬프트
+EXTRACTION_PROMPT = """
         당신은 의약품 정보를 검색하는 봇입니다.
         사용자의 자연어 검색 질문을 분석하여 다음과 같은 정보를 추출하세요:
         
@@ -84,210 +76,283 @@ def ai_search_medicine(query):
         - "두통에 좋은 약 찾아줘" → {"efficacy": "진통제", "symptom": "두통"} 등으로 추출
         - "소화가 잘 안될 때 먹는 약" → {"efficacy": "소화제", "symptom": "소화불량"} 등으로 추출
         """
-        
-        # system role 없이 단일 프롬프트로 전송
-        combined_prompt = f"{system_prompt}\n\n질문: {query}\n\n분석 결과:"
-        
-        try:
-            response = model.generate_content(combined_prompt)
-        except Exception as e:
-            logger.error(f"모델 호출 오류: {str(e)}")
-            # 다른 형식으로 다시 시도
-            response = model.generate_content({
-                "contents": [{"parts": [{"text": combined_prompt}]}]
-            })
-        
-        # 2. 응답 텍스트를 파싱하여 검색 파라미터 추출
-        import json
-        try:
-            text_response = response.text
-            # JSON 형식 데이터 추출
-            if '{' in text_response and '}' in text_response:
-                json_str = text_response[text_response.find('{'):text_response.rfind('}')+1]
-                search_params = json.loads(json_str)
-                logger.info(f"AI 추출 검색 파라미터: {search_params}")
-            else:
-                # 파싱 실패 시 기본 검색 파라미터
-                search_params = {
-                    "item_name": query,
-                    "efficacy": None,
-                    "symptom": None,
-                    "form": None,
-                    "color": None,
-                    "shape": None,
-                    "manufacturer": None
-                }
-        except Exception as json_err:
-            logger.error(f"JSON 파싱 오류: {json_err}")
-            # JSON 파싱 오류 시 기본 검색 파라미터
-            search_params = {
-                "item_name": query,
-                "efficacy": None,
-                "symptom": None,
-                "form": None,
-                "color": None,
-                "shape": None,
-                "manufacturer": None
-            }
-        
-        # 3. 검색 쿼리 구성 (퍼지 검색 로직으로 개선)
-        all_search_terms = []  # 모든 검색어를 수집
-        
-        # 효능/용도와 증상 정보를 활용한 검색 로직 추가
-        efficacy_keywords = search_params.get("efficacy")
-        symptom_keywords = search_params.get("symptom")
-        
-        # 효능 키워드로 확장 검색
-        if efficacy_keywords:
-            # 효능 관련 동의어 추가
-            efficacy_mapping = {
-                "진통": ["진통", "통증완화", "페인", "통증", "두통", "편두통", "해열", "소염"],
-                "소화": ["소화", "소화불량", "위장", "속쓰림", "위산", "위통", "소화제"],
-                "감기": ["감기", "기침", "코감기", "콧물", "인후통", "비염", "감기약"],
-                "알레르기": ["알레르기", "알러지", "항히스타민", "가려움"],
-                "수면": ["수면", "불면", "불면증", "수면제", "수면유도"],
-                "영양제": ["영양", "비타민", "미네랄", "종합영양"]
-            }
-            
-            # 효능 키워드 확장
-            expanded_efficacy_terms = [efficacy_keywords]
-            for category, terms in efficacy_mapping.items():
-                for term in terms:
-                    if term in efficacy_keywords.lower():
-                        expanded_efficacy_terms.extend(terms)
-                        break
-            
-            # 중복 제거
-            expanded_efficacy_terms = list(set(expanded_efficacy_terms))
-            all_search_terms.extend(expanded_efficacy_terms)
-        
-        # 증상 키워드로 검색
-        if symptom_keywords:
-            # 증상 동의어 매핑
-            symptom_mapping = {
-                "두통": ["두통", "편두통", "머리 아픔", "머리통증"],
-                "소화불량": ["소화불량", "속쓰림", "소화 안됨", "더부룩", "속 불편"],
-                "감기": ["감기", "콧물", "기침", "인후통", "코막힘"],
-                "알레르기": ["알레르기", "알러지", "가려움", "두드러기"]
-            }
-            
-            expanded_symptom_terms = [symptom_keywords]
-            for category, terms in symptom_mapping.items():
-                for term in terms:
-                    if term in symptom_keywords.lower():
-                        expanded_symptom_terms.extend(terms)
-                        break
-            
-            expanded_symptom_terms = list(set(expanded_symptom_terms))
-            all_search_terms.extend(expanded_symptom_terms)
-        
-        # 약품명 추가
-        if search_params.get("item_name") and search_params.get("item_name") != query:
-            all_search_terms.append(search_params.get("item_name"))
-            
-        # 제조사 추가
-        if search_params.get("manufacturer"):
-            all_search_terms.append(search_params.get("manufacturer"))
-            
-        # 형태 추가    
-        if search_params.get("form"):
-            all_search_terms.append(search_params.get("form"))
-            
-        # 색상 추가
-        if search_params.get("color"):
-            all_search_terms.append(search_params.get("color"))
-            
-        # 모양 추가
-        if search_params.get("shape"):
-            all_search_terms.append(search_params.get("shape"))
-        
-        # 원본 쿼리 자체도 검색어로 추가
+
+# 효능 관련 동의어
+EFFICACY_MAPPING = {
+    "진통": ["진통", "통증완화", "페인", "통증", "두통", "편두통", "해열", "소염"],
+    "소화": ["소화", "소화불량", "위장", "속쓰림", "위산", "위통", "소화제"],
+    "감기": ["감기", "기침", "코감기", "콧물", "인후통", "비염", "감기약"],
+    "알레르기": ["알레르기", "알러지", "항히스타민", "가려움"],
+    "수면": ["수면", "불면", "불면증", "수면제", "수면유도"],
+    "영양제": ["영양", "비타민", "미네랄", "종합영양"]
+}
+
+# 증상 동의어 매핑
+SYMPTOM_MAPPING = {
+    "두통": ["두통", "편두통", "머리 아픔", "머리통증"],
+    "소화불량": ["소화불량", "속쓰림", "소화 안됨", "더부룩", "속 불편"],
+    "감기": ["감기", "콧물", "기침", "인후통", "코막힘"],
+    "알레르기": ["알레르기", "알러지", "가려움", "두드러기"]
+}
+
+def get_db_connection():
+    """데이터베이스 연결 (공유 커넥션 풀에서 대여, with 문 종료 시 반납)"""
+    return get_pool().connection()
+
+def normalize_query(query):
+    """캐시 키용 질의 정규화 (소문자, 공백 정리)"""
+    return ' '.join(query.lower().split())
+
+def cached_model_call(cache, key, compute, timeout=AI_MODEL_TIMEOUT):
+    """캐시를 거쳐 모델 호출 (스레드 풀에서 실행, timeout 초과 시 TimeoutError)
+
+    같은 키의 호출이 이미 진행 중이면 새로 호출하지 않고 그 결과를 기다린다.
+    제한 시간을 넘겨도 진행 중인 호출은 끝까지 실행되어 결과가 캐시에 저장된다.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    inflight_key = (cache.name, key)
+    with _inflight_lock:
+        future = _inflight.get(inflight_key)
+        if future is None:
+            future = _model_executor.submit(compute)
+            _inflight[inflight_key] = future
+
+            def on_done(done_future):
+                with _inflight_lock:
+                    _inflight.pop(inflight_key, None)
+                if not done_future.cancelled() and done_future.exception() is None:
+                    result = done_future.result()
+                    if result is not None:
+                        cache.set(key, result)
+
+            future.add_done_callback(on_done)
+
+    return future.result(timeout=timeout)
+
+def default_search_params(query):
+    """키워드 추출 실패 시 기본 검색 파라미터"""
+    return {
+        "item_name": query,
+        "efficacy": None,
+        "symptom": None,
+        "form": None,
+        "color": None,
+        "shape": None,
+        "manufacturer": None
+    }
+
+def _extract_with_model(model, query):
+    """모델로 검색 파라미터 추출 (스레드 풀에서 실행)"""
+    # system role 없이 단일 프롬프트로 전송
+    combined_prompt = f"{EXTRACTION_PROMPT}\n\n질문: {query}\n\n분석 결과:"
+    
+    try:
+        response = model.generate_content(combined_prompt)
+    except Exception as e:
+        logger.error(f"모델 호출 오류: {str(e)}")
+        # 다른 형식으로 다시 시도
+        response = model.generate_content({
+            "contents": [{"parts": [{"text": combined_prompt}]}]
+        })
+    
+    # 응답 텍스트를 파싱하여 검색 파라미터 추출
+    text_response = response.text
+    # JSON 형식 데이터 추출
+    if '{' in text_response and '}' in text_response:
+        json_str = text_response[text_response.find('{'):text_response.rfind('}')+1]
+        search_params = json.loads(json_str)
+        logger.info(f"AI 추출 검색 파라미터: {search_params}")
+        return search_params
+    # 파싱 실패 시 기본 검색 파라미터 (캐시하지 않음)
+    return None
+
+def extract_search_params(query):
+    """사용자 질의에서 검색 파라미터 추출 (정규화된 질의 기준 캐시)"""
+    model = get_model()
+    if model is None:
+        return default_search_params(query)
+    try:
+        search_params = cached_model_call(
+            extraction_cache, normalize_query(query), lambda: _extract_with_model(model, query)
+        )
+    except Exception as e:
+        logger.error(f"키워드 추출 실패, 기본 검색 파라미터 사용: {e!r}")
+        search_params = None
+    return search_params or default_search_params(query)
+
+def expand_terms(keyword, mapping):
+    """동의어 매핑으로 키워드 확장"""
+    expanded_terms = [keyword]
+    for category, terms in mapping.items():
+        for term in terms:
+            if term in keyword.lower():
+                expanded_terms.extend(terms)
+                break
+    # 중복 제거
+    return list(set(expanded_terms))
+
+def build_search_terms(query, search_params):
+    """추출된 파라미터와 동의어로 검색어 목록 구성"""
+    all_search_terms = []  # 모든 검색어를 수집
+    
+    # 효능/용도와 증상 정보를 활용한 검색어 확장
+    efficacy_keywords = search_params.get("efficacy")
+    symptom_keywords = search_params.get("symptom")
+    
+    if efficacy_keywords:
+        all_search_terms.extend(expand_terms(efficacy_keywords, EFFICACY_MAPPING))
+    
+    if symptom_keywords:
+        all_search_terms.extend(expand_terms(symptom_keywords, SYMPTOM_MAPPING))
+    
+    # 약품명 추가
+    if search_params.get("item_name"):
+        all_search_terms.append(search_params.get("item_name"))
+    
+    # 제조사, 형태, 색상, 모양 추가
+    for key in ("manufacturer", "form", "color", "shape"):
+        if search_params.get(key):
+            all_search_terms.append(search_params.get(key))
+    
+    # 원본 쿼리는 조사/어미 바이그램이 무관한 약품과 일치하므로 추출된 검색어가 없을 때만 사용
+    if not all_search_terms:
         all_search_terms.append(query)
-        
-        # 검색어가 없는 경우
-        if not all_search_terms:
-            all_search_terms = [query]  # 원본 쿼리를 그대로 사용
+    
+    # 중복 제거
+    return list(set(all_search_terms))
+
+def load_retrieval_rows():
+    """BM25 색인 생성용 행 조회"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(RETRIEVAL_INDEX_QUERY)
+            return cursor.fetchall()
+
+def fetch_results_by_ids(ranked):
+    """(id, 점수) 순위 목록의 결과 행을 순위 순서대로 조회"""
+    if not ranked:
+        return []
+    ids = [row_id for row_id, _ in ranked]
+    placeholders = ', '.join(['%s'] * len(ids))
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {AI_RESULT_COLUMNS} FROM drug_identification d {EFFICACY_JOIN} WHERE d.id IN ({placeholders})",
+                ids
+            )
+            rows_by_id = {row['id']: row for row in cursor.fetchall()}
+    
+    results = []
+    for row_id, score in ranked:
+        row = rows_by_id.get(row_id)
+        if row is not None:
+            row['score'] = round(score, 4)
+            results.append(row)
+    return results
+
+def search_medicines_with_like(all_search_terms):
+    """BM25 색인을 사용할 수 없을 때의 LIKE 검색 (순위 없음)"""
+    # 단일 OR 쿼리로 구성 (더 많은 결과를 얻기 위해)
+    or_conditions = []
+    params = []
+    
+    for term in all_search_terms:
+        or_conditions.append("(d.item_name LIKE %s OR d.class_name LIKE %s OR d.chart LIKE %s)")
+        params.extend([f"%{term}%", f"%{term}%", f"%{term}%"])
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cursor:
+            where_clause = " OR ".join(or_conditions)  # OR로 조건 연결 (더 많은 결과)
+            sql = f"""
+            SELECT {AI_RESULT_COLUMNS}
+            FROM drug_identification d
+            {EFFICACY_JOIN}
+            WHERE {where_clause}
+            LIMIT {AI_SEARCH_LIMIT}
+            """
             
-        # 중복 제거
-        all_search_terms = list(set(all_search_terms))
-        
-        # 단일 OR 쿼리로 구성 (더 많은 결과를 얻기 위해)
-        or_conditions = []
-        params = []
-        
-        for term in all_search_terms:
-            or_conditions.append("(item_name LIKE %s OR class_name LIKE %s OR chart LIKE %s)")
-            params.extend([f"%{term}%", f"%{term}%", f"%{term}%"])
-        
-        # 쿼리 로깅
-        logger.info(f"검색 키워드: {all_search_terms}")
-        logger.info(f"검색 조건: {or_conditions}")
-        logger.info(f"검색 파라미터: {params}")
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+def search_medicines(query, search_params):
+    """검색 파라미터로 의약품 검색 (확장 검색어 전체를 BM25 점수로 순위화)"""
+    all_search_terms = build_search_terms(query, search_params)
+    logger.info(f"검색 키워드: {all_search_terms}")
+    
+    data_versions.refresh()
+    index = get_retrieval_index(load_retrieval_rows)
+    if index is None:
+        logger.warning("BM25 검색 인덱스를 사용할 수 없어 LIKE 검색으로 대체합니다.")
+        return search_medicines_with_like(all_search_terms)
+    
+    ranked = index.top_k(all_search_terms, k=AI_SEARCH_LIMIT)
+    return fetch_results_by_ids(ranked)
+
+def _summarize_with_model(model, query, results):
+    """모델로 검색 결과 요약 생성 (스레드 풀에서 실행)"""
+    # 결과의 첫 3개 항목만 요약에 포함
+    result_items = []
+    for r in results[:3]:
+        item = {
+            "name": r["item_name"],
+            "manufacturer": r["entp_name"],
+            "class": r["class_name"] if r["class_name"] else "정보 없음",
+            "shape": r["drug_shape"] if r["drug_shape"] else "정보 없음",
+            "color": r["color_class1"] if r["color_class1"] else "정보 없음", 
+            "description": r["chart"] if r["chart"] else "정보 없음"
+        }
+        result_items.append(item)
+    
+    # AI 요약 생성 (프롬프트 개선)
+    summary_prompt = f"""
+    다음은 사용자 질문 "{query}"에 대한 검색 결과입니다:
+    {result_items}
+    
+    이 검색 결과를 사용자에게 친절하게 요약해주세요.
+    원래 사용자 질문과 결과의 연관성을 먼저 설명하고,
+    검색된 약품들의 주요 정보와 효능에 대해 쉽게 설명해주세요.
+    약사처럼 전문적이고 신뢰성 있게 정보를 제공하되, 
+    이것은 단순히 검색 결과일 뿐 실제 의학적 조언이 아님을 알려주세요.
+    """
+    
+    return model.generate_content(summary_prompt).text
+
+def summarize_results(query, results):
+    """검색 결과 요약 ((질의, 결과 id) 기준 캐시)"""
+    if not results:
+        # 검색어와 함께 대안 제시
+        alternatives = ["진통제", "소화제", "감기약", "알레르기약", "비타민"]
+        return f"죄송합니다. '{query}'에 대한 검색 결과가 없습니다. 다른 검색어나 표현으로 시도해보세요. 예를 들어, '{alternatives[0]}'나 '{alternatives[1]}' 등의 키워드로 검색해보세요."
+    
+    fallback = f"검색 결과 {len(results)}개가 발견되었습니다."
+    model = get_model()
+    if model is None:
+        return fallback
+    
+    summary_key = (normalize_query(query), tuple(r["id"] for r in results))
+    try:
+        return cached_model_call(summary_cache, summary_key, lambda: _summarize_with_model(model, query, results))
+    except Exception as e:
+        logger.error(f"결과 요약 실패: {e!r}")
+        return fallback
+
+def ai_search_medicine(query):
+    """AI를 활용한 의약품 검색 함수"""
+    try:
+        search_params = extract_search_params(query)
+        results = search_medicines(query, search_params)
+        ai_summary = summarize_results(query, results)
         
-        # 4. DB 쿼리 실행
-        conn = get_db_connection()
-        try:
-            with conn.cursor() as cursor:
-                where_clause = " OR ".join(or_conditions)  # OR로 조건 연결 (더 많은 결과)
-                sql = f"""
-                SELECT id, item_name, item_eng_name, entp_name, chart, 
-                       class_name, class_no, etc_otc_name, drug_shape, color_class1,
-                       form_code_name, item_image 
-                FROM drug_identification 
-                WHERE {where_clause}
-                LIMIT 10
-                """
-                
-                logger.info(f"실행 SQL: {sql}")
-                cursor.execute(sql, params)
-                results = cursor.fetchall()
-                
-                # 5. AI에게 결과 요약 요청
-                if results:
-                    result_summary = f"검색 결과 {len(results)}개가 발견되었습니다."
-                    
-                    # 결과의 첫 3개 항목만 요약에 포함
-                    result_items = []
-                    for idx, r in enumerate(results[:3]):
-                        item = {
-                            "name": r["item_name"],
-                            "manufacturer": r["entp_name"],
-                            "class": r["class_name"] if r["class_name"] else "정보 없음",
-                            "shape": r["drug_shape"] if r["drug_shape"] else "정보 없음",
-                            "color": r["color_class1"] if r["color_class1"] else "정보 없음", 
-                            "description": r["chart"] if r["chart"] else "정보 없음"
-                        }
-                        result_items.append(item)
-                    
-                    # AI 요약 생성 (프롬프트 개선)
-                    summary_prompt = f"""
-                    다음은 사용자 질문 "{query}"에 대한 검색 결과입니다:
-                    {result_items}
-                    
-                    이 검색 결과를 사용자에게 친절하게 요약해주세요.
-                    원래 사용자 질문과 결과의 연관성을 먼저 설명하고,
-                    검색된 약품들의 주요 정보와 효능에 대해 쉽게 설명해주세요.
-                    약사처럼 전문적이고 신뢰성 있게 정보를 제공하되, 
-                    이것은 단순히 검색 결과일 뿐 실제 의학적 조언이 아님을 알려주세요.
-                    """
-                    
-                    summary_response = model.generate_content(summary_prompt)
-                    ai_summary = summary_response.text
-                else:
-                    # 검색어와 함께 대안 제시
-                    alternatives = ["진통제", "소화제", "감기약", "알레르기약", "비타민"]
-                    ai_summary = f"죄송합니다. '{query}'에 대한 검색 결과가 없습니다. 다른 검색어나 표현으로 시도해보세요. 예를 들어, '{alternatives[0]}'나 '{alternatives[1]}' 등의 키워드로 검색해보세요."
-                
-                return {
-                    "success": True,
-                    "results": results,
-                    "ai_summary": ai_summary,
-                    "search_params": search_params,
-                    "query": query
-                }
-                
-        finally:
-            conn.close()
+        return {
+            "success": True,
+            "results": results,
+            "ai_summary": ai_summary,
+            "search_params": search_params,
+            "query": query
+        }
             
     except Exception as e:
         logger.error(f"AI 검색 오류: {str(e)}")
@@ -295,4 +360,36 @@ def ai_search_medicine(query):
             "success": False,
             "error": str(e),
             "message": "AI 검색 중 오류가 발생했습니다."
-        }
\ No newline at end of file
+        }
+
+def ai_search_medicine_stream(query):
+    """AI 검색을 단계별 이벤트로 반환하는 제너레이터
+
+    DB 검색 결과('results')를 먼저 보내고, 요약('summary')은 준비되는 대로 보낸다.
+    """
+    try:
+        search_params = extract_search_params(query)
+        results = search_medicines(query, search_params)
+    except Exception as e:
+        logger.error(f"AI 검색 오류: {str(e)}")
+        yield {
+            "type": "error",
+            "success": False,
+            "error": str(e),
+            "message": "AI 검색 중 오류가 발생했습니다."
+        }
+        return
+    
+    yield {
+        "type": "results",
+        "success": True,
+        "results": results,
+        "search_params": search_params,
+        "query": query
+    }
+    
+    yield {
+        "type": "summary",
+        "success": True,
+        "ai_summary": summarize_results(query, results)
+    }
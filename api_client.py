@@ -0,0 +1,221 @@
+import os
+import random
+import threading
+import time
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger('app')
+
+# 엔드포인트별 (연결, 응답) 타임아웃 (초), 없는 엔드포인트는 'default' 사용
+API_TIMEOUTS = {
+    'default': (3.05, 10),
+    'pill_info': (3.05, 15),
+    'drug_info': (3.05, 15),
+    'dur_info': (3.05, 20)
+}
+
+# 재시도 대상 상태 코드 (그 외 4xx 는 재시도해도 결과가 같음)
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class TokenBucket:
+    """전역 요청 속도 제한 (초당 rate 개 토큰, 최대 capacity 개 누적)"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, timeout=None):
+        """토큰 1개 획득 (없으면 대기), timeout 초과 시 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+            with self._lock:
+                self.waited_seconds += wait
+
+
+class EndpointStats:
+    """엔드포인트별 요청 지연 시간 히스토그램과 오류 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.requests = 0
+        self.latency_sum = 0.0
+        self.retries = 0
+        self.errors = {}
+
+    def observe(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.latency_sum += seconds
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    self.buckets[i] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+
+    def record_error(self, kind):
+        with self._lock:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self):
+        with self._lock:
+            # 누적 개수 (le_x: x 초 이하인 요청 수)
+            labels = [f"le_{bound}" for bound in LATENCY_BUCKETS] + ['le_inf']
+            cumulative = []
+            total = 0
+            for count in self.buckets:
+                total += count
+                cumulative.append(total)
+            return {
+                'requests': self.requests,
+                'avg_latency': self.latency_sum / self.requests if self.requests else 0.0,
+                'latency_histogram': dict(zip(labels, cumulative)),
+                'retries': self.retries,
+                'errors': dict(self.errors)
+            }
+
+
+class ApiClient:
+    """공공데이터 API 공용 클라이언트
+
+    - keep-alive 연결 풀을 가진 단일 requests.Session 재사용
+    - 엔드포인트별 타임아웃
+    - 429/5xx 및 네트워크 오류만 지터를 더한 지수 백오프로 재시도 (Retry-After 존중)
+    - 전역 토큰 버킷으로 초당 요청 수 제한
+    """
+
+    def __init__(self, timeouts=None, max_retries=3, backoff_base=0.5, backoff_cap=8.0,
+                 rate=10.0, burst=20, pool_size=10):
+        self.timeouts = dict(API_TIMEOUTS if timeouts is None else timeouts)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.limiter = TokenBucket(rate, burst)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _endpoint_stats(self, endpoint_key):
+        with self._stats_lock:
+            stats = self._stats.get(endpoint_key)
+            if stats is None:
+                stats = self._stats[endpoint_key] = EndpointStats()
+            return stats
+
+    def _backoff(self, attempt, retry_after=None):
+        """재시도 대기 시간 (full jitter)"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_cap)
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    def get(self, endpoint_key, url, params=None, headers=None):
+        """GET 요청 (성공 시 Response, 실패 시 None)
+
+        재시도 대상이 아닌 상태 코드는 그대로 반환하며, 호출자가 status_code 를 확인한다.
+        """
+        stats = self._endpoint_stats(endpoint_key)
+        timeout = self.timeouts.get(endpoint_key, self.timeouts.get('default'))
+
+        for attempt in range(self.max_retries + 1):
+            if not self.limiter.acquire(timeout=30):
+                stats.record_error('rate_limited')
+                logger.error(f"API 요청 속도 제한 대기 시간 초과: {endpoint_key}")
+                return None
+
+            retry_after = None
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                stats.observe(time.perf_counter() - started)
+                stats.record_error(type(e).__name__)
+                logger.warning(f"API 요청 오류 ({endpoint_key}): {e} - 시도 {attempt+1}/{self.max_retries + 1}")
+            except requests.exceptions.RequestException as e:
+                stats.observe(time.perf_counter() - started)
+                stats.record_error(type(e).__name__)
+                logger.error(f"API 요청 예외 발생 ({endpoint_key}): {e}, URL: {url}")
+                return None
+            else:
+                stats.observe(time.perf_counter() - started)
+                if response.status_code not in RETRYABLE_STATUS:
+                    if response.status_code >= 400:
+                        stats.record_error(str(response.status_code))
+                    return response
+                stats.record_error(str(response.status_code))
+                logger.warning(
+                    f"API 요청 실패 ({endpoint_key}): {response.status_code} - "
+                    f"시도 {attempt+1}/{self.max_retries + 1}"
+                )
+                if response.status_code == 429:
+                    try:
+                        retry_after = float(response.headers.get('Retry-After', ''))
+                    except ValueError:
+                        retry_after = None
+
+            if attempt < self.max_retries:
+                stats.record_retry()
+                time.sleep(self._backoff(attempt, retry_after))
+
+        logger.error(f"API 요청 실패: 최대 재시도 횟수 초과. URL: {url}")
+        return None
+
+    def stats(self):
+        with self._stats_lock:
+            endpoints = {key: stats.snapshot() for key, stats in self._stats.items()}
+        return {
+            'endpoints': endpoints,
+            'rate_limit': {
+                'rate': self.limiter.rate,
+                'burst': self.limiter.capacity,
+                'waited_seconds': self.limiter.waited_seconds
+            }
+        }
+
+
+_api_client = None
+_client_lock = threading.Lock()
+
+
+def get_api_client():
+    """전역 API 클라이언트 (API_RATE_LIMIT, API_RATE_BURST, API_MAX_RETRIES 환경 변수로 설정)"""
+    global _api_client
+    if _api_client is None:
+        with _client_lock:
+            if _api_client is None:
+                _api_client = ApiClient(
+                    max_retries=int(os.getenv('API_MAX_RETRIES', 3)),
+                    rate=float(os.getenv('API_RATE_LIMIT', 10)),
+                    burst=int(os.getenv('API_RATE_BURST', 20))
+                )
+    return _api_client
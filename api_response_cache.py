@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+
+from result_cache import register_cache
+
+logger = logging.getLogger('app')
+
+# 엔드포인트별 캐시 유효 기간 (초), 없는 엔드포인트는 'default' 사용
+API_CACHE_TTLS = {
+    'default': 24 * 3600,
+    'medicine_info': 7 * 24 * 3600,   # 품목 상세는 거의 바뀌지 않음
+    'component_info': 7 * 24 * 3600,
+    'daily_dose': 7 * 24 * 3600,
+    'drug_info': 3 * 24 * 3600,
+    'pill_info': 24 * 3600,
+    'dur_info': 24 * 3600
+}
+
+# 마지막 접근 시각 갱신 최소 간격 (조회마다 쓰기가 일어나지 않도록)
+TOUCH_INTERVAL = 60
+
+# 키에서 제외하는 파라미터 (인증키 등 응답과 무관한 값)
+IGNORED_PARAMS = frozenset({'serviceKey'})
+
+
+def make_api_cache_key(endpoint_key, params):
+    """(엔드포인트, serviceKey 를 제외한 정렬된 파라미터) 캐시 키"""
+    items = sorted(
+        (str(key), str(value)) for key, value in (params or {}).items()
+        if key not in IGNORED_PARAMS
+    )
+    raw = json.dumps([endpoint_key, items], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class CachedResponse:
+    """캐시 항목 (value: 파싱된 응답, fresh: 유효 기간 내 여부)"""
+
+    __slots__ = ('value', 'fresh', 'etag', 'last_modified')
+
+    def __init__(self, value, fresh, etag, last_modified):
+        self.value = value
+        self.fresh = fresh
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def validators(self):
+        """조건부 재요청 헤더 (검증값이 없으면 None)"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers or None
+
+
+class ApiResponseCache:
+    """공공데이터 API 파싱 결과의 디스크 캐시 (sqlite, zlib 압축 JSON)
+
+    - 엔드포인트별 TTL, 만료된 항목도 조건부 재요청(ETag/Last-Modified)과
+      네트워크 실패 시 대체 응답을 위해 보관
+    - 전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+    """
+
+    def __init__(self, path, max_bytes=64 * 1024 * 1024, ttls=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(API_CACHE_TTLS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    def _connection(self):
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_response (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_api_response_access ON api_response (last_access)")
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM api_response").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def ttl_for(self, endpoint_key):
+        if endpoint_key.startswith('dur_'):
+            endpoint_key = 'dur_info'
+        return self.ttls.get(endpoint_key, self.ttls['default'])
+
+    def get(self, key):
+        """캐시 항목 조회 (없으면 None, 만료된 항목은 fresh=False 로 반환)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, expires_at, last_access, etag, last_modified FROM api_response WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, expires_at, last_access, etag, last_modified = row
+            if now - last_access > TOUCH_INTERVAL:
+                conn.execute("UPDATE api_response SET last_access = ? WHERE key = ?", (now, key))
+                conn.commit()
+            fresh = expires_at > now
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+
+        value = json.loads(zlib.decompress(payload).decode('utf-8'))
+        return CachedResponse(value, fresh, etag, last_modified)
+
+    def set(self, key, endpoint_key, value, etag=None, last_modified=None):
+        """파싱된 응답 저장"""
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            previous = conn.execute("SELECT size FROM api_response WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO api_response "
+                "(key, endpoint, payload, size, stored_at, expires_at, last_access, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint_key, payload, len(payload), now, now + self.ttl_for(endpoint_key),
+                 now, etag, last_modified)
+            )
+            self._total_bytes += len(payload) - (previous[0] if previous else 0)
+            self._evict(conn)
+            conn.commit()
+
+    def refresh(self, key, endpoint_key):
+        """조건부 재요청 결과 변경 없음(304) - 유효 기간만 연장"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "UPDATE api_response SET expires_at = ?, last_access = ? WHERE key = ?",
+                (now + self.ttl_for(endpoint_key), now, key)
+            )
+            conn.commit()
+            self.revalidated += 1
+
+    def _evict(self, conn):
+        """크기 제한을 넘으면 최근 사용 시각이 오래된 항목부터 삭제"""
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM api_response ORDER BY last_access LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                conn.execute("DELETE FROM api_response WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM api_response")
+            conn.commit()
+            self._total_bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'path': self.path,
+            'bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'revalidated': self.revalidated,
+            'evictions': self.evictions
+        }
+
+
+# 캐시 파일 경로와 최대 크기 (API_CACHE_PATH, API_CACHE_MAX_BYTES 환경 변수)
+api_response_cache = register_cache('api_response', ApiResponseCache(
+    os.getenv('API_CACHE_PATH', 'api_cache.sqlite3'),
+    max_bytes=int(os.getenv('API_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+))
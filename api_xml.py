@@ -0,0 +1,78 @@
+import io
+import xml.etree.ElementTree as ET
+
+# 응답 헤더/페이지 정보 태그 (item 밖에 있는 값)
+HEADER_FIELDS = ('resultCode', 'resultMsg', 'numOfRows', 'pageNo', 'totalCount')
+
+
+class ApiResponseStream:
+    """공공데이터 API XML 응답의 스트리밍 파서
+
+    iterparse 로 <item> 이 끝날 때마다 dict 로 변환해 내보내고 바로 요소를 비우므로
+    전체 DOM 을 메모리에 두지 않는다. 헤더 값(resultCode, totalCount 등)은
+    파싱이 진행되면서 self.header 에 채워진다 (totalCount 는 보통 item 뒤에 온다).
+
+    Args:
+        source: 응답 본문 (bytes/str) 또는 읽기 가능한 파일 객체
+    """
+
+    def __init__(self, source):
+        if isinstance(source, str):
+            source = source.encode('utf-8')
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        self.source = source
+        self.header = {}
+
+    def __iter__(self):
+        items_parent = None
+        depth_in_item = 0
+        for event, elem in ET.iterparse(self.source, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == 'items':
+                    items_parent = elem
+                elif tag == 'item':
+                    depth_in_item += 1
+                continue
+
+            if tag == 'item':
+                depth_in_item -= 1
+                yield {child.tag: child.text for child in elem}
+                elem.clear()
+                # 처리한 item 을 부모에서 제거하여 메모리 해제
+                if items_parent is not None:
+                    items_parent.clear()
+            elif depth_in_item == 0 and tag in HEADER_FIELDS:
+                self.header[tag] = elem.text
+                elem.clear()
+
+    @property
+    def result_code(self):
+        return self.header.get('resultCode')
+
+    @property
+    def result_msg(self):
+        return self.header.get('resultMsg')
+
+    @property
+    def total_count(self):
+        value = self.header.get('totalCount')
+        return int(value) if value and value.strip().isdigit() else None
+
+
+def parse_api_items(source):
+    """응답 전체 파싱 → {'items', 'total_count', 'result_code', 'result_msg'}
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XML 형식 오류
+    """
+    stream = ApiResponseStream(source)
+    items = list(stream)
+    total_count = stream.total_count
+    return {
+        'items': items,
+        'total_count': total_count if total_count is not None else len(items),
+        'result_code': stream.result_code,
+        'result_msg': stream.result_msg
+    }
@@ -1,17 +1,32 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
-from flask_mysqldb import MySQL
-import MySQLdb.cursors
-import re
+import time
+# 콜드 스타트 시간 측정 (모듈 import 시작 시점)
+_import_started = time.perf_counter()
+
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, Response, stream_with_context, make_response
 import os
 import json
 import logging
 import requests
 import xml.etree.ElementTree as ET
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.http import is_resource_modified
 from dotenv import load_dotenv
-import time
 from advanced_search_controller import advanced_search_bp  # 고급 검색 블루프린트 import
-from ai_search import ai_search_medicine
+from ai_search import ai_search_medicine, ai_search_medicine_stream
+from ai_model import AI_MODEL_WARMUP, model_status, warm_up_model
+from search_index import get_search_index, invalidate_search_index
+from pagination import decode_cursor, encode_cursor, fetch_page, keyset_slice
+import db_pool
+from db_pool import get_db
+from result_cache import all_cache_stats
+from highlighter import Highlighter, highlight_fields
+from medicine_detail import detail_validators, get_cached_medicine_detail
+from api_client import get_api_client
+from api_xml import parse_api_items
+from api_response_cache import api_response_cache, make_api_cache_key
+from dur_store import DUR_API_BASE_URL, DUR_ENDPOINTS, find_dur_rows, group_by_dur_type
+from interaction_graph import INTERACTION_ROWS_QUERY, get_interaction_graph, invalidate_interaction_graph
+from data_version import data_versions
 
 # 로그 디렉토리 확인 및 생성
 log_dir = os.path.dirname(os.path.abspath('app.log'))
@@ -26,21 +41,27 @@ app = Flask(__name__)
 # 세션 비밀키 설정
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'your_secret_key')
 
-# MySQL 연결 설정
-app.config['MYSQL_HOST'] = os.getenv('DB_HOST', 'localhost')
-app.config['MYSQL_USER'] = os.getenv('DB_USER', 'root')
-app.config['MYSQL_PASSWORD'] = os.getenv('DB_PASSWORD', 'your_password')
-app.config['MYSQL_DB'] = os.getenv('DB_NAME', 'medicine_db')
-app.config['MYSQL_CURSORCLASS'] = 'DictCursor'
+# MySQL 연결 설정 (모든 요청이 공유하는 커넥션 풀에서 사용)
+app.config['DB_HOST'] = os.getenv('DB_HOST', 'localhost')
+app.config['DB_USER'] = os.getenv('DB_USER', 'root')
+app.config['DB_PASSWORD'] = os.getenv('DB_PASSWORD', '1234')
+app.config['DB_NAME'] = os.getenv('DB_NAME', 'medicine_db')
+app.config['DB_POOL_SIZE'] = int(os.getenv('DB_POOL_SIZE', 10))
+app.config['DB_POOL_RECYCLE'] = int(os.getenv('DB_POOL_RECYCLE', 3600))
+app.config['DB_POOL_TIMEOUT'] = float(os.getenv('DB_POOL_TIMEOUT', 10))
 
 # 데이터베이스 테이블 설정
 app.config['DATABASE_TABLE'] = os.getenv('DB_TABLE', 'drug_identification')
 
+# n-gram 검색 인덱스 설정 (사용 여부, 재생성 주기(초))
+app.config['SEARCH_INDEX_ENABLED'] = os.getenv('SEARCH_INDEX_ENABLED', 'true').lower() == 'true'
+app.config['SEARCH_INDEX_MAX_AGE'] = int(os.getenv('SEARCH_INDEX_MAX_AGE', 3600))
+
 # 블루프린트 등록
 app.register_blueprint(advanced_search_bp, url_prefix='/advanced')
 
-# MySQL 인스턴스 초기화
-mysql = MySQL(app)
+# 커넥션 풀 초기화
+db_pool.init_app(app)
 
 # 로깅 설정
 logging.basicConfig(
@@ -68,53 +89,55 @@ API_BASE_URLS = {
     'pill_info': 'http://apis.data.go.kr/1471000/MdcinGrnIdntfcAPIService/getMdcinGrnIdntfcList',
     'medicine_info': 'http://apis.data.go.kr/1471000/DrugInfoService/getDrugInfo',
     'component_info': 'http://apis.data.go.kr/1471000/DrugIngrNameService/getIngredientInfoList',
-    'daily_dose': 'http://apis.data.go.kr/1471000/MedicDayMaxDoseInfoService/getMedicDayMaxDoseInfo'
-}
-
-# DUR 관련 API 엔드포인트
-DUR_ENDPOINTS = {
-    'usjnt': 'getUsjntTabooInfoList03',     # 병용금기
-    'age': 'getSpcifyAgrdeTabooInfoList03', # 특정연령대금기
-    'pregnancy': 'getPwnmTabooInfoList03',  # 임부금기
-    'capacity': 'getCpctyAtentInfoList03',  # 용량주의
-    'period': 'getMdctnPdAtentInfoList03',  # 투여기간주의
-    'elderly': 'getOdsnAtentInfoList03',    # 노인주의
-    'duplicate': 'getEfcyDplctInfoList03',  # 효능군중복
-    'split': 'getSeobangjeongPartitnAtentInfoList03' # 서방정분할주의
+    'daily_dose': 'http://apis.data.go.kr/1471000/MedicDayMaxDoseInfoService/getMedicDayMaxDoseInfo',
+    'dur_info': DUR_API_BASE_URL
 }
 
 #---------------------------------------------------
 # API 호출 함수
 #---------------------------------------------------
-def fetch_api_data(url, params, retries=3, delay=1):
-    """API 요청 함수"""
-    try:
-        for attempt in range(retries):
-            response = requests.get(url, params=params)
-            
-            if response.status_code == 200:
-                return response.text
-            
-            logger.warning(f"API 요청 실패: {response.status_code}. 재시도 {attempt+1}/{retries}")
-            time.sleep(delay)
-        
-        logger.error(f"API 요청 실패: 최대 재시도 횟수 초과. URL: {url}")
+def fetch_api_data(url, params, endpoint_key='default', headers=None):
+    """API 요청 함수 (공용 클라이언트: 연결 재사용, 타임아웃, 재시도, 속도 제한)
+
+    Returns:
+        200/304 응답 또는 실패 시 None
+    """
+    response = get_api_client().get(endpoint_key, url, params=params, headers=headers)
+    if response is None:
         return None
-    except Exception as e:
-        logger.error(f"API 요청 예외 발생: {e}, URL: {url}")
+    
+    if response.status_code not in (200, 304):
+        logger.error(f"API 요청 실패: {response.status_code}. URL: {url}")
         return None
+    
+    return response
 
-def parse_xml_response(xml_text):
-    """XML 파싱 함수"""
+def parse_api_response(content):
+    """XML 응답 스트리밍 파싱 → {'items': [항목 dict], 'total_count': 전체 결과 수}
+
+    결과 코드가 정상(00)이 아니거나 파싱에 실패하면 None
+    """
     try:
-        root = ET.fromstring(xml_text)
-        return root
-    except Exception as e:
+        result = parse_api_items(content)
+    except ET.ParseError as e:
         logger.error(f"XML 파싱 오류: {e}")
         return None
+    
+    if result['result_code'] is not None and result['result_code'] != '00':
+        logger.error(f"API 오류: {result['result_code']} - {result['result_msg'] or ''}")
+        return None
+    
+    return {
+        'items': result['items'],
+        'total_count': result['total_count']
+    }
 
 def call_api(endpoint_key, params=None):
-    """API 호출 통합 함수"""
+    """API 호출 통합 함수 (파싱된 결과를 디스크 캐시에 저장)
+
+    Returns:
+        {'items': [...], 'total_count': int} 또는 실패 시 None
+    """
     if params is None:
         params = {}
     
@@ -139,14 +162,34 @@ def call_api(endpoint_key, params=None):
         logger.error(f"알 수 없는 엔드포인트: {endpoint_key}")
         return None
     
-    # API 호출
-    xml_data = fetch_api_data(url, params)
-    if not xml_data:
-        return None
+    # 캐시 확인 (유효 기간 내면 API 호출 없이 반환)
+    cache_key = make_api_cache_key(endpoint_key, params)
+    cached = api_response_cache.get(cache_key)
+    if cached is not None and cached.fresh:
+        return cached.value
+    
+    # API 호출 (만료된 캐시가 있으면 조건부 요청, DUR 유형은 하나의 엔드포인트 지표로 집계)
+    metrics_key = 'dur_info' if endpoint_key.startswith('dur_') else endpoint_key
+    response = fetch_api_data(url, params, metrics_key, headers=cached.validators() if cached else None)
+    if response is None:
+        # API 장애 시 만료된 캐시라도 반환
+        return cached.value if cached is not None else None
+    
+    if response.status_code == 304 and cached is not None:
+        api_response_cache.refresh(cache_key, endpoint_key)
+        return cached.value
     
     # XML 파싱
-    root = parse_xml_response(xml_data)
-    return root
+    result = parse_api_response(response.content)
+    if result is None:
+        return cached.value if cached is not None else None
+    
+    api_response_cache.set(
+        cache_key, endpoint_key, result,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified')
+    )
+    return result
 
 #---------------------------------------------------
 # 의약품 API 호출 함수
@@ -161,24 +204,13 @@ def search_medicines_by_shape(params=None, page_no=1, num_of_rows=10):
     params['numOfRows'] = num_of_rows
     
     # API 호출
-    root = call_api('pill_info', params)
-    if root is None:
+    result = call_api('pill_info', params)
+    if result is None:
         return None
     
-    # 결과 추출
-    items = []
-    for item in root.findall('.//item'):
-        medicine_data = {}
-        for child in item:
-            medicine_data[child.tag] = child.text
-        items.append(medicine_data)
-    
-    # 전체 결과 수 추출
-    total_count = int(root.find('.//totalCount').text) if root.find('.//totalCount') is not None else 0
-    
     return {
-        'items': items,
-        'total_count': total_count,
+        'items': result['items'],
+        'total_count': result['total_count'],
         'page_no': page_no,
         'num_of_rows': num_of_rows
     }
@@ -188,40 +220,36 @@ def get_medicine_detail(item_seq):
     params = {'itemSeq': item_seq}
     
     # API 호출
-    root = call_api('medicine_info', params)
-    if root is None:
+    result = call_api('medicine_info', params)
+    if result is None or not result['items']:
         return None
     
-    # 결과 추출
-    item = root.find('.//item')
-    if item is None:
-        return None
-    
-    medicine_data = {}
-    for child in item:
-        medicine_data[child.tag] = child.text
-    
-    return medicine_data
+    return result['items'][0]
 
 def get_dur_info(item_seq, dur_type='usjnt'):
-    """DUR 정보 조회"""
-    params = {'itemSeq': item_seq}
-    
-    # API 호출
-    endpoint_key = f"dur_{dur_type}"
-    root = call_api(endpoint_key, params)
-    if root is None:
+    """DUR 정보 조회 (data/data_load/sync_dur_data.py 가 동기화한 로컬 테이블 사용)"""
+    try:
+        return find_dur_rows(get_db(), item_seqs=[item_seq], dur_types=[dur_type])
+    except Exception as e:
+        logger.error(f"DUR 정보 조회 오류: {e}")
         return None
-    
-    # 결과 추출
-    items = []
-    for item in root.findall('.//item'):
-        dur_data = {}
-        for child in item:
-            dur_data[child.tag] = child.text
-        items.append(dur_data)
-    
-    return items
+
+def get_all_dur_info(item_seq):
+    """8개 DUR 유형 정보를 단일 쿼리로 조회하여 유형별로 반환"""
+    try:
+        return group_by_dur_type(find_dur_rows(get_db(), item_seqs=[item_seq]))
+    except Exception as e:
+        logger.error(f"DUR 정보 조회 오류: {e}")
+        return None
+
+def load_interaction_rows():
+    """병용금기 그래프 생성용 DUR 데이터 조회"""
+    with get_db().cursor() as cursor:
+        cursor.execute(INTERACTION_ROWS_QUERY)
+        return cursor.fetchall()
+
+# DUR 동기화 후 병용금기 그래프 재생성
+data_versions.on_change('dur_info', invalidate_interaction_graph)
 
 def get_medicine_components(item_seq):
     """의약품 성분 정보 조회"""
@@ -237,119 +265,155 @@ def highlight_text(text, search_term):
     if not text or not search_term:
         return text
     
-    # 대소문자 구분 없이 검색어 찾기
-    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-    return pattern.sub(lambda m: f'<span class="highlight">{m.group(0)}</span>', text)
+    # 대소문자 구분 없이 검색어 찾기 (컴파일된 패턴 재사용)
+    return Highlighter([search_term]).annotate(text)[0]
 
-def search_medicines_in_db(search_params, page=1, per_page=12):
-    conn = mysql.connection
-    try:
-        with conn.cursor(MySQLdb.cursors.DictCursor) as cursor:
-            base_query = """
-            SELECT 
+SEARCH_RESULT_COLUMNS = """
                 id, item_seq, item_name, item_eng_name, 
                 entp_seq, entp_name, chart, 
                 class_no, class_name, etc_otc_name, 
                 item_permit_date, form_code_name, 
                 efcy_qesitm, se_qesitm
-            FROM unified_medicines
-            WHERE 1=1
-            """
-            
-            query_params = []
-            
-            # 제품명 검색 조건
+"""
+
+def load_search_index_rows():
+    """n-gram 인덱스 생성용 데이터 조회"""
+    with get_db().cursor() as cursor:
+        cursor.execute("SELECT id, item_name, entp_name, se_qesitm FROM unified_medicines")
+        return cursor.fetchall()
+
+# 데이터 변경 시 n-gram 인덱스 재생성 (max_age 까지 기다리지 않음)
+data_versions.on_change('unified_medicines', invalidate_search_index)
+
+def search_with_index(cursor, search_params, page, per_page, after=None):
+    """n-gram 인덱스로 검색 (인덱스를 사용할 수 없으면 None 반환)"""
+    if not app.config['SEARCH_INDEX_ENABLED']:
+        return None
+
+    data_versions.refresh(get_db())
+    index = get_search_index(load_search_index_rows, app.config['SEARCH_INDEX_MAX_AGE'])
+    if index is None:
+        return None
+
+    matched_ids = index.search({
+        'item_name': search_params.get('product_names', []),
+        'entp_name': search_params.get('manufacturers', []),
+        'se_qesitm': search_params.get('side_effects', [])
+    })
+    total_count = len(matched_ids)
+
+    # 현재 페이지에 해당하는 행만 DB에서 조회 (커서가 있으면 이진 탐색으로 시작 위치 결정)
+    if after is not None:
+        page_ids, has_next = keyset_slice(matched_ids, index.sort_key, after, per_page)
+    else:
+        offset = (page - 1) * per_page
+        page_ids = matched_ids[offset:offset + per_page]
+        has_next = offset + per_page < total_count
+
+    results = []
+    if page_ids:
+        placeholders = ', '.join(['%s'] * len(page_ids))
+        cursor.execute(
+            f"SELECT {SEARCH_RESULT_COLUMNS} FROM unified_medicines WHERE id IN ({placeholders})",
+            page_ids
+        )
+        rows_by_id = {row['id']: row for row in cursor.fetchall()}
+        results = [rows_by_id[doc_id] for doc_id in page_ids if doc_id in rows_by_id]
+
+    next_cursor = None
+    if has_next and page_ids:
+        next_cursor = encode_cursor(*index.sort_key(page_ids[-1]))
+
+    return {
+        'rows': results,
+        'total_count': total_count,
+        'count_is_estimate': False,
+        'next_cursor': next_cursor
+    }
+
+def search_with_like(cursor, search_params, page, per_page, after=None, exact_count=False):
+    """LIKE 조건으로 검색 (인덱스 미사용 시 대체 경로)"""
+    conditions = []
+    query_params = []
+    
+    # 제품명 검색 조건
+    product_names = search_params.get('product_names', [])
+    if product_names:
+        product_conditions = []
+        for name in product_names:
+            product_conditions.append(
+                "(LOWER(item_name) LIKE LOWER(%s) OR LOWER(item_name) LIKE LOWER(%s))"
+            )
+            query_params.append(f"%{name}%")  # 포함된 경우
+            query_params.append(f"{name}%")   # 시작하는 경우
+        
+        conditions.append("(" + " OR ".join(product_conditions) + ")")
+    
+    # 제조사 검색 조건
+    manufacturers = search_params.get('manufacturers', [])
+    if manufacturers:
+        manufacturer_conditions = []
+        for manufacturer in manufacturers:
+            manufacturer_conditions.append("LOWER(entp_name) LIKE LOWER(%s)")
+            query_params.append(f"%{manufacturer}%")
+        if manufacturer_conditions:
+            conditions.append("(" + " OR ".join(manufacturer_conditions) + ")")
+    
+    # 부작용 검색 조건
+    side_effects = search_params.get('side_effects', [])
+    if side_effects:
+        side_effect_conditions = []
+        for side_effect in side_effects:
+            side_effect_conditions.append("LOWER(se_qesitm) LIKE LOWER(%s)")
+            query_params.append(f"%{side_effect}%")
+        if side_effect_conditions:
+            conditions.append("(" + " OR ".join(side_effect_conditions) + ")")
+    
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    logger.info(f"최종 검색 조건: {where_clause}")
+    logger.info(f"검색 파라미터: {query_params}")
+
+    # 페이지 조회와 결과 수 계산 (키셋 커서 / 캐시된 결과 수 사용)
+    return fetch_page(
+        cursor, SEARCH_RESULT_COLUMNS, 'unified_medicines', where_clause, query_params,
+        per_page, page=page, after=after, exact=exact_count
+    )
+
+def search_medicines_in_db(search_params, page=1, per_page=12, cursor_token=None, exact_count=False):
+    """의약품 검색 (cursor_token 이 있으면 키셋 페이지네이션 사용)"""
+    after = decode_cursor(cursor_token)
+    conn = get_db()
+    try:
+        with conn.cursor() as cursor:
             product_names = search_params.get('product_names', [])
-            if product_names:
-                product_conditions = []
-                for name in product_names:
-                    product_conditions.append(
-                        "(LOWER(item_name) LIKE LOWER(%s) OR LOWER(item_name) LIKE LOWER(%s))"
-                    )
-                    query_params.append(f"%{name}%")  # 포함된 경우
-                    query_params.append(f"{name}%")   # 시작하는 경우
-                
-                base_query += " AND (" + " OR ".join(product_conditions) + ")"
-            
-            # 제조사 검색 조건
             manufacturers = search_params.get('manufacturers', [])
-            if manufacturers:
-                manufacturer_conditions = []
-                for manufacturer in manufacturers:
-                    manufacturer_conditions.append("LOWER(entp_name) LIKE LOWER(%s)")
-                    query_params.append(f"%{manufacturer}%")
-                if manufacturer_conditions:
-                    base_query += " AND (" + " OR ".join(manufacturer_conditions) + ")"
-            
-            # 부작용 검색 조건
             side_effects = search_params.get('side_effects', [])
-            if side_effects:
-                side_effect_conditions = []
-                for side_effect in side_effects:
-                    side_effect_conditions.append("LOWER(se_qesitm) LIKE LOWER(%s)")
-                    query_params.append(f"%{side_effect}%")
-                if side_effect_conditions:
-                    base_query += " AND (" + " OR ".join(side_effect_conditions) + ")"
-            
-            logger.info(f"최종 검색 쿼리: {base_query}")
-            logger.info(f"검색 파라미터: {query_params}")
-
-            # 카운트 쿼리 수정
-            count_query = f"""
-            SELECT COUNT(*) as total 
-            FROM (
-                {base_query}
-            ) as count_subquery
-            """
-
-            logger.info(f"카운트 쿼리: {count_query}")
-            logger.info(f"카운트 쿼리 파라미터: {query_params}")
-
-            cursor.execute(count_query, query_params)
-            total_count = cursor.fetchone()['total']
-            
-            # 페이지네이션 적용
-            offset = (page - 1) * per_page
-            paginated_query = base_query + " ORDER BY item_name LIMIT %s OFFSET %s"
-            query_params.extend([per_page, offset])
-            
-            # 메인 쿼리 실행
-            cursor.execute(paginated_query, query_params)
-            results = cursor.fetchall()
+
+            # n-gram 인덱스 우선 사용, 불가능한 경우 LIKE 검색
+            search_result = search_with_index(cursor, search_params, page, per_page, after)
+            if search_result is None:
+                search_result = search_with_like(
+                    cursor, search_params, page, per_page, after, exact_count
+                )
+            results = search_result['rows']
+            total_count = search_result['total_count']
             
-            # 검색 결과에 매치 정보 추가
-            for result in results:
-                # 제품명 매치 하이라이트
-                result['matched_name'] = False
-                for name in product_names:
-                    if name.lower() in result['item_name'].lower():
-                        result['item_name'] = highlight_text(result['item_name'], name)
-                        result['matched_name'] = True
-                        break
-                
-                # 제조사 매치 하이라이트
-                result['matched_manufacturer'] = False
-                for manufacturer in manufacturers:
-                    if manufacturer.lower() in result['entp_name'].lower():
-                        result['entp_name'] = highlight_text(result['entp_name'], manufacturer)
-                        result['matched_manufacturer'] = True
-                        break
-                
-                # 부작용 매치 하이라이트
-                result['matched_side_effect'] = False
-                if result.get('se_qesitm'):
-                    for side_effect in side_effects:
-                        if side_effect.lower() in result['se_qesitm'].lower():
-                            result['se_qesitm'] = highlight_text(result['se_qesitm'], side_effect)
-                            result['matched_side_effect'] = True
-                            break
+            # 검색 결과에 매치 정보 추가 (필드별 검색어를 한 번에 하이라이트)
+            highlight_fields(results, {
+                'item_name': (product_names, 'matched_name'),
+                'entp_name': (manufacturers, 'matched_manufacturer'),
+                'se_qesitm': (side_effects, 'matched_side_effect')
+            })
             
             return {
                 'results': results,
                 'total_count': total_count,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': (total_count + per_page - 1) // per_page
+                'total_pages': (total_count + per_page - 1) // per_page,
+                'count_is_estimate': search_result['count_is_estimate'],
+                'next_cursor': search_result['next_cursor']
             }
     except Exception as e:
         logger.error(f"의약품 검색 오류: {e}")
@@ -358,58 +422,15 @@ def search_medicines_in_db(search_params, page=1, per_page=12):
             'total_count': 0,
             'page': page,
             'per_page': per_page,
-            'total_pages': 0
+            'total_pages': 0,
+            'count_is_estimate': False,
+            'next_cursor': None
         }
     
 def get_medicine_detail_from_db(medicine_id):
-    """데이터베이스에서 의약품 상세 정보 가져오기"""
-    conn = mysql.connection
+    """데이터베이스에서 의약품 상세 정보 가져오기 (id 별 캐시)"""
     try:
-        with conn.cursor(MySQLdb.cursors.DictCursor) as cursor:
-            # 기본 정보 - LEFT JOIN 제거, unified_medicines 테이블만 사용
-            base_query = """
-            SELECT *
-            FROM drug_identification
-            WHERE id = %s
-            """
-            cursor.execute(base_query, (medicine_id,))
-            medicine = cursor.fetchone()
-            
-            if not medicine:
-                return None
-            
-            # 성분 정보 쿼리 - 테이블 존재 여부 확인 필요
-            try:
-                component_query = """
-                SELECT * FROM medicine_components
-                WHERE medicine_id = %s
-                """
-                cursor.execute(component_query, (medicine_id,))
-                components = cursor.fetchall()
-            except Exception as e:
-                logger.warning(f"성분 정보 조회 실패: {e}")
-                components = []
-            
-            # 병용금기 정보 쿼리 - 테이블 존재 여부 확인 필요
-            try:
-                dur_query = """
-                SELECT * FROM medicine_dur_usjnt
-                WHERE medicine_id = %s
-                """
-                cursor.execute(dur_query, (medicine_id,))
-                dur_info = cursor.fetchall()
-            except Exception as e:
-                logger.warning(f"DUR 정보 조회 실패: {e}")
-                dur_info = []
-            
-            # 통합 결과
-            result = {
-                'basic': medicine,
-                'components': components,
-                'dur_info': dur_info
-            }
-            
-            return result
+        return get_cached_medicine_detail(get_db(), medicine_id)
     except Exception as e:
         logger.error(f"의약품 상세 정보 조회 오류: {e}")
         return None
@@ -435,6 +456,8 @@ def search():
     # 페이지네이션 파라미터
     page = int(request.args.get('page', 1))
     per_page = int(request.args.get('per_page', 12))
+    cursor_token = request.args.get('cursor')
+    exact_count = request.args.get('exact_count') == '1'
     
     # 검색 파라미터 구성
     search_params = {
@@ -444,7 +467,9 @@ def search():
     }
     
     # 데이터베이스에서 검색
-    search_result = search_medicines_in_db(search_params, page, per_page)
+    search_result = search_medicines_in_db(
+        search_params, page, per_page, cursor_token=cursor_token, exact_count=exact_count
+    )
     
     # 페이지네이션 URL 구성
     pagination_url = url_for('search') + '?'
@@ -468,6 +493,8 @@ def search():
         current_page=page,
         per_page=per_page,
         total_pages=search_result['total_pages'],
+        count_is_estimate=search_result['count_is_estimate'],
+        next_cursor=search_result['next_cursor'],
         pagination_url=pagination_url,
         search_params=search_params
     )
@@ -481,7 +508,18 @@ def medicine_detail(medicine_id):
         flash('의약품 정보를 찾을 수 없습니다.', 'error')
         return redirect(url_for('index'))
     
-    return render_template('medicine_detail.html', medicine=medicine) # 하이픈 X 언더스코어 O (html 파일을 불러오기 때문에 이름이 똑같아야함)
+    # 브라우저 캐시가 최신이면 렌더링 없이 304 응답
+    etag, last_modified = detail_validators(medicine)
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response = Response(status=304)
+    else:
+        response = make_response(render_template('medicine_detail.html', medicine=medicine)) # 하이픈 X 언더스코어 O (html 파일을 불러오기 때문에 이름이 똑같아야함)
+    
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.no_cache = True  # 매번 재검증
+    return response
 
 @app.route('/api/ai-search', methods=['POST'])
 def ai_search():
@@ -508,11 +546,100 @@ def ai_search():
             'error': str(e)
         }), 500
 
+@app.route('/api/ai-search/stream', methods=['POST'])
+def ai_search_stream():
+    """AI 검색 스트리밍 API (NDJSON: 검색 결과를 먼저, AI 요약은 준비되는 대로 전송)"""
+    data = request.get_json(silent=True) or {}
+    query = data.get('query', '')
+    
+    if not query:
+        return jsonify({
+            'success': False,
+            'message': '검색어를 입력해주세요.'
+        }), 400
+    
+    def generate():
+        for event in ai_search_medicine_stream(query):
+            yield json.dumps(event, ensure_ascii=False, default=str) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+# 한 번에 검사할 수 있는 최대 품목 수
+MAX_INTERACTION_ITEMS = 200
+
+@app.route('/api/interactions/check', methods=['POST'])
+def check_interactions():
+    """품목일련번호 목록의 병용금기 쌍 검사 API"""
+    data = request.get_json(silent=True) or {}
+    item_seqs = data.get('item_seqs')
+    
+    if not isinstance(item_seqs, list) or not item_seqs:
+        return jsonify({
+            'success': False,
+            'message': 'item_seqs 목록을 입력해주세요.'
+        }), 400
+    
+    if len(item_seqs) > MAX_INTERACTION_ITEMS:
+        return jsonify({
+            'success': False,
+            'message': f'한 번에 최대 {MAX_INTERACTION_ITEMS}개 품목까지 검사할 수 있습니다.'
+        }), 400
+    
+    data_versions.refresh(get_db())
+    graph = get_interaction_graph(load_interaction_rows)
+    if graph is None:
+        return jsonify({
+            'success': False,
+            'message': '병용금기 데이터를 사용할 수 없습니다.'
+        }), 503
+    
+    result = graph.check([str(item_seq).strip() for item_seq in item_seqs])
+    return jsonify({
+        'success': True,
+        'item_count': len(item_seqs),
+        'interaction_count': len(result['interactions']),
+        'interactions': result['interactions'],
+        'unknown_items': result['unknown_items']
+    })
+
 @app.route('/ai-search')
 def ai_search_page():
     """AI 검색 페이지"""
     return render_template('ai_search.html')
 
+#---------------------------------------------------
+# 라우트 - 운영 지표
+#---------------------------------------------------
+@app.route('/api/metrics')
+def metrics():
+    """커넥션 풀, 캐시 적중률 등 내부 지표 조회"""
+    return jsonify({
+        'db_pool': db_pool.get_pool().stats(),
+        'caches': all_cache_stats(),
+        'startup': {
+            'cold_start_seconds': APP_COLD_START_SECONDS,
+            'budget_seconds': APP_STARTUP_BUDGET
+        },
+        'ai_model': model_status(),
+        'api_client': get_api_client().stats()
+    })
+
+#---------------------------------------------------
+# 시작 시간 측정 및 AI 모델 준비
+#---------------------------------------------------
+# 콜드 스타트 허용 시간 (초, 초과 시 경고 로그)
+APP_STARTUP_BUDGET = float(os.getenv('APP_STARTUP_BUDGET', 3))
+
+APP_COLD_START_SECONDS = time.perf_counter() - _import_started
+if APP_COLD_START_SECONDS > APP_STARTUP_BUDGET:
+    logger.warning(f"앱 콜드 스타트 {APP_COLD_START_SECONDS:.2f}초 (허용 {APP_STARTUP_BUDGET:.2f}초 초과)")
+else:
+    logger.info(f"앱 콜드 스타트 {APP_COLD_START_SECONDS:.2f}초")
+
+# AI 모델은 최초 사용 시 생성, AI_MODEL_WARMUP=1 이면 백그라운드에서 미리 생성
+if AI_MODEL_WARMUP:
+    warm_up_model()
+
 #---------------------------------------------------
 # 메인 함수
 #---------------------------------------------------
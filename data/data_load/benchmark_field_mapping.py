@@ -0,0 +1,86 @@
+"""API 응답 항목 → DB 컬럼 매핑 방식 비교 (필드명 변형 탐색 vs FieldResolver)
+
+사용법:
+    python benchmark_field_mapping.py [응답 XML 파일 ...] [--api API이름] [--repeat N]
+
+파일을 지정하지 않으면 낱알식별 API 형식의 100건 응답을 생성하여 측정한다.
+"""
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from api_xml import parse_api_items
+from benchmark_xml_parsing import sample_response
+from drug_fields import FIELD_MAPPINGS, FieldResolver, get_field_value
+
+
+def map_with_rebuild(items, api_key):
+    """기존 방식: 항목마다 매핑 dict 를 새로 만들고 컬럼별로 필드명 변형 탐색"""
+    rows = []
+    for item in items:
+        field_mappings = {
+            name: {column: list(variants) for column, variants in columns.items()}
+            for name, columns in FIELD_MAPPINGS.items()
+        }
+        rows.append(tuple(get_field_value(item, column, api_key) for column in field_mappings[api_key]))
+    return rows
+
+
+def map_with_lookup(items, api_key):
+    """모듈 수준 매핑 + 컬럼별 필드명 변형 탐색"""
+    columns = list(FIELD_MAPPINGS[api_key])
+    return [tuple(get_field_value(item, column, api_key) for column in columns) for item in items]
+
+
+def map_with_resolver(items, api_key):
+    """FieldResolver: 첫 항목에서 응답 키 결정 후 컬럼당 dict 조회 한 번"""
+    return FieldResolver(api_key).rows(items)
+
+
+def measure(mapper, items, api_key, repeat):
+    """(페이지당 평균 시간(ms), 항목당 시간(us))"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        mapper(items, api_key)
+    elapsed = (time.perf_counter() - started) / repeat
+    return elapsed * 1000, elapsed * 1e6 / max(1, len(items))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API 응답 필드 매핑 벤치마크')
+    parser.add_argument('files', nargs='*', help='기록된 API 응답 XML 파일')
+    parser.add_argument('--api', default='의약품 낱알식별 정보', choices=list(FIELD_MAPPINGS), help='응답의 API 이름')
+    parser.add_argument('--repeat', type=int, default=200, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    samples = []
+    for path in args.files:
+        with open(path, 'rb') as f:
+            samples.append((os.path.basename(path), parse_api_items(f.read())['items']))
+    if not samples:
+        samples.append(('sample(100건)', parse_api_items(sample_response())['items']))
+
+    mappers = (
+        ('rebuild', map_with_rebuild),
+        ('lookup', map_with_lookup),
+        ('resolver', map_with_resolver)
+    )
+    print(f"{'응답':<24}{'방식':<10}{'페이지(ms)':>12}{'항목당(us)':>12}")
+    for name, items in samples:
+        # 같은 결과를 내는지 먼저 확인
+        expected = map_with_lookup(items, args.api)
+        for label, mapper in mappers:
+            if mapper(items, args.api) != expected:
+                print(f"{name}: {label} 결과가 다릅니다")
+        for label, mapper in mappers:
+            page_ms, item_us = measure(mapper, items, args.api, args.repeat)
+            print(f"{name:<24}{label:<10}{page_ms:>12.3f}{item_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
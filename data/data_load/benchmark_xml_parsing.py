@@ -0,0 +1,103 @@
+"""API 응답 XML 파싱 방식 비교 (전체 DOM vs iterparse 스트리밍)
+
+사용법:
+    python benchmark_xml_parsing.py [응답 XML 파일 ...] [--repeat N]
+
+파일을 지정하지 않으면 낱알식별 API 형식의 100건 응답을 생성하여 측정한다.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from api_xml import parse_api_items
+
+
+def parse_with_dom(content):
+    """기존 방식: ET.fromstring 후 .//item 순회"""
+    root = ET.fromstring(content)
+    items = []
+    for item in root.findall('.//item'):
+        items.append({child.tag: child.text for child in item})
+    total_count_elem = root.find('.//totalCount')
+    total_count = int(total_count_elem.text) if total_count_elem is not None else 0
+    return {'items': items, 'total_count': total_count}
+
+
+def parse_with_stream(content):
+    """스트리밍 방식: api_xml.parse_api_items"""
+    return parse_api_items(content)
+
+
+def sample_response(num_items=100, text_length=2000):
+    """낱알식별 API 형식의 응답 본문 생성 (긴 텍스트 필드 포함)"""
+    long_text = escape('이 약은 두통, 치통, 생리통의 진통 및 해열에 사용합니다. ' * (text_length // 30))
+    items = []
+    for i in range(num_items):
+        items.append(
+            "<item>"
+            f"<ITEM_SEQ>{200000000 + i}</ITEM_SEQ>"
+            f"<ITEM_NAME>테스트정{i}밀리그램</ITEM_NAME>"
+            "<ENTP_NAME>테스트제약(주)</ENTP_NAME>"
+            f"<CHART>{long_text}</CHART>"
+            "<DRUG_SHAPE>원형</DRUG_SHAPE><COLOR_CLASS1>하양</COLOR_CLASS1>"
+            "<PRINT_FRONT>TY</PRINT_FRONT><PRINT_BACK>500</PRINT_BACK>"
+            f"<CLASS_NAME>해열.진통.소염제</CLASS_NAME><ETC_OTC_NAME>일반의약품</ETC_OTC_NAME>"
+            f"<EE_DOC_DATA>{long_text}</EE_DOC_DATA>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>"
+        f"<body><items>{''.join(items)}</items>"
+        f"<numOfRows>{num_items}</numOfRows><pageNo>1</pageNo><totalCount>25000</totalCount></body>"
+        "</response>"
+    ).encode('utf-8')
+
+
+def measure(parse, content, repeat):
+    """(평균 파싱 시간(ms), 최대 메모리(KB), 항목 수)"""
+    # 시간 측정 (tracemalloc 오버헤드 제외)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = parse(content)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    # 최대 메모리 측정
+    tracemalloc.start()
+    result = parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024, len(result['items'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API 응답 XML 파싱 벤치마크')
+    parser.add_argument('files', nargs='*', help='기록된 API 응답 XML 파일')
+    parser.add_argument('--repeat', type=int, default=20, help='시간 측정 반복 횟수')
+    args = parser.parse_args()
+
+    samples = []
+    for path in args.files:
+        with open(path, 'rb') as f:
+            samples.append((os.path.basename(path), f.read()))
+    if not samples:
+        samples.append(('sample(100건)', sample_response()))
+
+    print(f"{'응답':<24}{'방식':<10}{'시간(ms)':>10}{'최대 메모리(KB)':>18}{'항목 수':>8}")
+    for name, content in samples:
+        for label, parse in (('DOM', parse_with_dom), ('stream', parse_with_stream)):
+            elapsed_ms, peak_kb, count = measure(parse, content, args.repeat)
+            print(f"{name:<24}{label:<10}{elapsed_ms:>10.2f}{peak_kb:>18.1f}{count:>8}")
+        print(f"{'':<24}(응답 크기 {len(content) / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    main()
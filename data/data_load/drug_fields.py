@@ -0,0 +1,120 @@
+# API 응답 필드를 DB 필드로 매핑 (대문자/소문자 모두 고려)
+FIELD_MAPPINGS = {
+    '의약품 낱알식별 정보': {
+        'item_seq': ['ITEM_SEQ', 'itemSeq', 'item_seq'],
+        'item_name': ['ITEM_NAME', 'itemName'],
+        'entp_seq': ['ENTP_SEQ', 'entpSeq'],
+        'entp_name': ['ENTP_NAME', 'entpName'],
+        'chart': ['CHART', 'chart'],
+        'item_image': ['ITEM_IMAGE', 'itemImage'],
+        'print_front': ['PRINT_FRONT', 'printFront'],
+        'print_back': ['PRINT_BACK', 'printBack'],
+        'drug_shape': ['DRUG_SHAPE', 'drugShape'],
+        'color_class1': ['COLOR_CLASS1', 'colorClass1', 'COLOR_CLASS', 'colorClass'],
+        'color_class2': ['COLOR_CLASS2', 'colorClass2'],
+        'line_front': ['LINE_FRONT', 'lineFront'],
+        'line_back': ['LINE_BACK', 'lineBack'],
+        'leng_long': ['LENG_LONG', 'lengLong'],
+        'leng_short': ['LENG_SHORT', 'lengShort'],
+        'thick': ['THICK', 'thick'],
+        'img_regist_ts': ['IMG_REGIST_TS', 'imgRegistTs'],
+        'class_no': ['CLASS_NO', 'classNo'],
+        'class_name': ['CLASS_NAME', 'className'],
+        'etc_otc_name': ['ETC_OTC_NAME', 'etcOtcName'],
+        'item_permit_date': ['ITEM_PERMIT_DATE', 'itemPermitDate'],
+        'form_code_name': ['FORM_CODE_NAME', 'formCodeName'],
+        'mark_code_front_anal': ['MARK_CODE_FRONT_ANAL', 'markCodeFrontAnal'],
+        'mark_code_back_anal': ['MARK_CODE_BACK_ANAL', 'markCodeBackAnal'],
+        'mark_code_front_img': ['MARK_CODE_FRONT_IMG', 'markCodeFrontImg'],
+        'mark_code_back_img': ['MARK_CODE_BACK_IMG', 'markCodeBackImg'],
+        'change_date': ['CHANGE_DATE', 'changeDate'],
+        'mark_code_front': ['MARK_CODE_FRONT', 'markCodeFront'],
+        'mark_code_back': ['MARK_CODE_BACK', 'markCodeBack'],
+        'item_eng_name': ['ITEM_ENG_NAME', 'itemEngName'],
+        'edi_code': ['EDI_CODE', 'ediCode']
+    },
+    '의약품성분약효정보': {
+        'div_nm': ['divNm', 'DIV_NM'],
+        'fomn_tp_nm': ['fomnTpNm', 'FOMN_TP_NM'],
+        'gnl_nm': ['gnlNm', 'GNL_NM'],
+        'gnl_nm_cd': ['gnlNmCd', 'GNL_NM_CD'],
+        'injc_pth_nm': ['injcPthNm', 'INJC_PTH_NM'],
+        'iqty_txt': ['iqtyTxt', 'IQTY_TXT'],
+        'meft_div_no': ['meftDivNo', 'MEFT_DIV_NO'],
+        'unit': ['unit', 'UNIT']
+    },
+    '성분별 1일 최대투여량 정보': {
+        'cpnt_cd': ['CPNT_CD', 'cpntCd'],
+        'drug_cpnt_kor_nm': ['DRUG_CPNT_KOR_NM', 'drugCpntKorNm'],
+        'drug_cpnt_eng_nm': ['DRUG_CPNT_ENG_NM', 'drugCpntEngNm'],
+        'foml_cd': ['FOML_CD', 'fomlCd'],
+        'foml_nm': ['FOML_NM', 'fomlNm'],
+        'dosage_route_code': ['DOSAGE_ROUTE_CODE', 'dosageRouteCode'],
+        'day_max_dosg_qy_unit': ['DAY_MAX_DOSG_QY_UNIT', 'dayMaxDosgQyUnit'],
+        'day_max_dosg_qy': ['DAY_MAX_DOSG_QY', 'dayMaxDosgQy']
+    }
+}
+
+# API 별 식별자 컬럼 (테이블의 UNIQUE KEY, drug_relation 연결 컬럼)
+API_ID_FIELDS = {
+    '의약품 낱알식별 정보': 'item_seq',
+    '의약품성분약효정보': 'gnl_nm_cd',
+    '성분별 1일 최대투여량 정보': 'cpnt_cd'
+}
+
+
+def get_field_value(data, field_key, api_key):
+    """API 응답 항목에서 DB 필드 값 가져오기 (필드명 변형 순서대로 확인)"""
+    if api_key in FIELD_MAPPINGS and field_key in FIELD_MAPPINGS[api_key]:
+        for possible_field in FIELD_MAPPINGS[api_key][field_key]:
+            if possible_field in data and data[possible_field] is not None:
+                return data[possible_field]
+    return None
+
+
+class FieldResolver:
+    """응답 스트림의 첫 항목으로 필드명 변형을 한 번만 결정하는 매핑기
+
+    같은 API 응답의 항목들은 태그 이름이 같으므로, 첫 항목에서 컬럼별로 실제
+    응답 키(ITEM_SEQ / itemSeq 등)를 찾아 두고 이후 항목은 컬럼당 dict 조회 한 번으로
+    executemany 용 튜플을 만든다. 첫 항목에 없던 키가 나오면 해당 항목만 get_field_value 로 확인한다.
+
+    Args:
+        api_key: FIELD_MAPPINGS 의 API 이름
+    """
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.columns = list(FIELD_MAPPINGS[api_key])
+        self.keys = None
+        self._unresolved = ()
+        self._sample_keys = frozenset()
+
+    def resolve(self, sample_item):
+        """첫 항목으로 컬럼별 응답 키 결정"""
+        keys = []
+        unresolved = []
+        for index, column in enumerate(self.columns):
+            key = next((name for name in FIELD_MAPPINGS[self.api_key][column] if name in sample_item), None)
+            keys.append(key)
+            if key is None:
+                unresolved.append(index)
+        self.keys = keys
+        self._unresolved = tuple(unresolved)
+        self._sample_keys = frozenset(sample_item)
+        return self
+
+    def row(self, item):
+        """항목 → 컬럼 순서의 값 튜플"""
+        if self.keys is None:
+            self.resolve(item)
+        get = item.get
+        values = [get(key) if key is not None else None for key in self.keys]
+        # 첫 항목에 없던 키가 있는 항목만 결정되지 않은 컬럼을 다시 확인
+        if self._unresolved and not item.keys() <= self._sample_keys:
+            for index in self._unresolved:
+                values[index] = get_field_value(item, self.columns[index], self.api_key)
+        return tuple(values)
+
+    def rows(self, items):
+        return [self.row(item) for item in items]
@@ -8,9 +8,22 @@ import sys
 from dotenv import load_dotenv
 import colorama
 from colorama import Fore, Style
+import argparse
+import hashlib
 import json
+import queue
+import threading
 colorama.init(autoreset=True)  # Windows 콘솔 색상 지원
 
+# 웹 애플리케이션과 공용 모듈(API 응답 파서 등)을 쓰기 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from api_xml import parse_api_items
+from api_client import TokenBucket
+from drug_fields import API_ID_FIELDS, FIELD_MAPPINGS, FieldResolver, get_field_value
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -69,15 +82,32 @@ API_TABLE_MAPPING = {
     '성분별 1일 최대투여량 정보': 'drug_component_dosage'
 }
 
+# 일괄 저장 시 재시도 횟수 (연결 오류 등 일시적 오류)
+BATCH_MAX_RETRIES = 3
+
 # 체크포인트 파일 경로
 CHECKPOINT_FILE = "data_load_checkpoint.json"
 
-def save_checkpoint(api_key, page_no, processed_count):
-    """진행 상황 저장"""
+# 파이프라인 설정 (동시 페이지 요청 수, 초당 요청 수, 단계 간 대기열 크기)
+LOAD_FETCH_WORKERS = int(os.getenv('LOAD_FETCH_WORKERS', 4))
+LOAD_REQUEST_RATE = float(os.getenv('LOAD_REQUEST_RATE', 5))
+LOAD_QUEUE_SIZE = int(os.getenv('LOAD_QUEUE_SIZE', 8))
+
+# 페이지당 항목 수
+PAGE_SIZE = 100
+
+def save_checkpoint(api_key, page_no, processed_count, failed_pages=None):
+    """진행 상황 저장
+
+    Args:
+        page_no: 다시 시작할 페이지 (이전 페이지는 모두 처리 완료)
+        failed_pages: {API 키: [가져오기 실패한 페이지]} - 재시작 시 다시 시도
+    """
     checkpoint_data = {
         'api_key': api_key,
         'page_no': page_no,
         'processed_count': processed_count,
+        'failed_pages': failed_pages or {},
         'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
     }
     
@@ -116,8 +146,40 @@ def db_connection():
                 logger.critical("데이터베이스 연결 실패. 프로그램을 종료합니다.")
                 sys.exit(1)
 
-def fetch_drug_data(api_key, page_no=1, num_of_rows=100):
-    """의약품 정보 가져오기"""
+def parse_drug_page(api_key, page_no, num_of_rows, content):
+    """API 응답 본문 파싱 → {'items', 'total_count'} (결과 코드 오류 시 None)
+
+    Raises:
+        ET.ParseError: XML 형식 오류
+    """
+    # 스트리밍 파싱 (항목 단위로 dict 변환 후 요소 해제)
+    parsed = parse_api_items(content)
+    
+    # 결과 코드 확인
+    if parsed['result_code'] is not None and parsed['result_code'] != '00':
+        result_msg = parsed['result_msg'] or '알 수 없는 오류'
+        logger.error(f"API 오류: {parsed['result_code']} - {result_msg}")
+        return None
+    
+    # 항목 추출
+    items = parsed['items']
+    
+    # 전체 결과 수
+    count = parsed['total_count']
+    
+    logger.info(f"API {api_key} - 페이지 {page_no}/{(count + num_of_rows - 1) // num_of_rows} - {len(items)}개 항목 가져옴")
+    
+    return {
+        'items': items,
+        'total_count': count
+    }
+
+def fetch_drug_data(api_key, page_no=1, num_of_rows=100, parse=True):
+    """의약품 정보 가져오기
+
+    Args:
+        parse: False 이면 파싱하지 않고 응답 본문(bytes) 반환 (파이프라인 파싱 단계용)
+    """
     if api_key not in API_URLS:
         logger.error(f"알 수 없는 API 키: {api_key}")
         return None
@@ -145,35 +207,10 @@ def fetch_drug_data(api_key, page_no=1, num_of_rows=100):
             logger.debug(f"응답 상태 코드: {response.status_code}")
             
             if response.status_code == 200:
+                if not parse:
+                    return response.content
                 try:
-                    root = ET.fromstring(response.text)
-                    
-                    # 결과 코드 확인
-                    result_code_elem = root.find('.//resultCode')
-                    if result_code_elem is not None and result_code_elem.text != '00':
-                        result_msg_elem = root.find('.//resultMsg')
-                        result_msg = result_msg_elem.text if result_msg_elem is not None else '알 수 없는 오류'
-                        logger.error(f"API 오류: {result_code_elem.text} - {result_msg}")
-                        return None
-                    
-                    # 항목 추출
-                    items = []
-                    for item in root.findall('.//item'):
-                        drug_data = {}
-                        for child in item:
-                            drug_data[child.tag] = child.text
-                        items.append(drug_data)
-                    
-                    # 전체 결과 수
-                    total_count_elem = root.find('.//totalCount')
-                    count = int(total_count_elem.text) if total_count_elem is not None else 0
-                    
-                    logger.info(f"API {api_key} - 페이지 {page_no}/{(count + num_of_rows - 1) // num_of_rows} - {len(items)}개 항목 가져옴")
-                    
-                    return {
-                        'items': items,
-                        'total_count': count
-                    }
+                    return parse_drug_page(api_key, page_no, num_of_rows, response.content)
                 except ET.ParseError as e:
                     logger.error(f"XML 파싱 오류: {e}")
                     logger.debug(f"응답 내용: {response.text[:500]}...")
@@ -203,8 +240,12 @@ def fetch_drug_data(api_key, page_no=1, num_of_rows=100):
     
     logger.error(f"최대 재시도 횟수 초과: API {api_key}, 페이지 {page_no}")
     return None
-def ensure_tables_exist():
-    """새로운 데이터베이스 테이블 구조 확인 및 생성"""
+def ensure_tables_exist(dedupe_unique_keys=False):
+    """새로운 데이터베이스 테이블 구조 확인 및 생성
+
+    Args:
+        dedupe_unique_keys: UNIQUE KEY 마이그레이션 시 중복 행 합치기 허용
+    """
     conn = db_connection()
     
     try:
@@ -244,9 +285,10 @@ def ensure_tables_exist():
                 mark_code_back VARCHAR(255) COMMENT '마크코드(뒤)',
                 item_eng_name VARCHAR(500) COMMENT '제품영문명',
                 edi_code VARCHAR(100) COMMENT '보험코드',
+                content_hash CHAR(40) COMMENT '응답 내용 해시 (변경 감지)',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '데이터 생성일',
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일',
-                INDEX idx_item_seq (item_seq),
+                UNIQUE KEY uk_item_seq (item_seq),
                 INDEX idx_item_name (item_name(255)),
                 INDEX idx_edi_code (edi_code)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='식품의약품안전처_의약품 낱알식별 정보'
@@ -264,9 +306,10 @@ def ensure_tables_exist():
                 iqty_txt VARCHAR(1000) COMMENT '함량내용',
                 meft_div_no VARCHAR(3) COMMENT '약효분류번호',
                 unit VARCHAR(70) COMMENT '단위',
+                content_hash CHAR(40) COMMENT '응답 내용 해시 (변경 감지)',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '데이터 생성일',
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일',
-                INDEX idx_gnl_nm_cd (gnl_nm_cd),
+                UNIQUE KEY uk_gnl_nm_cd (gnl_nm_cd),
                 INDEX idx_meft_div_no (meft_div_no)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='식품의약품안전처_의약품성분약효정보'
             """)
@@ -283,9 +326,10 @@ def ensure_tables_exist():
                 dosage_route_code VARCHAR(100) COMMENT '투여경로',
                 day_max_dosg_qy_unit VARCHAR(100) COMMENT '투여단위',
                 day_max_dosg_qy DECIMAL(20,6) COMMENT '1일최대투여량',
+                content_hash CHAR(40) COMMENT '응답 내용 해시 (변경 감지)',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '데이터 생성일',
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일',
-                INDEX idx_cpnt_cd (cpnt_cd),
+                UNIQUE KEY uk_cpnt_cd (cpnt_cd),
                 INDEX idx_drug_cpnt_kor_nm (drug_cpnt_kor_nm(255))
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='건강보험심사평가원_의약품성분약효정보'
             """)
@@ -299,92 +343,223 @@ def ensure_tables_exist():
                 cpnt_cd VARCHAR(100) COMMENT '성분코드(drug_component_dosage 참조)',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '데이터 생성일',
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일',
-                INDEX idx_item_seq (item_seq),
-                INDEX idx_gnl_nm_cd (gnl_nm_cd),
-                INDEX idx_cpnt_cd (cpnt_cd)
+                UNIQUE KEY uk_item_seq (item_seq),
+                UNIQUE KEY uk_gnl_nm_cd (gnl_nm_cd),
+                UNIQUE KEY uk_cpnt_cd (cpnt_cd)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='의약품 데이터 관계 테이블'
             """)
             
+            # 5. 웹 애플리케이션 캐시 무효화를 위한 테이블별 데이터 버전
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS data_version (
+                table_name VARCHAR(100) PRIMARY KEY COMMENT '테이블명',
+                version BIGINT NOT NULL DEFAULT 0 COMMENT '데이터 버전 (기록 시마다 증가)',
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일'
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='테이블별 데이터 버전'
+            """)
+            
+            # 6. API 별 동기화 상태 (마지막 성공 시각, 실행 결과)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sync_state (
+                api_name VARCHAR(100) PRIMARY KEY COMMENT 'API 이름',
+                mode VARCHAR(20) NOT NULL COMMENT '동기화 방식 (full/incremental)',
+                last_started_at DATETIME COMMENT '마지막 실행 시작 시각',
+                last_success_at DATETIME COMMENT '마지막으로 모든 페이지를 처리한 실행의 시작 시각',
+                pages_fetched INT NOT NULL DEFAULT 0 COMMENT '가져온 페이지 수',
+                pages_failed INT NOT NULL DEFAULT 0 COMMENT '실패한 페이지 수',
+                rows_changed INT NOT NULL DEFAULT 0 COMMENT '추가/변경된 행 수',
+                rows_skipped INT NOT NULL DEFAULT 0 COMMENT '변경 없어 건너뛴 행 수',
+                rows_failed INT NOT NULL DEFAULT 0 COMMENT '저장 실패 행 수',
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '데이터 수정일'
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='API 별 동기화 상태'
+            """)
+            
             conn.commit()
             logger.info("새로운 데이터베이스 테이블 확인/생성 완료")
+        
+        # 이전 버전에서 만든 테이블에 식별자 UNIQUE KEY, 내용 해시 컬럼 추가
+        migrate_unique_keys(conn, dedupe=dedupe_unique_keys)
+        migrate_content_hash(conn)
     except Exception as e:
         logger.error(f"테이블 생성 오류: {e}")
         conn.rollback()
     finally:
         conn.close()
 
-def insert_drug_data(drug_data, api_key=None):
-    """새로운 테이블 구조에 맞게 의약품 데이터 삽입"""
+# 식별자 UNIQUE KEY (테이블, 컬럼) - 일괄 저장의 ON DUPLICATE KEY UPDATE 기준
+UNIQUE_KEYS = [
+    ('drug_identification', 'item_seq'),
+    ('drug_component_efficacy', 'gnl_nm_cd'),
+    ('drug_component_dosage', 'cpnt_cd'),
+    ('drug_relation', 'item_seq'),
+    ('drug_relation', 'gnl_nm_cd'),
+    ('drug_relation', 'cpnt_cd')
+]
+
+# id 로 다른 테이블이 참조하는 테이블 → [(참조 테이블, 참조 컬럼)]
+# (웹 애플리케이션 상세 화면이 medicine_id = drug_identification.id 로 연결, medicine_detail.DETAIL_RELATED_TABLES)
+ID_REFERENCES = {
+    'drug_identification': [('medicine_components', 'medicine_id'), ('medicine_dur_usjnt', 'medicine_id')]
+}
+
+def existing_references(cursor, table_name):
+    """table_name 의 id 를 참조하는 (테이블, 컬럼) 중 실제로 있는 것"""
+    references = []
+    for ref_table, ref_column in ID_REFERENCES.get(table_name, []):
+        cursor.execute(
+            "SELECT 1 FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+            (ref_table, ref_column)
+        )
+        if cursor.fetchone():
+            references.append((ref_table, ref_column))
+    return references
+
+def merge_duplicate_rows(cursor, table_name, column):
+    """식별자가 같은 중복 행을 가장 오래된 행(id 최소) 하나로 합침
+
+    - 남길 행에 가장 최근 행(id 최대)의 값을 복사 (id, created_at 제외)
+    - 삭제할 행을 참조하던 행은 남길 행을 가리키도록 변경
+    - 나머지 중복 행 삭제
+
+    기존 id 를 유지하므로 상세 페이지 URL(/medicine/<id>) 과 참조가 그대로 유효하다.
+
+    Returns:
+        삭제한 행 수
+    """
+    duplicates = (
+        f"SELECT {column}, MIN(id) AS keep_id, MAX(id) AS latest_id FROM {table_name} "
+        f"WHERE {column} IS NOT NULL GROUP BY {column} HAVING COUNT(*) > 1"
+    )
+    
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+        (table_name,)
+    )
+    copy_columns = [
+        row['COLUMN_NAME'] for row in cursor.fetchall()
+        if row['COLUMN_NAME'] not in ('id', 'created_at', column)
+    ]
+    if copy_columns:
+        assignments = ', '.join(f"keep.{name} = latest.{name}" for name in copy_columns)
+        cursor.execute(
+            f"UPDATE {table_name} keep "
+            f"JOIN ({duplicates}) d ON keep.id = d.keep_id "
+            f"JOIN {table_name} latest ON latest.id = d.latest_id "
+            f"SET {assignments}"
+        )
+    
+    for ref_table, ref_column in existing_references(cursor, table_name):
+        moved = cursor.execute(
+            f"UPDATE {ref_table} r "
+            f"JOIN {table_name} t ON r.{ref_column} = t.id "
+            f"JOIN ({duplicates}) d ON t.{column} = d.{column} "
+            f"SET r.{ref_column} = d.keep_id "
+            f"WHERE t.id <> d.keep_id"
+        )
+        if moved:
+            logger.info(f"{ref_table}.{ref_column}: 중복 {table_name} 행 참조 {moved}개를 남길 행으로 변경")
+    
+    return cursor.execute(
+        f"DELETE t1 FROM {table_name} t1 JOIN {table_name} t2 "
+        f"ON t1.{column} = t2.{column} AND t1.id > t2.id"
+    )
+
+def migrate_unique_keys(conn, dedupe=False):
+    """기존 테이블에 식별자 UNIQUE KEY 추가 (마이그레이션)
+
+    중복 행이 없으면 키를 추가하고 같은 컬럼의 기존 일반 인덱스는 제거한다.
+    중복 행이 있으면 dedupe=True (--dedupe-unique-keys) 일 때만 merge_duplicate_rows 로
+    합친 뒤 키를 추가하고, 아니면 경고만 남기고 건너뛴다.
+    """
+    with conn.cursor() as cursor:
+        for table_name, column in UNIQUE_KEYS:
+            cursor.execute(
+                "SELECT INDEX_NAME, NON_UNIQUE FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s AND SEQ_IN_INDEX = 1",
+                (table_name, column)
+            )
+            indexes = cursor.fetchall()
+            if any(not index['NON_UNIQUE'] for index in indexes):
+                continue
+            
+            cursor.execute(
+                f"SELECT COUNT(*) AS duplicate_count FROM (SELECT 1 FROM {table_name} "
+                f"WHERE {column} IS NOT NULL GROUP BY {column} HAVING COUNT(*) > 1) d"
+            )
+            duplicate_groups = cursor.fetchone()['duplicate_count']
+            if duplicate_groups and not dedupe:
+                logger.warning(
+                    f"UNIQUE KEY 추가 건너뜀: {table_name}.{column} 에 중복 식별자 {duplicate_groups}개 "
+                    f"(--dedupe-unique-keys 로 실행하면 가장 오래된 행으로 합친 뒤 추가)"
+                )
+                continue
+            
+            try:
+                deleted = merge_duplicate_rows(cursor, table_name, column) if duplicate_groups else 0
+                cursor.execute(f"ALTER TABLE {table_name} ADD UNIQUE KEY uk_{column} ({column})")
+                for index in indexes:
+                    cursor.execute(f"ALTER TABLE {table_name} DROP INDEX {index['INDEX_NAME']}")
+                conn.commit()
+                logger.info(f"UNIQUE KEY 추가: {table_name}.{column} (중복 행 {deleted}개 합침)")
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"UNIQUE KEY 추가 오류 ({table_name}.{column}): {e}")
+
+def migrate_content_hash(conn):
+    """기존 데이터 테이블에 content_hash 컬럼 추가 (마이그레이션)
+
+    추가 직후에는 값이 비어 있으므로 다음 동기화에서 한 번씩 다시 기록된다.
+    """
+    with conn.cursor() as cursor:
+        for table_name in API_TABLE_MAPPING.values():
+            cursor.execute(
+                "SELECT 1 FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'content_hash'",
+                (table_name,)
+            )
+            if cursor.fetchone():
+                continue
+            try:
+                cursor.execute(
+                    f"ALTER TABLE {table_name} ADD COLUMN content_hash CHAR(40) "
+                    f"COMMENT '응답 내용 해시 (변경 감지)' AFTER updated_at"
+                )
+                conn.commit()
+                logger.info(f"content_hash 컬럼 추가: {table_name}")
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"content_hash 컬럼 추가 오류 ({table_name}): {e}")
+
+def bump_data_version(table_name):
+    """테이블 데이터 버전 증가 (웹 애플리케이션의 검색/상세 캐시 무효화)"""
+    conn = db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO data_version (table_name, version) VALUES (%s, 1) "
+                "ON DUPLICATE KEY UPDATE version = version + 1",
+                (table_name,)
+            )
+        conn.commit()
+    except Exception as e:
+        logger.error(f"데이터 버전 갱신 오류 ({table_name}): {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def insert_drug_data(drug_data, api_key=None, content_hash=None):
+    """새로운 테이블 구조에 맞게 의약품 데이터 삽입
+
+    Args:
+        content_hash: 응답 내용 해시 (row_content_hash) - 주어지면 함께 저장하여 증분 동기화에서 비교
+    """
     
     # 재시도 설정
     max_retries = 3
     retry_delay = 1
     
-    # API 응답 필드를 DB 필드로 매핑 (대문자/소문자 모두 고려)
-    field_mappings = {
-        '의약품 낱알식별 정보': {
-            'item_seq': ['ITEM_SEQ', 'itemSeq', 'item_seq'],
-            'item_name': ['ITEM_NAME', 'itemName'],
-            'entp_seq': ['ENTP_SEQ', 'entpSeq'],
-            'entp_name': ['ENTP_NAME', 'entpName'],
-            'chart': ['CHART', 'chart'],
-            'item_image': ['ITEM_IMAGE', 'itemImage'],
-            'print_front': ['PRINT_FRONT', 'printFront'],
-            'print_back': ['PRINT_BACK', 'printBack'],
-            'drug_shape': ['DRUG_SHAPE', 'drugShape'],
-            'color_class1': ['COLOR_CLASS1', 'colorClass1', 'COLOR_CLASS', 'colorClass'],
-            'color_class2': ['COLOR_CLASS2', 'colorClass2'],
-            'line_front': ['LINE_FRONT', 'lineFront'],
-            'line_back': ['LINE_BACK', 'lineBack'],
-            'leng_long': ['LENG_LONG', 'lengLong'],
-            'leng_short': ['LENG_SHORT', 'lengShort'],
-            'thick': ['THICK', 'thick'],
-            'img_regist_ts': ['IMG_REGIST_TS', 'imgRegistTs'],
-            'class_no': ['CLASS_NO', 'classNo'],
-            'class_name': ['CLASS_NAME', 'className'],
-            'etc_otc_name': ['ETC_OTC_NAME', 'etcOtcName'],
-            'item_permit_date': ['ITEM_PERMIT_DATE', 'itemPermitDate'],
-            'form_code_name': ['FORM_CODE_NAME', 'formCodeName'],
-            'mark_code_front_anal': ['MARK_CODE_FRONT_ANAL', 'markCodeFrontAnal'],
-            'mark_code_back_anal': ['MARK_CODE_BACK_ANAL', 'markCodeBackAnal'],
-            'mark_code_front_img': ['MARK_CODE_FRONT_IMG', 'markCodeFrontImg'],
-            'mark_code_back_img': ['MARK_CODE_BACK_IMG', 'markCodeBackImg'],
-            'change_date': ['CHANGE_DATE', 'changeDate'],
-            'mark_code_front': ['MARK_CODE_FRONT', 'markCodeFront'],
-            'mark_code_back': ['MARK_CODE_BACK', 'markCodeBack'],
-            'item_eng_name': ['ITEM_ENG_NAME', 'itemEngName'],
-            'edi_code': ['EDI_CODE', 'ediCode']
-        },
-        '의약품성분약효정보': {
-            'div_nm': ['divNm', 'DIV_NM'],
-            'fomn_tp_nm': ['fomnTpNm', 'FOMN_TP_NM'],
-            'gnl_nm': ['gnlNm', 'GNL_NM'],
-            'gnl_nm_cd': ['gnlNmCd', 'GNL_NM_CD'],
-            'injc_pth_nm': ['injcPthNm', 'INJC_PTH_NM'],
-            'iqty_txt': ['iqtyTxt', 'IQTY_TXT'],
-            'meft_div_no': ['meftDivNo', 'MEFT_DIV_NO'],
-            'unit': ['unit', 'UNIT']
-        },
-        '성분별 1일 최대투여량 정보': {
-            'cpnt_cd': ['CPNT_CD', 'cpntCd'],
-            'drug_cpnt_kor_nm': ['DRUG_CPNT_KOR_NM', 'drugCpntKorNm'],
-            'drug_cpnt_eng_nm': ['DRUG_CPNT_ENG_NM', 'drugCpntEngNm'],
-            'foml_cd': ['FOML_CD', 'fomlCd'],
-            'foml_nm': ['FOML_NM', 'fomlNm'],
-            'dosage_route_code': ['DOSAGE_ROUTE_CODE', 'dosageRouteCode'],
-            'day_max_dosg_qy_unit': ['DAY_MAX_DOSG_QY_UNIT', 'dayMaxDosgQyUnit'],
-            'day_max_dosg_qy': ['DAY_MAX_DOSG_QY', 'dayMaxDosgQy']
-        }
-    }
-    
-    # 값 가져오기 함수
-    def get_field_value(data, field_key, api_key):
-        if api_key in field_mappings and field_key in field_mappings[api_key]:
-            for possible_field in field_mappings[api_key][field_key]:
-                if possible_field in data and data[possible_field] is not None:
-                    return data[possible_field]
-        return None
-    
     # 식별자 확인
     primary_identifier = None
     table_name = API_TABLE_MAPPING.get(api_key)
@@ -401,7 +576,7 @@ def insert_drug_data(drug_data, api_key=None):
     
     if not primary_identifier or not table_name:
         logger.warning(f"API {api_key}: 식별자 또는 테이블 매핑 없음 - 건너뜀")
-        if api_key and api_key in field_mappings:
+        if api_key and api_key in FIELD_MAPPINGS:
             available_fields = list(drug_data.keys())
             logger.debug(f"가용 필드: {available_fields}")
         return False
@@ -426,8 +601,8 @@ def insert_drug_data(drug_data, api_key=None):
                 update_parts = []
                 
                 # API에 따라 다른 필드 매핑 사용
-                if api_key in field_mappings:
-                    for db_field, api_fields in field_mappings[api_key].items():
+                if api_key in FIELD_MAPPINGS:
+                    for db_field, api_fields in FIELD_MAPPINGS[api_key].items():
                         value = get_field_value(drug_data, db_field, api_key)
                         if value is not None:
                             fields.append(db_field)
@@ -439,6 +614,12 @@ def insert_drug_data(drug_data, api_key=None):
                     logger.warning(f"API {api_key}: 유효한 필드 없음 - 건너뜀")
                     return False
                 
+                if content_hash is not None:
+                    fields.append('content_hash')
+                    values.append(content_hash)
+                    placeholders.append('%s')
+                    update_parts.append("content_hash = %s")
+                
                 if existing:
                     # 업데이트
                     id_val = existing['id']
@@ -482,10 +663,380 @@ def insert_drug_data(drug_data, api_key=None):
     
     return False
 
-def process_all_api_data():
-    """모든 API 데이터 처리"""
+def row_content_hash(row):
+    """컬럼 값 튜플의 내용 해시 (변경 감지용)"""
+    return hashlib.sha1(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+def upsert_drug_batch(items, api_key, resolver=None, skip_unchanged=False):
+    """페이지 항목 일괄 저장 (INSERT ... ON DUPLICATE KEY UPDATE, executemany)
+
+    연결 1개, 트랜잭션 1개로 페이지 전체를 저장한다. 응답에 없는 필드는 기존 값을 유지한다.
+    데이터 오류로 일괄 저장이 실패하면 항목별 저장(insert_drug_data)으로 다시 처리하여
+    문제 있는 항목만 제외한다.
+
+    각 행에 응답 내용 해시(content_hash)를 함께 저장한다. skip_unchanged 이면 저장 전에
+    식별자별 기존 해시를 한 번에 조회하여 내용이 같은 행은 기록하지 않는다.
+
+    Args:
+        resolver: 같은 API 의 이전 페이지에서 쓰던 FieldResolver (없으면 이 페이지로 새로 결정)
+        skip_unchanged: 내용 해시가 같은 행은 기록하지 않음 (증분 동기화)
+
+    Returns:
+        (기록한 항목 수, 변경 없어 건너뛴 항목 수)
+    """
+    table_name = API_TABLE_MAPPING.get(api_key)
+    id_field = API_ID_FIELDS.get(api_key)
+    if not table_name or not id_field:
+        logger.warning(f"API {api_key}: 식별자 또는 테이블 매핑 없음 - 건너뜀")
+        return 0, 0
+    
+    if resolver is None:
+        resolver = FieldResolver(api_key)
+    columns = resolver.columns
+    id_index = columns.index(id_field)
+    rows = []
+    valid_items = []
+    for item in items:
+        row = resolver.row(item)
+        if not row[id_index]:
+            logger.warning(f"API {api_key}: 식별자 없음 - 건너뜀")
+            logger.debug(f"가용 필드: {list(item.keys())}")
+            continue
+        rows.append(row + (row_content_hash(row),))
+        valid_items.append(item)
+    
+    if not rows:
+        return 0, 0
+    
+    skipped = 0
+    if skip_unchanged:
+        rows, valid_items, skipped = filter_unchanged_rows(table_name, id_field, id_index, rows, valid_items)
+        if not rows:
+            return 0, skipped
+    
+    upsert_sql = (
+        f"INSERT INTO {table_name} ({', '.join(columns)}, content_hash) "
+        f"VALUES ({', '.join(['%s'] * (len(columns) + 1))}) "
+        f"ON DUPLICATE KEY UPDATE "
+        + ', '.join(f"{column} = COALESCE(VALUES({column}), {column})" for column in columns if column != id_field)
+        + ", content_hash = VALUES(content_hash), updated_at = CURRENT_TIMESTAMP"
+    )
+    relation_sql = (
+        f"INSERT INTO drug_relation ({id_field}) VALUES (%s) "
+        f"ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP"
+    )
+    
+    retry_delay = 1
+    for attempt in range(BATCH_MAX_RETRIES):
+        conn = db_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.executemany(upsert_sql, rows)
+                cursor.executemany(relation_sql, [(row[id_index],) for row in rows])
+            conn.commit()
+            return len(rows), skipped
+        except pymysql.err.OperationalError as e:
+            conn.rollback()
+            logger.error(f"일괄 저장 오류 (시도 {attempt+1}/{BATCH_MAX_RETRIES}): {e}")
+            if attempt < BATCH_MAX_RETRIES - 1:
+                time.sleep(retry_delay)
+        except Exception as e:
+            conn.rollback()
+            logger.warning(f"API {api_key}: 일괄 저장 실패, 항목별 저장으로 전환: {e}")
+            break
+        finally:
+            conn.close()
+    
+    # 행의 마지막 값이 content_hash
+    return sum(
+        1 for item, row in zip(valid_items, rows) if insert_drug_data(item, api_key, content_hash=row[-1])
+    ), skipped
+
+def filter_unchanged_rows(table_name, id_field, id_index, rows, items):
+    """저장된 content_hash 와 같은 행 제외 → (rows, items, 제외한 수)
+
+    조회에 실패하면 모든 행을 기록 대상으로 남긴다.
+    """
+    identifiers = [row[id_index] for row in rows]
+    conn = db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"SELECT {id_field}, content_hash FROM {table_name} "
+                f"WHERE {id_field} IN ({', '.join(['%s'] * len(identifiers))})",
+                identifiers
+            )
+            stored = {row[id_field]: row['content_hash'] for row in cursor.fetchall()}
+    except Exception as e:
+        logger.warning(f"{table_name}: 기존 내용 해시 조회 실패, 전체 기록: {e}")
+        return rows, items, 0
+    finally:
+        conn.close()
+    
+    changed_rows = []
+    changed_items = []
+    for row, item in zip(rows, items):
+        if stored.get(row[id_index]) != row[-1]:
+            changed_rows.append(row)
+            changed_items.append(item)
+    return changed_rows, changed_items, len(rows) - len(changed_rows)
+
+class SyncReport:
+    """API 별 동기화 실행 결과 집계"""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.pages_fetched = 0
+        self.pages_failed = 0
+        self.rows_changed = 0
+        self.rows_skipped = 0
+        self.rows_failed = 0
+
+    def as_dict(self):
+        return {
+            'pages_fetched': self.pages_fetched,
+            'pages_failed': self.pages_failed,
+            'rows_changed': self.rows_changed,
+            'rows_skipped': self.rows_skipped,
+            'rows_failed': self.rows_failed
+        }
+
+def load_last_success(api_key):
+    """API 의 마지막 동기화 성공 시각 (없으면 None)"""
+    conn = db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT last_success_at FROM sync_state WHERE api_name = %s", (api_key,))
+            row = cursor.fetchone()
+            return row['last_success_at'] if row else None
+    except Exception as e:
+        logger.error(f"동기화 상태 조회 오류 ({api_key}): {e}")
+        return None
+    finally:
+        conn.close()
+
+def record_sync_state(report, mode, started_at, succeeded):
+    """동기화 결과 저장 (모든 페이지를 처리한 경우에만 마지막 성공 시각 갱신)"""
+    conn = db_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO sync_state (api_name, mode, last_started_at, last_success_at, pages_fetched, "
+                "pages_failed, rows_changed, rows_skipped, rows_failed) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) "
+                "ON DUPLICATE KEY UPDATE mode = VALUES(mode), last_started_at = VALUES(last_started_at), "
+                "last_success_at = COALESCE(VALUES(last_success_at), last_success_at), "
+                "pages_fetched = VALUES(pages_fetched), pages_failed = VALUES(pages_failed), "
+                "rows_changed = VALUES(rows_changed), rows_skipped = VALUES(rows_skipped), "
+                "rows_failed = VALUES(rows_failed)",
+                (report.api_key, mode, started_at, started_at if succeeded else None,
+                 report.pages_fetched, report.pages_failed, report.rows_changed,
+                 report.rows_skipped, report.rows_failed)
+            )
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"동기화 상태 저장 오류 ({report.api_key}): {e}")
+    finally:
+        conn.close()
+
+def log_sync_report(reports, mode):
+    """실행 결과 표 출력"""
+    logger.info(f"동기화 결과 ({mode})")
+    logger.info(f"{'API':<28}{'페이지':>8}{'실패':>6}{'변경':>8}{'건너뜀':>8}{'저장실패':>8}")
+    for report in reports.values():
+        logger.info(
+            f"{report.api_key:<28}{report.pages_fetched:>8}{report.pages_failed:>6}"
+            f"{report.rows_changed:>8}{report.rows_skipped:>8}{report.rows_failed:>8}"
+        )
+
+class PageCheckpoint:
+    """순서와 무관하게 완료되는 페이지의 체크포인트 관리
+
+    완료된 페이지를 모아 두고, 앞에서부터 연속으로 완료된 지점(워터마크)
+    다음 페이지를 재시작 위치로 저장한다. 워터마크 뒤에서 먼저 끝난 페이지는
+    재시작 시 다시 처리되며, 저장은 식별자 기준 갱신이므로 중복되지 않는다.
+
+    resume 이 주어지면 (앞쪽 API 가 아직 끝나지 않은 경우) 워터마크 대신
+    그 (API, 페이지) 를 재시작 위치로 저장하고 실패 목록만 갱신한다.
+    """
+
+    def __init__(self, api_key, start_page, processed_count, failed_pages, resume=None):
+        self.api_key = api_key
+        self.next_page = start_page
+        self.processed_count = processed_count
+        self.failed_pages = failed_pages
+        self.resume = resume
+        self._completed = set()
+
+    def complete(self, page_no, item_count, failed=False):
+        """페이지 처리 완료 기록 후 워터마크나 실패 목록이 바뀌었으면 체크포인트 저장"""
+        self.processed_count += item_count
+        failed_list = self.failed_pages.setdefault(self.api_key, [])
+        changed = False
+        if failed and page_no not in failed_list:
+            failed_list.append(page_no)
+            changed = True
+        elif not failed and page_no in failed_list:
+            failed_list.remove(page_no)
+            changed = True
+        if not failed_list:
+            self.failed_pages.pop(self.api_key, None)
+
+        # 워터마크 앞의 페이지(이전 실행의 실패 페이지 재시도)는 실패 목록만 갱신
+        if page_no >= self.next_page:
+            self._completed.add(page_no)
+        while self.next_page in self._completed:
+            self._completed.discard(self.next_page)
+            self.next_page += 1
+            changed = True
+        if changed:
+            self.save()
+
+    def save(self):
+        api_key, page_no = self.resume or (self.api_key, self.next_page)
+        save_checkpoint(api_key, page_no, self.processed_count, self.failed_pages)
+
+def write_page_items(api_key, page_no, total_pages, items, resolver=None, report=None, skip_unchanged=False):
+    """DB 기록 단계: 페이지 항목 일괄 저장 후 저장 성공 수 (변경 없어 건너뛴 항목 포함) 반환"""
+    if report is not None:
+        report.pages_fetched += 1
+    if not items:
+        return 0
+    
+    last_item = items[-1]
+    item_name = last_item.get('itemName', '') or last_item.get('ITEM_NAME', '') or last_item.get('gnlNm', '') or last_item.get('DRUG_CPNT_KOR_NM', '') or f"항목 {len(items)}"
+    
+    # 컬러 로그
+    logger.info(format_api_log(api_key, page_no, total_pages, len(items), len(items), item_name))
+    
+    changed, skipped = upsert_drug_batch(items, api_key, resolver, skip_unchanged)
+    page_success = changed + skipped
+    if report is not None:
+        report.rows_changed += changed
+        report.rows_skipped += skipped
+        report.rows_failed += len(items) - page_success
+    
+    logger.info(f"API {api_key}: 페이지 {page_no} - {page_success}/{len(items)} 항목 저장 완료 (변경 {changed}, 건너뜀 {skipped})")
+    return page_success
+
+def bump_if_changed(report):
+    """API 처리가 끝난 뒤 변경된 행이 있으면 데이터 버전 증가 (한 번만)
+
+    버전이 바뀔 때마다 웹 애플리케이션이 캐시를 비우고 검색 색인을 다시 만들므로
+    페이지마다 올리지 않는다.
+    """
+    if report.rows_changed:
+        bump_data_version(API_TABLE_MAPPING[report.api_key])
+
+def run_page_pipeline(api_key, page_numbers, total_pages, checkpoint, limiter, first_page=None,
+                      report=None, skip_unchanged=False):
+    """페이지 가져오기 → 파싱 → DB 기록 파이프라인
+
+    - 가져오기: LOAD_FETCH_WORKERS 개 스레드, 토큰 버킷으로 초당 요청 수 제한
+    - 파싱: 스레드 1개 (응답 본문 → 항목 목록)
+    - DB 기록: 호출 스레드 (기록하는 동안 다음 페이지를 계속 받아 둠)
+    단계 사이는 크기 제한 대기열로 연결되어 DB 가 느리면 가져오기도 멈춘다.
+
+    Args:
+        report: 페이지/행 처리 결과를 집계할 SyncReport
+        skip_unchanged: 내용 해시가 같은 행은 기록하지 않음 (증분 동기화)
+
+    Returns:
+        저장 성공 항목 수
+    """
+    page_queue = queue.Queue()
+    parse_queue = queue.Queue(maxsize=LOAD_QUEUE_SIZE)
+    write_queue = queue.Queue(maxsize=LOAD_QUEUE_SIZE)
+    done = object()
+    worker_count = max(1, min(LOAD_FETCH_WORKERS, len(page_numbers)))
+    
+    for page_no in page_numbers:
+        page_queue.put(page_no)
+    for _ in range(worker_count):
+        page_queue.put(done)
+    
+    def fetch_worker():
+        while True:
+            page_no = page_queue.get()
+            if page_no is done:
+                parse_queue.put(done)
+                return
+            content = None
+            try:
+                limiter.acquire()
+                content = fetch_drug_data(api_key, page_no=page_no, num_of_rows=PAGE_SIZE, parse=False)
+            except Exception as e:
+                logger.error(f"API {api_key}: 페이지 {page_no} 가져오기 오류: {e}")
+            parse_queue.put((page_no, content))
+    
+    def parse_worker():
+        finished_workers = 0
+        while finished_workers < worker_count:
+            entry = parse_queue.get()
+            if entry is done:
+                finished_workers += 1
+                continue
+            page_no, content = entry
+            page_data = None
+            if content is not None:
+                try:
+                    page_data = parse_drug_page(api_key, page_no, PAGE_SIZE, content)
+                except ET.ParseError as e:
+                    logger.error(f"API {api_key}: 페이지 {page_no} XML 파싱 오류: {e}")
+            write_queue.put((page_no, page_data))
+        write_queue.put(done)
+    
+    threads = [threading.Thread(target=fetch_worker, name=f"fetch-{i}", daemon=True) for i in range(worker_count)]
+    threads.append(threading.Thread(target=parse_worker, name="parse", daemon=True))
+    for thread in threads:
+        thread.start()
+    
+    success_count = 0
+    # 응답 필드명은 API 안에서 같으므로 첫 페이지에서 한 번만 결정
+    resolver = FieldResolver(api_key)
+    
+    # 총 페이지 수 확인용으로 이미 받은 첫 페이지는 바로 기록
+    if first_page is not None:
+        page_no, page_data = first_page
+        success_count += write_page_items(
+            api_key, page_no, total_pages, page_data['items'], resolver, report, skip_unchanged
+        )
+        checkpoint.complete(page_no, len(page_data['items']))
+    
+    while True:
+        entry = write_queue.get()
+        if entry is done:
+            break
+        page_no, page_data = entry
+        if page_data is None:
+            logger.error(f"API {api_key}: 페이지 {page_no} 데이터 가져오기 실패, 재시작 시 다시 시도")
+            if report is not None:
+                report.pages_failed += 1
+            checkpoint.complete(page_no, 0, failed=True)
+            continue
+        success_count += write_page_items(
+            api_key, page_no, total_pages, page_data['items'], resolver, report, skip_unchanged
+        )
+        checkpoint.complete(page_no, len(page_data['items']))
+    
+    for thread in threads:
+        thread.join()
+    return success_count
+
+def process_all_api_data(incremental=False):
+    """모든 API 데이터 처리 (페이지 가져오기/파싱/DB 기록 파이프라인)
+
+    Args:
+        incremental: 증분 동기화 - 저장된 내용 해시와 같은 행은 기록하지 않음
+
+    Returns:
+        {API 키: SyncReport}
+    """
+    mode = 'incremental' if incremental else 'full'
+    reports = {}
     # 체크포인트 로드
-    checkpoint = load_checkpoint()
+    checkpoint_data = load_checkpoint()
     
     # 처리할 API 목록 - 새로운 테이블 구조에 맞는 API만 처리
     api_keys = list(API_TABLE_MAPPING.keys())
@@ -494,151 +1045,135 @@ def process_all_api_data():
     start_api_idx = 0
     start_page = 1
     processed_count = 0
+    failed_pages = {}
     
-    if checkpoint:
+    if checkpoint_data:
         # 이전에 처리 중이던 API 찾기
-        if checkpoint['api_key'] in api_keys:
-            start_api_idx = api_keys.index(checkpoint['api_key'])
-            start_page = checkpoint['page_no']
-            processed_count = checkpoint['processed_count']
-            logger.info(f"체크포인트에서 다시 시작: API={checkpoint['api_key']}, 페이지={start_page}, 처리항목={processed_count}")
+        if checkpoint_data['api_key'] in api_keys:
+            start_api_idx = api_keys.index(checkpoint_data['api_key'])
+            start_page = checkpoint_data['page_no']
+            processed_count = checkpoint_data['processed_count']
+            failed_pages = checkpoint_data.get('failed_pages') or {}
+            logger.info(f"체크포인트에서 다시 시작: API={checkpoint_data['api_key']}, 페이지={start_page}, 처리항목={processed_count}")
     
-    total_processed = processed_count
+    # 모든 페이지 요청이 공유하는 속도 제한
+    limiter = TokenBucket(LOAD_REQUEST_RATE, max(1, LOAD_FETCH_WORKERS))
     success_count = 0
+    total_processed = processed_count
+    # 마지막으로 진행한 (API, 워터마크) - 실패 페이지만 남았을 때 재시작 위치
+    last_position = (api_keys[start_api_idx], start_page)
+    # 첫 페이지부터 가져오지 못해 처음부터 다시 해야 하는 가장 앞쪽 (API, 페이지)
+    resume = None
+    
+    # 이전 API 에서 실패한 페이지 다시 시도 (재시작 위치는 체크포인트 그대로 유지)
+    for api_key in api_keys[:start_api_idx]:
+        retry_pages = sorted(failed_pages.get(api_key, []))
+        if not retry_pages:
+            continue
+        logger.info(f"API {api_key}: 이전 실패 페이지 {len(retry_pages)}개 다시 시도")
+        report = reports[api_key] = SyncReport(api_key)
+        checkpoint = PageCheckpoint(api_key, retry_pages[0], total_processed, failed_pages, resume=last_position)
+        success_count += run_page_pipeline(
+            api_key, retry_pages, None, checkpoint, limiter,
+            report=report, skip_unchanged=incremental
+        )
+        total_processed = checkpoint.processed_count
+        bump_if_changed(report)
     
     # API 순회
     for api_idx in range(start_api_idx, len(api_keys)):
         current_api = api_keys[api_idx]
-        logger.info(f"API {current_api} 처리 시작")
+        logger.info(f"API {current_api} 처리 시작 ({mode})")
+        if incremental:
+            logger.info(f"API {current_api}: 마지막 동기화 성공 {load_last_success(current_api) or '기록 없음'}")
         
-        # 첫 페이지 가져오기
         current_page = start_page if api_idx == start_api_idx else 1
+        report = reports[current_api] = SyncReport(current_api)
+        started_at = time.strftime('%Y-%m-%d %H:%M:%S')
         
-        # 첫 페이지 로드
-        first_page_data = fetch_drug_data(current_api, page_no=current_page, num_of_rows=100)
+        # 첫 페이지 로드 (전체 페이지 수 확인)
+        limiter.acquire()
+        first_page_data = fetch_drug_data(current_api, page_no=current_page, num_of_rows=PAGE_SIZE)
         if not first_page_data:
-            logger.error(f"API {current_api}에서 첫 페이지 로드 실패, 다음 API로 이동")
+            logger.error(f"API {current_api}에서 첫 페이지 로드 실패, 다음 API로 이동 (재시작 시 이 페이지부터 다시 처리)")
+            report.pages_failed += 1
+            # 전체 페이지 수를 모르므로 재시작 위치를 이 API 로 고정하고 실패 페이지로 기록
+            if resume is None:
+                resume = (current_api, current_page)
+            PageCheckpoint(current_api, current_page, total_processed, failed_pages, resume).complete(
+                current_page, 0, failed=True
+            )
+            record_sync_state(report, mode, started_at, succeeded=False)
             continue
         
         total_count = first_page_data['total_count']
-        total_pages = (total_count + 99) // 100  # 올림 나눗셈
+        total_pages = (total_count + PAGE_SIZE - 1) // PAGE_SIZE  # 올림 나눗셈
         
         logger.info(f"API {current_api}: 총 {total_count}개 항목, {total_pages}개 페이지")
+        if first_page_data['items']:
+            logger.info(f"API {current_api}: 응답 필드: {list(first_page_data['items'][0].keys())}")
         
-        # 첫 페이지 처리
-        api_success_count = 0
-        
-        # 첫 페이지부터 처리
-        logger.info(f"API {current_api}: 페이지 {current_page}/{total_pages} 처리 중...")
-
-        page_data = first_page_data
-        
-        for i, item in enumerate(page_data['items']):
-            item_name = item.get('itemName', '') or item.get('ITEM_NAME', '') or item.get('gnlNm', '') or item.get('DRUG_CPNT_KOR_NM', '') or f"항목 {i+1}"
-            
-            # 기존 로그 출력 유지
-            logger.info(f"항목 {i+1}/{len(page_data['items'])} 처리 중: {item_name}")
-            
-            # 새로운 컬러 로그 추가
-            colored_log = format_api_log(
-                current_api, 
-                current_page, 
-                total_pages, 
-                i+1, 
-                len(page_data['items']), 
-                item_name
-            )
-            logger.info(colored_log)
-            
-            # 필드 확인 로깅 추가
-            if i == 0:  # 각 페이지의 첫 항목에 대해서만
-                logger.info(f"API {current_api}: 응답 필드: {list(item.keys())}")
-            
-            if insert_drug_data(item, current_api):
-                api_success_count += 1
-                success_count += 1
-            
-            total_processed += 1
-            
-            # 주기적으로 체크포인트 저장
-            if total_processed % 10 == 0:
-                save_checkpoint(current_api, current_page, total_processed)
+        # 이전 실행에서 실패한 페이지 + 남은 페이지
+        retry_pages = [page for page in failed_pages.get(current_api, []) if page < current_page]
+        page_numbers = sorted(retry_pages) + list(range(current_page + 1, total_pages + 1))
         
-        logger.info(f"API {current_api}: 페이지 {current_page} - {api_success_count}/{len(first_page_data['items'])} 항목 저장 완료")
-        
-        # 나머지 페이지 처리
-        for page_no in range(current_page + 1, total_pages + 1):
-            logger.info(f"API {current_api}: 페이지 {page_no}/{total_pages} 처리 중...")
-            
-            # 페이지 데이터 가져오기
-            page_data = fetch_drug_data(current_api, page_no=page_no, num_of_rows=100)
-            if not page_data:
-                logger.error(f"API {current_api}: 페이지 {page_no} 데이터 가져오기 실패, 다음 페이지로 이동")
-                # 체크포인트 업데이트
-                save_checkpoint(current_api, page_no, total_processed)
-                continue
-            
-            # 페이지 항목 처리
-            page_success = 0
-            for i, item in enumerate(page_data['items']):
-                item_name = item.get('itemName', '') or item.get('ITEM_NAME', '') or item.get('gnlNm', '') or item.get('DRUG_CPNT_KOR_NM', '') or f"항목 {i+1}"
-                logger.info(f"항목 {i+1}/{len(page_data['items'])} 처리 중: {item_name}")
-                
-                # 컬러 로그 추가
-                colored_log = format_api_log(
-                    current_api, 
-                    page_no, 
-                    total_pages, 
-                    i+1, 
-                    len(page_data['items']), 
-                    item_name
-                )
-                logger.info(colored_log)
-                
-                if insert_drug_data(item, current_api):
-                    page_success += 1
-                    api_success_count += 1
-                    success_count += 1
-                
-                total_processed += 1
-                
-                # 주기적으로 체크포인트 저장
-                if total_processed % 10 == 0:
-                    save_checkpoint(current_api, page_no, total_processed)
-            
-            logger.info(f"API {current_api}: 페이지 {page_no} - {page_success}/{len(page_data['items'])} 항목 저장 완료")
-            
-            # 페이지 완료 후 체크포인트 업데이트
-            save_checkpoint(current_api, page_no + 1, total_processed)
-            
-            # API 요청 간 짧은 지연
-            time.sleep(0.5)
+        checkpoint = PageCheckpoint(current_api, current_page, total_processed, failed_pages, resume)
+        api_success_count = run_page_pipeline(
+            current_api, page_numbers, total_pages, checkpoint, limiter,
+            first_page=(current_page, first_page_data),
+            report=report, skip_unchanged=incremental
+        )
+        success_count += api_success_count
+        total_processed = checkpoint.processed_count
+        last_position = (current_api, checkpoint.next_page)
+        bump_if_changed(report)
         
         # API 완료 후 로깅
         logger.info(f"API {current_api} 처리 완료: 총 {api_success_count}/{total_count} 항목 저장")
         
+        # 체크포인트에서 이어서 처리한 경우는 이번 실행에서 전체를 처리한 것이 아니므로 성공 시각 유지
+        succeeded = current_page == 1 and current_api not in failed_pages
+        record_sync_state(report, mode, started_at, succeeded)
+        
         # 다음 API로 이동할 때 체크포인트 업데이트
         if api_idx < len(api_keys) - 1:
-            save_checkpoint(api_keys[api_idx + 1], 1, total_processed)
-        
-        # API 간 지연
-        time.sleep(1)
+            next_api, next_page = resume or (api_keys[api_idx + 1], 1)
+            save_checkpoint(next_api, next_page, total_processed, failed_pages)
     
-    # 모든 처리 완료 후 체크포인트 파일 제거
-    if os.path.exists(CHECKPOINT_FILE):
+    # 실패한 페이지가 없으면 체크포인트 파일 제거 (있으면 다음 실행에서 다시 시도)
+    if failed_pages:
+        resume_api, resume_page = resume or last_position
+        save_checkpoint(resume_api, resume_page, total_processed, failed_pages)
+        logger.warning(f"가져오기 실패 페이지가 남아 있습니다: {failed_pages}")
+    elif os.path.exists(CHECKPOINT_FILE):
         os.remove(CHECKPOINT_FILE)
     
     logger.info(f"모든 API 처리 완료: 총 {success_count}/{total_processed} 항목 저장 성공")
+    log_sync_report(reports, mode)
+    return reports
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='공공데이터 의약품 정보 적재')
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help='증분 동기화 (저장된 내용 해시와 같은 행은 기록하지 않음)'
+    )
+    parser.add_argument(
+        '--dedupe-unique-keys', action='store_true',
+        help='UNIQUE KEY 가 없는 기존 테이블의 중복 식별자 행을 가장 오래된 행으로 합친 뒤 키 추가'
+    )
+    return parser.parse_args()
 
 def main():
     """메인 함수"""
+    args = parse_args()
     logger.info("데이터 로드 시작")
     
     # 데이터베이스 테이블 확인/생성
-    ensure_tables_exist()
+    ensure_tables_exist(dedupe_unique_keys=args.dedupe_unique_keys)
     
     # 모든 API 데이터 처리
-    process_all_api_data()
+    process_all_api_data(incremental=args.incremental)
     
     logger.info("데이터 로드 완료")
 
@@ -0,0 +1,189 @@
+import argparse
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+# 웹 애플리케이션과 DUR 테이블 정의를 공유하기 위해 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from api_client import get_api_client
+from api_xml import parse_api_items
+from dur_store import DUR_API_BASE_URL, DUR_COLUMNS, DUR_ENDPOINTS, DUR_TABLE_DDL, normalize_dur_item
+from load_drug_data import API_KEY, bump_data_version, db_connection, logger
+
+# 페이지당 항목 수 (API 최대값)
+DUR_PAGE_SIZE = 100
+
+# 동기화 중 내려받은 데이터를 모아두는 테이블 (완료 후 dur_info 로 교체)
+STAGING_TABLE = 'dur_info_staging'
+
+
+def fetch_dur_page(dur_type, page_no, num_of_rows=DUR_PAGE_SIZE):
+    """DUR API 한 페이지 조회 (공용 API 클라이언트의 속도 제한/재시도 사용)
+
+    Returns:
+        {'items': [...], 'total_count': int} 또는 실패 시 None
+    """
+    url = f"{DUR_API_BASE_URL}/{DUR_ENDPOINTS[dur_type]}"
+    params = {
+        'serviceKey': API_KEY,
+        'pageNo': page_no,
+        'numOfRows': num_of_rows,
+        'type': 'xml'
+    }
+
+    # 429/5xx 및 네트워크 오류는 클라이언트가 재시도하고, 그래도 실패하면 None
+    response = get_api_client().get('dur_info', url, params=params)
+    if response is None:
+        logger.error(f"DUR API 요청 실패: DUR {dur_type}, 페이지 {page_no}")
+        return None
+    if response.status_code != 200:
+        logger.error(f"DUR API 요청 실패 ({dur_type}): 상태 코드 {response.status_code}, 페이지 {page_no}")
+        return None
+
+    try:
+        parsed = parse_api_items(response.content)
+    except ET.ParseError as e:
+        logger.error(f"DUR API 응답 파싱 오류 ({dur_type}): {e}, 페이지 {page_no}")
+        return None
+
+    if parsed['result_code'] is not None and parsed['result_code'] != '00':
+        result_msg = parsed['result_msg'] or '알 수 없는 오류'
+        logger.error(f"DUR API 오류 ({dur_type}): {parsed['result_code']} - {result_msg}")
+        return None
+
+    return {'items': parsed['items'], 'total_count': parsed['total_count']}
+
+
+def ensure_dur_tables(conn):
+    """dur_info 및 스테이징 테이블 생성"""
+    with conn.cursor() as cursor:
+        cursor.execute(DUR_TABLE_DDL)
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {STAGING_TABLE} LIKE dur_info")
+    conn.commit()
+
+
+def sync_dur_type(conn, dur_type):
+    """DUR 유형 하나를 전체 내려받아 dur_info 의 해당 유형 행을 교체
+
+    모든 페이지를 받은 경우에만 교체하므로, 중간에 실패하면 기존 데이터가 유지된다.
+
+    Returns:
+        저장한 행 수 또는 실패 시 None
+    """
+    column_list = ', '.join(DUR_COLUMNS)
+    insert_sql = (
+        f"INSERT INTO {STAGING_TABLE} ({column_list}) "
+        f"VALUES ({', '.join(['%s'] * len(DUR_COLUMNS))})"
+    )
+
+    with conn.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {STAGING_TABLE} WHERE dur_type = %s", (dur_type,))
+    conn.commit()
+
+    page_no = 1
+    total_pages = 1
+    saved = 0
+    while page_no <= total_pages:
+        page = fetch_dur_page(dur_type, page_no)
+        if page is None:
+            logger.error(f"DUR {dur_type} 동기화 중단 (페이지 {page_no}), 기존 데이터 유지")
+            return None
+
+        total_pages = max(1, (page['total_count'] + DUR_PAGE_SIZE - 1) // DUR_PAGE_SIZE)
+        rows = [normalize_dur_item(dur_type, item) for item in page['items']]
+        if rows:
+            with conn.cursor() as cursor:
+                cursor.executemany(insert_sql, rows)
+            conn.commit()
+            saved += len(rows)
+
+        logger.info(f"DUR {dur_type} - 페이지 {page_no}/{total_pages} - 누적 {saved}건")
+        page_no += 1
+
+    # 한 트랜잭션으로 교체 (조회 중인 웹 요청은 교체 전/후 데이터 중 하나만 보게 됨)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM dur_info WHERE dur_type = %s", (dur_type,))
+            cursor.execute(
+                f"INSERT INTO dur_info ({column_list}) "
+                f"SELECT {column_list} FROM {STAGING_TABLE} WHERE dur_type = %s",
+                (dur_type,)
+            )
+            cursor.execute(f"DELETE FROM {STAGING_TABLE} WHERE dur_type = %s", (dur_type,))
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"DUR {dur_type} 교체 오류: {e}")
+        return None
+
+    return saved
+
+
+def sync_all(dur_types):
+    """지정한 DUR 유형 전체 동기화"""
+    conn = db_connection()
+    results = {}
+    try:
+        ensure_dur_tables(conn)
+        for dur_type in dur_types:
+            started = time.time()
+            saved = sync_dur_type(conn, dur_type)
+            results[dur_type] = saved
+            if saved is not None:
+                logger.info(f"DUR {dur_type} 동기화 완료: {saved}건, {time.time() - started:.1f}초")
+    finally:
+        conn.close()
+
+    stats = get_api_client().stats()['endpoints'].get('dur_info')
+    if stats:
+        logger.info(
+            f"DUR API 요청 {stats['requests']}회, 평균 {stats['avg_latency']:.2f}초, "
+            f"재시도 {stats['retries']}회, 오류 {stats['errors']}"
+        )
+
+    if any(saved is not None for saved in results.values()):
+        bump_data_version('dur_info')
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='DUR 데이터 로컬 동기화')
+    parser.add_argument(
+        '--types', default=','.join(DUR_ENDPOINTS),
+        help=f"동기화할 DUR 유형 (쉼표 구분, 기본: 전체 - {', '.join(DUR_ENDPOINTS)})"
+    )
+    parser.add_argument(
+        '--interval', type=float, default=0,
+        help='반복 주기 (시간, 0 이면 한 번만 실행)'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    dur_types = [dur_type.strip() for dur_type in args.types.split(',') if dur_type.strip()]
+    unknown = [dur_type for dur_type in dur_types if dur_type not in DUR_ENDPOINTS]
+    if unknown:
+        logger.error(f"알 수 없는 DUR 유형: {', '.join(unknown)}")
+        sys.exit(1)
+
+    while True:
+        logger.info(f"DUR 동기화 시작: {', '.join(dur_types)}")
+        results = sync_all(dur_types)
+        failed = [dur_type for dur_type, saved in results.items() if saved is None]
+        if failed:
+            logger.warning(f"DUR 동기화 실패 유형: {', '.join(failed)}")
+        logger.info("DUR 동기화 종료")
+
+        if not args.interval:
+            break
+        logger.info(f"{args.interval}시간 후 다시 동기화합니다.")
+        time.sleep(args.interval * 3600)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import threading
+import time
+import logging
+
+from db_pool import get_pool
+
+logger = logging.getLogger('app')
+
+# data_version 테이블 확인 주기 (초)
+DATA_VERSION_CHECK_INTERVAL = 5
+
+
+class DataVersionTracker:
+    """로더가 갱신하는 data_version 테이블을 주기적으로 확인하여 캐시 무효화
+
+    로더(data/data_load/load_drug_data.py)는 테이블에 행을 기록할 때마다
+    data_version.version 을 증가시킨다. 버전이 바뀌면 등록된 리스너를 호출한다.
+    """
+
+    def __init__(self, check_interval=DATA_VERSION_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._versions = {}
+        self._checked_at = 0.0
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self._table_missing_logged = False
+
+    def on_change(self, table_name, callback):
+        """테이블 버전이 바뀌었을 때 호출할 함수 등록"""
+        self._listeners.setdefault(table_name, []).append(callback)
+
+    def _load_versions(self, conn):
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT table_name, version FROM data_version")
+                return {row['table_name']: row['version'] for row in cursor.fetchall()}
+        except Exception as e:
+            if not self._table_missing_logged:
+                logger.warning(f"data_version 테이블 조회 실패, 버전 0 으로 간주: {e}")
+                self._table_missing_logged = True
+            return {}
+
+    def refresh(self, conn=None, force=False):
+        """확인 주기가 지났으면 버전을 다시 읽고 변경된 테이블의 리스너 호출"""
+        now = time.time()
+        if not force and now - self._checked_at < self.check_interval:
+            return
+        with self._lock:
+            if not force and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+
+        if conn is None:
+            with get_pool().connection() as pooled_conn:
+                versions = self._load_versions(pooled_conn)
+        else:
+            versions = self._load_versions(conn)
+
+        with self._lock:
+            previous = self._versions
+            self._versions = versions
+
+        for table_name, callbacks in self._listeners.items():
+            if previous.get(table_name, 0) != versions.get(table_name, 0):
+                logger.info(f"{table_name} 데이터 변경 감지 (버전 {versions.get(table_name, 0)}), 캐시 무효화")
+                for callback in callbacks:
+                    try:
+                        callback()
+                    except Exception as e:
+                        logger.error(f"캐시 무효화 오류 ({table_name}): {e}")
+
+    def version(self, table_name, conn=None):
+        """테이블의 현재 데이터 버전"""
+        self.refresh(conn)
+        return self._versions.get(table_name, 0)
+
+
+data_versions = DataVersionTracker()
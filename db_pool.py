@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
+
+import pymysql
+from pymysql.cursors import DictCursor
+from flask import g
+
+logger = logging.getLogger('app')
+
+
+class PoolTimeoutError(Exception):
+    """커넥션 풀에서 제한 시간 내에 연결을 얻지 못한 경우"""
+
+
+class ConnectionPool:
+    """pymysql 커넥션 풀
+
+    - max_size: 동시에 열 수 있는 최대 연결 수
+    - recycle: 생성 후 이 시간(초)이 지난 연결은 폐기 후 재생성
+    - health_check_interval: 이 시간(초) 이상 유휴 상태였던 연결은 대여 전에 ping 확인
+    - checkout_timeout: 연결 대여 대기 최대 시간(초)
+    """
+
+    def __init__(self, connect_kwargs, max_size=10, recycle=3600,
+                 health_check_interval=30, checkout_timeout=10):
+        self.connect_kwargs = connect_kwargs
+        self.max_size = max_size
+        self.recycle = recycle
+        self.health_check_interval = health_check_interval
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = deque()  # (conn, created_at, last_used)
+        self._created_at = {}  # id(conn) -> 생성 시각
+        self._size = 0
+        self._cond = threading.Condition()
+
+        self._stats = {
+            'connections_created': 0,
+            'connections_recycled': 0,
+            'health_check_failures': 0,
+            'checkouts': 0,
+            'checkout_timeouts': 0,
+            'checkout_wait_total': 0.0,
+            'checkout_wait_max': 0.0,
+            'hold_time_total': 0.0,
+            'hold_time_max': 0.0
+        }
+
+    def _record(self, key, value=1, max_key=None):
+        """지표 누적 (max_key 가 있으면 최대값도 갱신)"""
+        with self._cond:
+            self._stats[key] += value
+            if max_key:
+                self._stats[max_key] = max(self._stats[max_key], value)
+
+    def _connect(self):
+        conn = pymysql.connect(**self.connect_kwargs)
+        self._created_at[id(conn)] = time.time()
+        self._record('connections_created')
+        return conn
+
+    def _discard(self, conn):
+        """연결을 닫고 풀 크기에서 제외"""
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _is_usable(self, conn, created_at, last_used):
+        """재사용 가능 여부 확인 (오래된 연결 재생성, 유휴 연결 ping)"""
+        now = time.time()
+        if self.recycle and now - created_at > self.recycle:
+            self._record('connections_recycled')
+            return False
+        if now - last_used > self.health_check_interval:
+            try:
+                conn.ping(reconnect=False)
+            except Exception as e:
+                logger.warning(f"DB 연결 상태 확인 실패, 재연결: {e}")
+                self._record('health_check_failures')
+                return False
+        return True
+
+    def acquire(self):
+        """풀에서 연결 대여"""
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.checkout_timeout
+
+        while True:
+            with self._cond:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats['checkout_timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"DB 커넥션 풀 대기 시간 초과 ({self.checkout_timeout}초, 최대 {self.max_size}개)"
+                        )
+                    self._cond.wait(remaining)
+
+                if self._idle:
+                    conn, created_at, last_used = self._idle.pop()
+                else:
+                    conn = None
+                    self._size += 1
+
+            if conn is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                break
+
+            if self._is_usable(conn, created_at, last_used):
+                break
+            self._discard(conn)
+
+        self._record('checkouts')
+        self._record('checkout_wait_total', time.perf_counter() - started, 'checkout_wait_max')
+        return conn
+
+    def release(self, conn, hold_time=None, discard=False):
+        """연결 반납 (오류가 발생한 연결은 폐기)"""
+        if hold_time is not None:
+            self._record('hold_time_total', hold_time, 'hold_time_max')
+
+        if not discard:
+            try:
+                # 열린 트랜잭션/스냅샷이 다음 요청으로 넘어가지 않도록 정리
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard or not conn.open:
+            self._discard(conn)
+            return
+
+        with self._cond:
+            created_at = self._created_at.get(id(conn), time.time())
+            self._idle.append((conn, created_at, time.time()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """with 문으로 연결을 대여하고 자동 반납"""
+        conn = self.acquire()
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield conn
+        except pymysql.err.OperationalError:
+            failed = True
+            raise
+        finally:
+            self.release(conn, time.perf_counter() - started, discard=failed)
+
+    def stats(self):
+        """풀 상태 및 대여 지표"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['idle'] = len(self._idle)
+        stats['in_use'] = stats['size'] - stats['idle']
+        stats['max_size'] = self.max_size
+        checkouts = stats['checkouts'] or 1
+        stats['checkout_wait_avg'] = stats['checkout_wait_total'] / checkouts
+        stats['hold_time_avg'] = stats['hold_time_total'] / checkouts
+        return stats
+
+    def close_all(self):
+        """유휴 연결 모두 종료"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+
+_pool = None
+_pool_lock = threading.RLock()
+
+
+def create_pool(config=None):
+    """설정(dict, 기본값은 환경 변수)으로 전역 커넥션 풀 생성"""
+    global _pool
+    config = config or {}
+
+    def setting(key, default):
+        return config.get(key) or os.getenv(key, default)
+
+    connect_kwargs = {
+        'host': setting('DB_HOST', 'localhost'),
+        'user': setting('DB_USER', 'root'),
+        'password': setting('DB_PASSWORD', '1234'),
+        'db': setting('DB_NAME', 'medicine_db'),
+        'charset': 'utf8mb4',
+        'cursorclass': DictCursor,
+        'autocommit': True,
+        'connect_timeout': 5,
+        'auth_plugin_map': {'mysql_native_password': 'mysql_native_password'}
+    }
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _pool = ConnectionPool(
+            connect_kwargs,
+            max_size=int(setting('DB_POOL_SIZE', 10)),
+            recycle=int(setting('DB_POOL_RECYCLE', 3600)),
+            health_check_interval=int(setting('DB_POOL_HEALTH_CHECK', 30)),
+            checkout_timeout=float(setting('DB_POOL_TIMEOUT', 10))
+        )
+    logger.info(f"DB 커넥션 풀 생성: {connect_kwargs['host']}/{connect_kwargs['db']}, 최대 {_pool.max_size}개")
+    return _pool
+
+
+def get_pool():
+    """전역 커넥션 풀 반환 (없으면 환경 변수 설정으로 생성)"""
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                return create_pool()
+    return _pool
+
+
+def get_db():
+    """현재 요청에서 사용할 연결 (요청당 한 번 대여, 요청 종료 시 반납)"""
+    if '_db_conn' not in g:
+        g._db_conn = get_pool().acquire()
+        g._db_conn_started = time.perf_counter()
+    return g._db_conn
+
+
+def _release_request_connection(exception=None):
+    conn = g.pop('_db_conn', None)
+    if conn is not None:
+        hold_time = time.perf_counter() - g.pop('_db_conn_started', time.perf_counter())
+        get_pool().release(conn, hold_time, discard=isinstance(exception, pymysql.err.OperationalError))
+
+
+def init_app(app):
+    """Flask 앱 설정으로 풀을 만들고 요청 종료 시 연결 반납 등록"""
+    create_pool(app.config)
+    app.teardown_appcontext(_release_request_connection)
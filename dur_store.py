@@ -0,0 +1,130 @@
+import json
+import logging
+
+logger = logging.getLogger('app')
+
+# DUR 품목정보 API (식품의약품안전처 DURPrdlstInfoService03)
+DUR_API_BASE_URL = 'http://apis.data.go.kr/1471000/DURPrdlstInfoService03'
+
+# DUR 관련 API 엔드포인트
+DUR_ENDPOINTS = {
+    'usjnt': 'getUsjntTabooInfoList03',     # 병용금기
+    'age': 'getSpcifyAgrdeTabooInfoList03', # 특정연령대금기
+    'pregnancy': 'getPwnmTabooInfoList03',  # 임부금기
+    'capacity': 'getCpctyAtentInfoList03',  # 용량주의
+    'period': 'getMdctnPdAtentInfoList03',  # 투여기간주의
+    'elderly': 'getOdsnAtentInfoList03',    # 노인주의
+    'duplicate': 'getEfcyDplctInfoList03',  # 효능군중복
+    'split': 'getSeobangjeongPartitnAtentInfoList03' # 서방정분할주의
+}
+
+# 8개 DUR 유형을 한 테이블에 저장 (품목/성분 기준 조회용 인덱스 포함)
+DUR_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS dur_info (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    dur_type VARCHAR(20) NOT NULL COMMENT 'DUR 유형 (DUR_ENDPOINTS 키)',
+    type_name VARCHAR(50) COMMENT 'DUR 유형명',
+    dur_seq VARCHAR(50) COMMENT 'DUR 일련번호',
+    item_seq VARCHAR(100) COMMENT '품목일련번호',
+    item_name VARCHAR(500) COMMENT '품목명',
+    entp_name VARCHAR(200) COMMENT '업체명',
+    ingr_code VARCHAR(100) COMMENT 'DUR 성분코드',
+    ingr_name VARCHAR(500) COMMENT 'DUR 성분명',
+    mixture_item_seq VARCHAR(100) COMMENT '병용금기 품목일련번호',
+    mixture_item_name VARCHAR(500) COMMENT '병용금기 품목명',
+    mixture_entp_name VARCHAR(200) COMMENT '병용금기 업체명',
+    mixture_ingr_code VARCHAR(100) COMMENT '병용금기 성분코드',
+    mixture_ingr_name VARCHAR(500) COMMENT '병용금기 성분명',
+    prohbt_content TEXT COMMENT '금기/주의 내용',
+    remark TEXT COMMENT '비고',
+    notification_date VARCHAR(20) COMMENT '고시일자',
+    detail JSON COMMENT 'API 원본 항목',
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '동기화 시각',
+    INDEX idx_item_type (item_seq, dur_type),
+    INDEX idx_ingr_type (ingr_code, dur_type),
+    INDEX idx_mixture_item (mixture_item_seq),
+    INDEX idx_mixture_ingr (mixture_ingr_code)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='DUR 정보 (8개 유형)'
+"""
+
+# 저장 컬럼 → API 항목 태그 (앞에서부터 값이 있는 태그 사용)
+DUR_FIELD_MAP = {
+    'type_name': ['TYPE_NAME', 'DUR_TYPE'],
+    'dur_seq': ['DUR_SEQ'],
+    'item_seq': ['ITEM_SEQ'],
+    'item_name': ['ITEM_NAME'],
+    'entp_name': ['ENTP_NAME'],
+    'ingr_code': ['INGR_CODE', 'DUR_INGR_CODE'],
+    'ingr_name': ['INGR_KOR_NAME', 'INGR_NAME', 'MAIN_INGR'],
+    'mixture_item_seq': ['MIXTURE_ITEM_SEQ'],
+    'mixture_item_name': ['MIXTURE_ITEM_NAME'],
+    'mixture_entp_name': ['MIXTURE_ENTP_NAME'],
+    'mixture_ingr_code': ['MIXTURE_INGR_CODE'],
+    'mixture_ingr_name': ['MIXTURE_INGR_KOR_NAME', 'MIXTURE_INGR_NAME'],
+    'prohbt_content': ['PROHBT_CONTENT'],
+    'remark': ['REMARK'],
+    'notification_date': ['NOTIFICATION_DATE']
+}
+
+DUR_COLUMNS = ['dur_type'] + list(DUR_FIELD_MAP) + ['detail']
+
+# 조회 시 반환하는 컬럼 (원본 JSON 제외)
+DUR_SELECT_COLUMNS = ', '.join(['dur_type'] + list(DUR_FIELD_MAP))
+
+
+def normalize_dur_item(dur_type, item):
+    """API 항목(dict) → dur_info 행 값 목록 (DUR_COLUMNS 순서)"""
+    values = [dur_type]
+    for tags in DUR_FIELD_MAP.values():
+        value = None
+        for tag in tags:
+            if item.get(tag):
+                value = item[tag].strip()
+                break
+        values.append(value)
+    values.append(json.dumps(item, ensure_ascii=False))
+    return values
+
+
+def find_dur_rows(conn, item_seqs=None, ingr_codes=None, dur_types=None):
+    """품목일련번호/성분코드 기준 DUR 정보 조회 (모든 유형을 단일 쿼리로)
+
+    Args:
+        item_seqs: 품목일련번호 목록
+        ingr_codes: DUR 성분코드 목록 (품목과 OR 조건)
+        dur_types: 조회할 DUR 유형 목록 (None 이면 전체)
+
+    Returns:
+        행 목록 (dur_type, item_seq 순)
+    """
+    key_conditions = []
+    params = []
+    if item_seqs:
+        key_conditions.append(f"item_seq IN ({', '.join(['%s'] * len(item_seqs))})")
+        params.extend(item_seqs)
+    if ingr_codes:
+        key_conditions.append(f"ingr_code IN ({', '.join(['%s'] * len(ingr_codes))})")
+        params.extend(ingr_codes)
+    if not key_conditions:
+        return []
+
+    where_clause = f"({' OR '.join(key_conditions)})"
+    if dur_types:
+        where_clause += f" AND dur_type IN ({', '.join(['%s'] * len(dur_types))})"
+        params.extend(dur_types)
+
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {DUR_SELECT_COLUMNS} FROM dur_info WHERE {where_clause} "
+            f"ORDER BY dur_type, item_seq, id",
+            params
+        )
+        return cursor.fetchall()
+
+
+def group_by_dur_type(rows):
+    """조회 결과를 DUR 유형별로 분류 (모든 유형 키 포함)"""
+    grouped = {dur_type: [] for dur_type in DUR_ENDPOINTS}
+    for row in rows:
+        grouped.setdefault(row['dur_type'], []).append(row)
+    return grouped
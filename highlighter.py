@@ -0,0 +1,49 @@
+import re
+from functools import lru_cache
+
+HIGHLIGHT_TEMPLATE = '<span class="highlight">{}</span>'
+
+
+@lru_cache(maxsize=256)
+def _compile_terms(terms):
+    """검색어 목록을 하나의 대소문자 무시 정규식으로 컴파일 (긴 검색어 우선)"""
+    ordered = sorted(terms, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(term) for term in ordered), re.IGNORECASE)
+
+
+class Highlighter:
+    """여러 검색어를 한 번의 치환으로 하이라이트 처리
+
+    검색어를 결합한 정규식은 검색어 조합별로 한 번만 컴파일되며,
+    annotate() 는 하이라이트된 텍스트와 일치 여부를 함께 반환한다.
+    """
+
+    def __init__(self, terms):
+        cleaned = tuple(sorted({term.strip() for term in terms if term and term.strip()}))
+        self.pattern = _compile_terms(cleaned) if cleaned else None
+
+    def annotate(self, text):
+        """(하이라이트된 텍스트, 일치 여부)"""
+        if not text or self.pattern is None:
+            return text, False
+        highlighted, count = self.pattern.subn(
+            lambda m: HIGHLIGHT_TEMPLATE.format(m.group(0)), text
+        )
+        return highlighted, count > 0
+
+
+def highlight_fields(rows, field_terms):
+    """결과 행의 필드별로 검색어 하이라이트 및 일치 여부 표시
+
+    Args:
+        rows: 검색 결과 행 목록 (제자리에서 수정)
+        field_terms: {필드명: (검색어 목록, 일치 여부를 기록할 키)}
+    """
+    highlighters = [
+        (field, Highlighter(terms), flag_key)
+        for field, (terms, flag_key) in field_terms.items()
+    ]
+    for row in rows:
+        for field, highlighter, flag_key in highlighters:
+            row[field], row[flag_key] = highlighter.annotate(row.get(field))
+    return rows
@@ -0,0 +1,238 @@
+import re
+import threading
+import time
+import logging
+
+logger = logging.getLogger('app')
+
+# 각인 매칭에 필요한 컬럼
+IMPRINT_COLUMNS = "id, item_name, print_front, print_back, mark_code_front, mark_code_back"
+
+# OCR/육안 판독 시 자주 혼동되는 문자 (정규화 키에서는 같은 문자로 취급)
+CONFUSABLE_CHARS = str.maketrans({
+    'O': '0', 'Q': '0',
+    'I': '1', 'L': '1', '|': '1',
+    'S': '5', 'Z': '2', 'B': '8'
+})
+
+# 영문/숫자/한글 이외의 문자 (공백, 하이픈, 괄호 등) 제거
+_STRIP_PATTERN = re.compile(r'[^0-9A-Z가-힣|]')
+
+# 경계 표시 문자 (짧은 각인도 트라이그램을 갖도록 앞뒤에 붙임)
+_BOUNDARY_START = '\x02'
+_BOUNDARY_END = '\x03'
+
+FRONT = 'front'
+BACK = 'back'
+
+
+def normalize_imprint(text):
+    """각인 문자열을 비교용 키로 정규화 (대문자, 구분 기호 제거, 혼동 문자 통일)"""
+    if not text:
+        return ''
+    return _STRIP_PATTERN.sub('', str(text).upper()).translate(CONFUSABLE_CHARS)
+
+
+def imprint_trigrams(key, padded=True):
+    """정규화 키의 트라이그램 집합"""
+    if padded:
+        key = f"{_BOUNDARY_START}{key}{_BOUNDARY_END}"
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class ImprintMatcher:
+    """print_front/back, mark_code_front/back 정규화 키의 트라이그램 인덱스
+
+    - 검색어가 키에 포함되면 (기존 LIKE '%x%' 와 동일) 높은 점수
+    - 그 외에는 트라이그램 Dice 유사도가 임계값 이상인 키를 근사 일치로 취급
+    - 앞/뒷면을 바꿔 읽은 경우도 같은 조회에서 함께 평가 (약간 낮은 점수)
+    """
+
+    def __init__(self, min_similarity=0.5, swap_penalty=0.9):
+        self.min_similarity = min_similarity
+        self.swap_penalty = swap_penalty
+        self._lock = threading.RLock()
+        self._key_rows = {}
+        self._key_trigrams = {}
+        self._trigram_keys = {}
+        self._inner_trigram_keys = {}
+        self._sort_keys = {}
+        self.built_at = None
+        self.stale = False
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    def build(self, rows):
+        """DB 행 목록으로 인덱스 생성"""
+        started = time.perf_counter()
+        key_rows = {}
+        sort_keys = {}
+
+        for row in rows:
+            row_id = row['id']
+            sort_keys[row_id] = (row.get('item_name') or '', row_id)
+            for side, columns in ((FRONT, ('print_front', 'mark_code_front')),
+                                  (BACK, ('print_back', 'mark_code_back'))):
+                for column in columns:
+                    key = normalize_imprint(row.get(column))
+                    if key:
+                        key_rows.setdefault(key, set()).add((row_id, side))
+
+        key_trigrams = {}
+        trigram_keys = {}
+        inner_trigram_keys = {}
+        for key in key_rows:
+            trigrams = imprint_trigrams(key)
+            key_trigrams[key] = trigrams
+            for trigram in trigrams:
+                trigram_keys.setdefault(trigram, set()).add(key)
+            for trigram in imprint_trigrams(key, padded=False):
+                inner_trigram_keys.setdefault(trigram, set()).add(key)
+
+        with self._lock:
+            self._key_rows = key_rows
+            self._key_trigrams = key_trigrams
+            self._trigram_keys = trigram_keys
+            self._inner_trigram_keys = inner_trigram_keys
+            self._sort_keys = sort_keys
+            self.built_at = time.time()
+            self.stale = False
+
+        logger.info(
+            f"각인 인덱스 생성 완료: 각인 키 {len(key_rows)}개, "
+            f"{time.perf_counter() - started:.2f}초"
+        )
+
+    def _containing_keys(self, query):
+        """검색어를 포함하는 키 (트라이그램 교집합 후 확인)"""
+        if len(query) >= 3:
+            candidates = None
+            for trigram in imprint_trigrams(query, padded=False):
+                keys = self._inner_trigram_keys.get(trigram)
+                if not keys:
+                    return set()
+                candidates = set(keys) if candidates is None else candidates & keys
+        else:
+            candidates = self._key_rows.keys()
+        return {key for key in candidates if query in key}
+
+    def _score_keys(self, query):
+        """검색어와 일치/유사한 키별 점수"""
+        scores = {}
+
+        # 포함 일치 (완전 일치 1.0, 부분 포함은 길이 비율에 따라 0.7~1.0)
+        for key in self._containing_keys(query):
+            scores[key] = 1.0 if key == query else 0.7 + 0.3 * len(query) / len(key)
+
+        # 트라이그램 Dice 유사도 기반 근사 일치
+        query_trigrams = imprint_trigrams(query)
+        shared = {}
+        for trigram in query_trigrams:
+            for key in self._trigram_keys.get(trigram, ()):
+                shared[key] = shared.get(key, 0) + 1
+        for key, count in shared.items():
+            similarity = 2.0 * count / (len(query_trigrams) + len(self._key_trigrams[key]))
+            if similarity >= self.min_similarity:
+                score = 0.7 * similarity
+                if score > scores.get(key, 0):
+                    scores[key] = score
+        return scores
+
+    def _side_scores(self, query):
+        """{(row_id, side): 점수}"""
+        result = {}
+        for key, score in self._score_keys(query).items():
+            for row_side in self._key_rows[key]:
+                if score > result.get(row_side, 0):
+                    result[row_side] = score
+        return result
+
+    def lookup(self, print_front='', print_back=''):
+        """각인으로 검색하여 (row_id, 점수) 목록을 점수 내림차순으로 반환
+
+        앞/뒷면을 바꿔 읽은 경우는 swap_penalty 를 곱한 점수로 함께 평가한다.
+        """
+        front_query = normalize_imprint(print_front)
+        back_query = normalize_imprint(print_back)
+        if not front_query and not back_query:
+            return []
+
+        with self._lock:
+            front_scores = self._side_scores(front_query) if front_query else None
+            back_scores = self._side_scores(back_query) if back_query else None
+
+            def side_score(scores, row_id, side):
+                return scores.get((row_id, side), 0)
+
+            row_ids = set()
+            for scores in (front_scores, back_scores):
+                if scores:
+                    row_ids.update(row_id for row_id, _ in scores)
+
+            ranked = []
+            for row_id in row_ids:
+                if front_scores is not None and back_scores is not None:
+                    as_read = side_score(front_scores, row_id, FRONT), side_score(back_scores, row_id, BACK)
+                    swapped = side_score(front_scores, row_id, BACK), side_score(back_scores, row_id, FRONT)
+                    # 양면 모두 일치해야 함
+                    candidates = []
+                    if all(as_read):
+                        candidates.append(sum(as_read) / 2)
+                    if all(swapped):
+                        candidates.append(sum(swapped) / 2 * self.swap_penalty)
+                    score = max(candidates) if candidates else 0
+                else:
+                    scores = front_scores if front_scores is not None else back_scores
+                    read_side, other_side = (FRONT, BACK) if front_scores is not None else (BACK, FRONT)
+                    score = max(
+                        side_score(scores, row_id, read_side),
+                        side_score(scores, row_id, other_side) * self.swap_penalty
+                    )
+                if score > 0:
+                    ranked.append((row_id, score))
+
+            sort_keys = self._sort_keys
+            ranked.sort(key=lambda item: (-item[1], sort_keys.get(item[0], ('', item[0]))))
+            return ranked
+
+
+# 애플리케이션 전역 각인 인덱스 (최초 검색 시 생성, 데이터 변경 시 재생성)
+_imprint_matcher = ImprintMatcher()
+_build_lock = threading.Lock()
+_last_failure = 0.0
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+BUILD_RETRY_DELAY = 60
+
+
+def invalidate_imprint_matcher():
+    """다음 사용 시 인덱스를 다시 생성하도록 표시"""
+    _imprint_matcher.stale = True
+
+
+def get_imprint_matcher(load_rows):
+    """전역 각인 인덱스 반환, 없거나 데이터가 변경된 경우 load_rows()로 재생성
+
+    Returns:
+        ImprintMatcher 또는 생성 실패 시 None
+    """
+    global _last_failure
+    matcher = _imprint_matcher
+    if matcher.is_ready and not matcher.stale:
+        return matcher
+
+    if time.time() - _last_failure < BUILD_RETRY_DELAY:
+        return None
+
+    with _build_lock:
+        if matcher.is_ready and not matcher.stale:
+            return matcher
+        try:
+            matcher.build(load_rows())
+        except Exception as e:
+            _last_failure = time.time()
+            logger.error(f"각인 인덱스 생성 실패: {e}")
+            return None
+    return matcher
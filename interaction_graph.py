@@ -0,0 +1,174 @@
+import threading
+import time
+import logging
+
+logger = logging.getLogger('app')
+
+# 병용금기 그래프 생성용 조회 (dur_info 의 병용금기 행)
+INTERACTION_ROWS_QUERY = """
+    SELECT item_seq, item_name, ingr_code, ingr_name,
+           mixture_item_seq, mixture_item_name, mixture_ingr_code, mixture_ingr_name,
+           prohbt_content
+    FROM dur_info
+    WHERE dur_type = 'usjnt'
+"""
+
+
+class InteractionGraph:
+    """성분 → 병용금기 성분 인접 집합
+
+    dur_info 병용금기 행에서 품목별 성분과 성분 쌍의 금기 내용을 모아 둔다.
+    n 개 품목 목록 검사는 품목마다 (금기 성분 집합 ∩ 목록에 있는 성분) 교집합 한 번으로
+    끝나므로 품목 쌍마다 DB 를 조회할 필요가 없다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._adjacency = {}
+        self._pair_details = {}
+        self._item_ingredients = {}
+        self._item_names = {}
+        self._ingredient_names = {}
+        self.built_at = None
+        self.stale = False
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    def build(self, rows):
+        """dur_info 병용금기 행으로 그래프 생성"""
+        started = time.perf_counter()
+        adjacency = {}
+        pair_details = {}
+        item_ingredients = {}
+        item_names = {}
+        ingredient_names = {}
+
+        for row in rows:
+            ingredient = row.get('ingr_code')
+            mixture_ingredient = row.get('mixture_ingr_code')
+            if not ingredient or not mixture_ingredient:
+                continue
+
+            for item_seq, item_name, code, name in (
+                (row.get('item_seq'), row.get('item_name'), ingredient, row.get('ingr_name')),
+                (row.get('mixture_item_seq'), row.get('mixture_item_name'),
+                 mixture_ingredient, row.get('mixture_ingr_name'))
+            ):
+                if item_seq:
+                    item_ingredients.setdefault(item_seq, set()).add(code)
+                    if item_name:
+                        item_names[item_seq] = item_name
+                if name:
+                    ingredient_names[code] = name
+
+            # 병용금기는 대칭 관계
+            adjacency.setdefault(ingredient, set()).add(mixture_ingredient)
+            adjacency.setdefault(mixture_ingredient, set()).add(ingredient)
+            pair = frozenset((ingredient, mixture_ingredient))
+            if row.get('prohbt_content') and pair not in pair_details:
+                pair_details[pair] = row['prohbt_content']
+
+        with self._lock:
+            self._adjacency = adjacency
+            self._pair_details = pair_details
+            self._item_ingredients = item_ingredients
+            self._item_names = item_names
+            self._ingredient_names = ingredient_names
+            self.built_at = time.time()
+            self.stale = False
+
+        logger.info(
+            f"병용금기 그래프 생성 완료: 성분 {len(adjacency)}개, 금기 성분 쌍 {len(pair_details)}개, "
+            f"품목 {len(item_ingredients)}개, {time.perf_counter() - started:.2f}초"
+        )
+
+    def check(self, item_seqs):
+        """품목 목록에서 병용금기 품목 쌍 검사
+
+        Returns:
+            {'interactions': [...], 'unknown_items': [...]} - 그래프에 성분 정보가 없는
+            품목은 unknown_items 로 반환 (병용금기 등록 내역이 없는 품목)
+        """
+        # 중복 제거 (입력 순서 유지)
+        item_seqs = list(dict.fromkeys(item_seq for item_seq in item_seqs if item_seq))
+
+        with self._lock:
+            item_ingredients = self._item_ingredients
+            adjacency = self._adjacency
+
+            # 목록에 있는 성분 → 해당 성분을 가진 품목
+            present = {}
+            for item_seq in item_seqs:
+                for ingredient in item_ingredients.get(item_seq, ()):
+                    present.setdefault(ingredient, []).append(item_seq)
+            present_ingredients = set(present)
+
+            interactions = []
+            seen = set()
+            for item_seq in item_seqs:
+                for ingredient in item_ingredients.get(item_seq, ()):
+                    for conflict in adjacency.get(ingredient, set()) & present_ingredients:
+                        for other_seq in present[conflict]:
+                            if other_seq == item_seq:
+                                continue
+                            key = (frozenset((item_seq, other_seq)), frozenset((ingredient, conflict)))
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            interactions.append({
+                                'item_seq': item_seq,
+                                'item_name': self._item_names.get(item_seq),
+                                'ingr_code': ingredient,
+                                'ingr_name': self._ingredient_names.get(ingredient),
+                                'mixture_item_seq': other_seq,
+                                'mixture_item_name': self._item_names.get(other_seq),
+                                'mixture_ingr_code': conflict,
+                                'mixture_ingr_name': self._ingredient_names.get(conflict),
+                                'prohbt_content': self._pair_details.get(frozenset((ingredient, conflict)))
+                            })
+
+            unknown_items = [item_seq for item_seq in item_seqs if item_seq not in item_ingredients]
+
+        return {'interactions': interactions, 'unknown_items': unknown_items}
+
+
+# 애플리케이션 전역 그래프 (최초 검사 시 생성, DUR 데이터 변경 시 재생성)
+_interaction_graph = InteractionGraph()
+_build_lock = threading.Lock()
+_last_failure = 0.0
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+BUILD_RETRY_DELAY = 60
+
+
+def invalidate_interaction_graph():
+    """다음 사용 시 그래프를 다시 생성하도록 표시"""
+    _interaction_graph.stale = True
+
+
+def get_interaction_graph(load_rows):
+    """전역 병용금기 그래프 반환, 없거나 데이터가 변경된 경우 load_rows()로 재생성
+
+    Returns:
+        InteractionGraph 또는 생성 실패 시 None
+    """
+    global _last_failure
+    graph = _interaction_graph
+    if graph.is_ready and not graph.stale:
+        return graph
+
+    if time.time() - _last_failure < BUILD_RETRY_DELAY:
+        return graph if graph.is_ready else None
+
+    with _build_lock:
+        if graph.is_ready and not graph.stale:
+            return graph
+        try:
+            graph.build(load_rows())
+        except Exception as e:
+            _last_failure = time.time()
+            logger.error(f"병용금기 그래프 생성 실패: {e}")
+            return graph if graph.is_ready else None
+    return graph
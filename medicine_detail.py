@@ -0,0 +1,139 @@
+import hashlib
+import json
+import threading
+import logging
+
+from data_version import data_versions
+from result_cache import LRUCache, register_cache
+
+logger = logging.getLogger('app')
+
+# 상세 정보에 함께 표시하는 관련 테이블 (결과 키 → 테이블명, medicine_id 로 연결)
+DETAIL_RELATED_TABLES = {
+    'components': 'medicine_components',
+    'dur_info': 'medicine_dur_usjnt'
+}
+
+# 의약품 id 별 상세 정보 캐시 (로더가 데이터를 갱신하면 비움)
+detail_cache = register_cache(
+    'medicine_detail', LRUCache(max_entries=4096, ttl=3600, name='medicine_detail')
+)
+
+
+class DetailSchema:
+    """관련 테이블 존재 여부와 컬럼 목록 (information_schema 에서 한 번만 조회)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.columns = None  # {결과 키: [컬럼명]}, 없는 테이블은 제외
+
+    def reset(self):
+        self.columns = None
+
+    def get(self, conn):
+        columns = self.columns
+        if columns is not None:
+            return columns
+        with self._lock:
+            if self.columns is None:
+                self.columns = self._probe(conn)
+            return self.columns
+
+    @staticmethod
+    def _probe(conn):
+        tables = list(DETAIL_RELATED_TABLES.values())
+        placeholders = ', '.join(['%s'] * len(tables))
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT table_name AS table_name, column_name AS column_name
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE() AND table_name IN ({placeholders})
+                ORDER BY table_name, ordinal_position
+            """, tables)
+            table_columns = {}
+            for row in cursor.fetchall():
+                table_columns.setdefault(row['table_name'], []).append(row['column_name'])
+
+        columns = {}
+        for key, table in DETAIL_RELATED_TABLES.items():
+            if 'medicine_id' in table_columns.get(table, []):
+                columns[key] = table_columns[table]
+            else:
+                logger.info(f"상세 정보 관련 테이블 없음, 조회 생략: {table}")
+        return columns
+
+
+detail_schema = DetailSchema()
+
+
+def invalidate_detail_cache():
+    """상세 정보 캐시와 스키마 확인 결과 초기화 (로더가 테이블을 새로 만들 수 있음)"""
+    detail_cache.clear()
+    detail_schema.reset()
+
+
+data_versions.on_change('drug_identification', invalidate_detail_cache)
+for _table in DETAIL_RELATED_TABLES.values():
+    data_versions.on_change(_table, invalidate_detail_cache)
+
+
+def build_detail_query(schema_columns):
+    """기본 정보와 관련 테이블 행(JSON 배열)을 한 번에 가져오는 SQL"""
+    selects = ["d.*"]
+    for key, columns in schema_columns.items():
+        table = DETAIL_RELATED_TABLES[key]
+        pairs = ', '.join(f"'{column}', r.`{column}`" for column in columns)
+        selects.append(
+            f"(SELECT JSON_ARRAYAGG(JSON_OBJECT({pairs})) "
+            f"FROM `{table}` r WHERE r.medicine_id = d.id) AS `{key}__json`"
+        )
+    return f"SELECT {', '.join(selects)} FROM drug_identification d WHERE d.id = %s"
+
+
+def fetch_medicine_detail(conn, medicine_id):
+    """의약품 상세 정보 조회 (단일 쿼리)
+
+    Returns:
+        {'basic': 기본 정보, 'components': [...], 'dur_info': [...]} 또는 None
+    """
+    schema_columns = detail_schema.get(conn)
+    with conn.cursor() as cursor:
+        cursor.execute(build_detail_query(schema_columns), (medicine_id,))
+        medicine = cursor.fetchone()
+
+    if not medicine:
+        return None
+
+    result = {'basic': medicine}
+    for key in DETAIL_RELATED_TABLES:
+        raw = medicine.pop(f"{key}__json", None)
+        result[key] = json.loads(raw) if raw else []
+    return result
+
+
+def get_cached_medicine_detail(conn, medicine_id):
+    """캐시를 거쳐 의약품 상세 정보 조회"""
+    data_versions.refresh(conn)
+    detail = detail_cache.get(medicine_id)
+    if detail is None:
+        detail = fetch_medicine_detail(conn, medicine_id)
+        if detail is not None:
+            detail_cache.set(medicine_id, detail)
+    return detail
+
+
+def detail_validators(detail):
+    """조건부 요청용 (ETag, Last-Modified)
+
+    ETag 는 drug_identification.updated_at 과 함께 표시하는 관련 테이블
+    (성분, DUR) 의 데이터 버전까지 포함하므로 어느 쪽이 바뀌어도 달라진다.
+    """
+    basic = detail['basic']
+    updated_at = basic.get('updated_at')
+    versions = ':'.join(
+        str(data_versions.version(table))
+        for table in ('drug_identification', *DETAIL_RELATED_TABLES.values())
+    )
+    tag_source = f"{basic['id']}:{updated_at}:{versions}"
+    etag = hashlib.sha1(tag_source.encode('utf-8')).hexdigest()
+    return etag, updated_at
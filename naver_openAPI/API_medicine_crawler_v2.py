@@ -4,6 +4,8 @@ import json
 import time
 import sqlite3
 import logging
+import queue
+import threading
 import urllib.parse
 import urllib.request
 from datetime import datetime
@@ -70,11 +72,17 @@ class Config:
     
     # API 설정
     DEFAULT_SEARCH_DISPLAY = 20  # 한 번에 가져올 결과 수 (최대 100)
-    API_DELAY = 0.3  # API 호출 간 딜레이 (초)
+    API_RATE_PER_SECOND = 1 / 0.3  # 검색 API 초당 호출 수 (같은 DB 를 쓰는 모든 크롤러 프로세스 합계)
+    API_RATE_BURST = 1  # 한동안 호출이 없었을 때 연속으로 허용할 호출 수
     MAX_DAILY_API_CALLS = 24000  # 일일 최대 API 호출 수 (여유있게 설정, 실제 한도는 25,000)
+    API_QUOTA_FLUSH_CALLS = 20  # 호출 수를 DB 에 누적하는 주기 (호출 수)
+    API_QUOTA_FLUSH_INTERVAL = 10  # 호출 수를 DB 에 누적하는 최대 간격 (초)
     
     # 데이터베이스 설정
     DEFAULT_DB_PATH = 'api_medicine.db'
+    DB_WRITE_BATCH_SIZE = 50  # 쓰기 스레드가 한 트랜잭션에 묶는 최대 항목 수
+    DB_WRITE_INTERVAL = 1.0  # 쓰기 스레드 최대 대기 시간 (초), 이 간격마다 모인 항목 저장
+    DB_BUSY_TIMEOUT = 30  # 다른 연결이 쓰는 중일 때 대기 시간 (초)
     DB_TABLES = {
         'api_medicine': '''
         CREATE TABLE IF NOT EXISTS api_medicine (
@@ -131,6 +139,12 @@ class Config:
             count INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
+        ''',
+        'api_rate_limit': '''
+        CREATE TABLE IF NOT EXISTS api_rate_limit (
+            name TEXT PRIMARY KEY,
+            next_at REAL NOT NULL
+        )
         '''
     }
     
@@ -153,7 +167,8 @@ class Config:
     MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
     
     # 병렬 처리 설정
-    MAX_WORKERS = 4  # 병렬 처리에 사용할 최대 워커 수
+    MAX_WORKERS = 4  # 병렬 처리에 사용할 최대 워커 수 (상세 페이지/이미지 동시 요청 수)
+    PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)  # 상세 페이지 파싱 프로세스 수 (0 이면 스레드에서 파싱)
 
 def init_environment():
     """
@@ -524,55 +539,219 @@ def generate_comprehensive_keywords():
     
     return unique_keywords
 
+class ApiRateLimiter:
+    """
+    검색 API 호출 속도 제한 (GCRA 방식 토큰 버킷)
+    
+    - 다음 호출 허용 시각을 api_rate_limit 테이블에 두어 같은 DB 파일을 쓰는 크롤러 프로세스가 한도를 공유
+    - 호출마다 짧은 IMMEDIATE 트랜잭션으로 자기 차례를 예약하고, 대기는 트랜잭션 밖에서 함
+    - 차례가 1/rate 초 간격으로 배정되므로 요청 시간과 상관없이 허용 속도 그대로 호출
+    - acquire() 는 스레드에서, acquire_async() 는 이벤트 루프에서 사용
+    """
+    def __init__(self, connect, rate, burst=1, name='naver_search'):
+        """
+        Args:
+            connect: 연결 생성 함수 (check_same_thread 인자를 받음)
+            rate: 초당 허용 호출 수
+            burst: 연속으로 허용할 호출 수
+            name: 한도를 공유하는 단위 (api_rate_limit 의 키)
+        """
+        self.interval = 1.0 / rate
+        self.burst = max(1, burst)
+        self.name = name
+        self._conn = connect(check_same_thread=False)
+        self._conn.isolation_level = None
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+    
+    def reserve(self):
+        """
+        다음 호출 차례 예약
+        
+        Returns:
+            float: 호출 전에 기다려야 할 시간 (초)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT next_at FROM api_rate_limit WHERE name = ?", (self.name,)
+                ).fetchone()
+                # 한동안 호출이 없었으면 지금부터, 아니면 마지막으로 예약된 차례 다음
+                next_at = max(row[0], now) if row else now
+                wait = max(0.0, next_at - now - (self.burst - 1) * self.interval)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO api_rate_limit (name, next_at) VALUES (?, ?)",
+                    (self.name, next_at + self.interval)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self.acquired += 1
+            self.waited_seconds += wait
+            return wait
+    
+    def acquire(self):
+        """호출 차례까지 대기 (스레드용)"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """호출 차례까지 대기 (이벤트 루프용, DB 잠금 대기가 루프를 막지 않도록 예약은 스레드에서)"""
+        loop = asyncio.get_running_loop()
+        wait = await loop.run_in_executor(None, self.reserve)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+class ApiQuota:
+    """
+    일일 API 호출 수 관리
+    
+    - 호출 수는 메모리에서 세고 flush_every 회 또는 flush_interval 초마다 api_calls 에 더함 (count = count + ?)
+    - 기록할 때마다 다른 프로세스의 호출까지 포함한 오늘 합계를 다시 읽어 한도 판단에 사용
+    - 기록 사이에 다른 프로세스가 쓴 호출은 늦게 반영되므로 한도(MAX_DAILY_API_CALLS)는 실제 한도보다 여유있게 설정
+    """
+    def __init__(self, connect, limit, logger,
+                 flush_every=Config.API_QUOTA_FLUSH_CALLS, flush_interval=Config.API_QUOTA_FLUSH_INTERVAL):
+        """
+        Args:
+            connect: 연결 생성 함수 (check_same_thread 인자를 받음)
+            limit: 일일 최대 호출 수
+            logger: 로깅 객체
+            flush_every: 이 횟수만큼 호출이 쌓이면 기록
+            flush_interval: 마지막 기록 후 이 시간(초)이 지나면 기록
+        """
+        self.limit = limit
+        self.logger = logger
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._conn = connect(check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._date = None
+        self._row_id = None
+        self._stored = 0
+        with self._lock:
+            self._load(datetime.now().strftime('%Y-%m-%d'))
+    
+    def _load(self, today):
+        """오늘 레코드 조회 (없으면 생성, 여러 프로세스가 동시에 만들지 않도록 IMMEDIATE 트랜잭션)"""
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute(
+                "SELECT id, count FROM api_calls WHERE date = ? ORDER BY id DESC LIMIT 1",
+                (today,)
+            )
+            result = cursor.fetchone()
+            if result:
+                self._row_id, self._stored = result
+            else:
+                # 오늘 첫 API 호출이면 레코드 생성
+                cursor.execute("INSERT INTO api_calls (date, count) VALUES (?, 0)", (today,))
+                self._row_id, self._stored = cursor.lastrowid, 0
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        self._date = today
+        self._flushed_at = time.monotonic()
+    
+    def _flush(self):
+        """쌓인 호출 수 기록 후 오늘 합계 다시 읽기 (잠금 안에서 호출)"""
+        cursor = self._conn.cursor()
+        if self._pending:
+            cursor.execute("UPDATE api_calls SET count = count + ? WHERE id = ?", (self._pending, self._row_id))
+        result = cursor.execute("SELECT count FROM api_calls WHERE id = ?", (self._row_id,)).fetchone()
+        self._conn.commit()
+        self._stored = result[0] if result else self._stored + self._pending
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+    
+    def _roll_date(self):
+        """날짜가 바뀌었으면 어제 몫을 기록하고 오늘 레코드로 전환"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        if today != self._date:
+            self._flush()
+            self._load(today)
+    
+    def record(self, count=1):
+        """
+        호출 수 증가
+        
+        Returns:
+            int: 오늘의 총 API 호출 횟수
+        """
+        with self._lock:
+            self._roll_date()
+            self._pending += count
+            if self._pending >= self.flush_every or time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._flush()
+            return self._stored + self._pending
+    
+    @property
+    def used(self):
+        """오늘의 총 API 호출 횟수 (마지막 기록 이후 다른 프로세스 호출 제외)"""
+        with self._lock:
+            self._roll_date()
+            return self._stored + self._pending
+    
+    def exhausted(self):
+        return self.used >= self.limit
+    
+    def flush(self):
+        """쌓인 호출 수 즉시 기록"""
+        with self._lock:
+            try:
+                self._flush()
+            except sqlite3.Error as e:
+                self.logger.error(f"API 호출 수 기록 중 오류: {e}")
+    
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
 class NaverAPIClient:
     """
     네이버 Open API 호출을 담당하는 클라이언트 클래스
     """
-    def __init__(self, client_id, client_secret, db_conn, logger):
+    def __init__(self, client_id, client_secret, connect, logger):
         """
         네이버 API 클라이언트 초기화
         
         Args:
             client_id: 네이버 개발자 센터에서 발급받은 클라이언트 ID
             client_secret: 네이버 개발자 센터에서 발급받은 클라이언트 시크릿
-            db_conn: SQLite 데이터베이스 연결 객체
+            connect: SQLite 연결 생성 함수 (호출 속도/횟수 공유용)
             logger: 로깅 객체
         """
         self.client_id = client_id
         self.client_secret = client_secret
-        self.db_conn = db_conn
         self.logger = logger
-        self.today_api_calls = self._load_today_api_calls()
+        self.rate_limiter = ApiRateLimiter(connect, Config.API_RATE_PER_SECOND, Config.API_RATE_BURST)
+        self.quota = ApiQuota(connect, Config.MAX_DAILY_API_CALLS, logger)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
     
-    def _load_today_api_calls(self):
-        """오늘의 API 호출 횟수 로드"""
-        cursor = self.db_conn.cursor()
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        cursor.execute(
-            "SELECT count FROM api_calls WHERE date = ? ORDER BY id DESC LIMIT 1", 
-            (today,)
-        )
-        result = cursor.fetchone()
-        
-        if result:
-            return result[0]
-        else:
-            # 오늘 첫 API 호출이면 레코드 생성
-            cursor.execute(
-                "INSERT INTO api_calls (date, count) VALUES (?, 0)",
-                (today,)
-            )
-            self.db_conn.commit()
-            return 0
+    @property
+    def today_api_calls(self):
+        """오늘의 API 호출 횟수"""
+        return self.quota.used
     
     def _update_api_call_count(self, count=1):
         """
-        API 호출 횟수 업데이트
+        API 호출 횟수 업데이트 (DB 기록은 ApiQuota 가 모아서 처리)
         
         Args:
             count: 증가시킬 호출 횟수
@@ -580,18 +759,7 @@ class NaverAPIClient:
         Returns:
             int: 업데이트 후 오늘의 총 API 호출 횟수
         """
-        self.today_api_calls += count
-        
-        cursor = self.db_conn.cursor()
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        cursor.execute(
-            "UPDATE api_calls SET count = ? WHERE date = ?",
-            (self.today_api_calls, today)
-        )
-        self.db_conn.commit()
-        
-        return self.today_api_calls
+        return self.quota.record(count)
     
     def check_api_limit(self):
         """
@@ -600,7 +768,12 @@ class NaverAPIClient:
         Returns:
             bool: API 호출 한도에 도달했으면 True, 아니면 False
         """
-        return self.today_api_calls >= Config.MAX_DAILY_API_CALLS
+        return self.quota.exhausted()
+    
+    def close(self):
+        """남은 호출 수 기록 및 연결 정리"""
+        self.quota.close()
+        self.rate_limiter.close()
     
     @retry(max_tries=5, delay_seconds=2, backoff_factor=2, exceptions=(requests.RequestException, urllib.error.URLError))
     def search_medicine(self, keyword, display=None, start=1):
@@ -635,6 +808,8 @@ class NaverAPIClient:
         
         try:
             self.logger.debug(f"API 요청 헤더: {headers}")
+            # 모든 워커/프로세스가 공유하는 호출 속도 제한
+            self.rate_limiter.acquire()
             response = self.session.get(url, headers=headers, timeout=10)
             
             self.logger.info(f"API 응답 상태 코드: {response.status_code}")
@@ -693,6 +868,25 @@ class NaverAPIClient:
             self.logger.error(f"URL 접속 중 오류 발생: {e}")
             raise
     
+    def image_file_path(self, image_url, medicine_name):
+        """
+        이미지 저장 경로 (약품 이름 + URL 해시)
+        
+        Args:
+            image_url: 이미지 URL
+            medicine_name: 약품 이름
+            
+        Returns:
+            str: 로컬 파일 경로
+        """
+        # 파일명에 사용할 수 없는 문자 제거
+        safe_name = re.sub(r'[\\/*?:"<>|]', "", medicine_name)
+        # URL의 해시값 추가하여 고유한 파일명 생성
+        hash_suffix = hashlib.md5(image_url.encode()).hexdigest()[:8]
+        file_ext = os.path.splitext(image_url.split('?')[0])[1] or '.jpg'
+        file_name = f"{safe_name}_{hash_suffix}{file_ext}"
+        return os.path.join(Config.IMAGES_DIR, file_name)
+    
     @retry(max_tries=3, delay_seconds=1, exceptions=(requests.RequestException,))
     def download_image(self, image_url, medicine_name):
         """
@@ -712,13 +906,7 @@ class NaverAPIClient:
             return None
         
         try:
-            # 파일명에 사용할 수 없는 문자 제거
-            safe_name = re.sub(r'[\\/*?:"<>|]', "", medicine_name)
-            # URL의 해시값 추가하여 고유한 파일명 생성
-            hash_suffix = hashlib.md5(image_url.encode()).hexdigest()[:8]
-            file_ext = os.path.splitext(image_url.split('?')[0])[1] or '.jpg'
-            file_name = f"{safe_name}_{hash_suffix}{file_ext}"
-            file_path = os.path.join(Config.IMAGES_DIR, file_name)
+            file_path = self.image_file_path(image_url, medicine_name)
             
             # 이미 다운로드된 파일이면 해당 경로 반환
             if os.path.exists(file_path):
@@ -747,7 +935,7 @@ class NaverAPIClient:
             self.logger.error(f"이미지 다운로드 중 오류 발생: {e}")
             return image_url
 
-    async def search_medicine_async(self, keyword, display=None, start=1):
+    async def search_medicine_async(self, keyword, display=None, start=1, session=None):
         """
         네이버 API를 사용하여 약품 검색 (비동기 버전)
         
@@ -755,6 +943,7 @@ class NaverAPIClient:
             keyword: 검색 키워드
             display: 한 번에 가져올 결과 수 (최대 100)
             start: 검색 시작 위치
+            session: 재사용할 aiohttp.ClientSession (없으면 이 요청에만 쓰는 세션 생성)
             
         Returns:
             dict: API 응답 데이터 또는 None (에러 발생 시)
@@ -775,21 +964,28 @@ class NaverAPIClient:
             "X-Naver-Client-Secret": self.client_secret
         }
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        # API 호출 카운터 업데이트
-                        self._update_api_call_count()
-                        return result
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(f"API 요청 실패: 응답 코드 {response.status}, 응답: {error_text}")
-                        return None
-            except Exception as e:
-                self.logger.error(f"비동기 API 요청 중 오류 발생: {e}")
-                return None
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self._search_with_session(own_session, url, headers)
+        return await self._search_with_session(session, url, headers)
+    
+    async def _search_with_session(self, session, url, headers):
+        try:
+            # 모든 워커/프로세스가 공유하는 호출 속도 제한
+            await self.rate_limiter.acquire_async()
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    # API 호출 카운터 업데이트
+                    self._update_api_call_count()
+                    return result
+                else:
+                    error_text = await response.text()
+                    self.logger.error(f"API 요청 실패: 응답 코드 {response.status}, 응답: {error_text}")
+                    return None
+        except Exception as e:
+            self.logger.error(f"비동기 API 요청 중 오류 발생: {e}")
+            return None
 
 
 class SearchManager:
@@ -810,6 +1006,35 @@ class SearchManager:
         self.db_manager = db_manager
         self.parser = parser
         self.logger = logger
+        
+        # 상세 페이지 요청/이미지 다운로드 스레드 풀, BeautifulSoup 파싱 프로세스 풀 (처음 사용할 때 생성)
+        self._fetch_pool = None
+        self._parse_pool = None
+        self._pool_lock = threading.Lock()
+    
+    def _get_pools(self):
+        """(요청 스레드 풀, 파싱 프로세스 풀 또는 None)"""
+        with self._pool_lock:
+            if self._fetch_pool is None:
+                self._fetch_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=Config.MAX_WORKERS, thread_name_prefix='detail-fetch'
+                )
+                if Config.PARSE_WORKERS > 0:
+                    try:
+                        self._parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=Config.PARSE_WORKERS)
+                    except (OSError, NotImplementedError) as e:
+                        self.logger.warning(f"파싱 프로세스 풀 생성 실패, 스레드에서 파싱: {e}")
+            return self._fetch_pool, self._parse_pool
+    
+    def close(self):
+        """스레드/프로세스 풀 종료"""
+        with self._pool_lock:
+            if self._fetch_pool is not None:
+                self._fetch_pool.shutdown(wait=True)
+                self._fetch_pool = None
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
     
     def is_medicine_item(self, item):
         """
@@ -965,15 +1190,35 @@ class SearchManager:
         
         return filtered_items
     
-    def process_search_item(self, item):
+    def parse_page(self, html_content, url, title):
         """
-        하나의 검색 결과 항목 처리
+        상세 페이지 파싱 및 검증 (파싱 프로세스 풀이 있으면 다른 프로세스에서 실행)
+        
+        Returns:
+            tuple: (약품 정보 또는 None, 검증 결과 또는 None)
+        """
+        parse_pool = self._parse_pool
+        if parse_pool is not None:
+            try:
+                return parse_pool.submit(parse_medicine_page, html_content, url, title).result()
+            except concurrent.futures.BrokenExecutor as e:
+                self.logger.warning(f"파싱 프로세스 오류, 스레드에서 파싱: {e}")
+        
+        soup = BeautifulSoup(html_content, 'html.parser')
+        medicine_data = self.parser.parse_medicine_detail(soup, url, title)
+        if not medicine_data:
+            return None, None
+        return medicine_data, self.parser.validate_medicine_data(medicine_data)
+    
+    def prepare_search_item(self, item):
+        """
+        검색 결과 항목의 상세 페이지 요청, 파싱, 이미지 다운로드 (저장 전 단계, 요청 스레드에서 실행)
         
         Args:
             item: 처리할 검색 결과 항목
             
         Returns:
-            bool: 성공적으로 처리되면 True, 아니면 False
+            dict: 저장할 약품 정보 또는 None
         """
         try:
             title = BeautifulSoup(item['title'], 'html.parser').get_text()
@@ -985,22 +1230,17 @@ class SearchManager:
             html_content = self.api_client.get_html_content(url)
             if not html_content:
                 self.logger.warning(f"HTML 내용을 가져올 수 없음: {url}")
-                return False
-            
-            # HTML 파싱
-            soup = BeautifulSoup(html_content, 'html.parser')
+                return None
             
-            # 의약품 정보 파싱
-            medicine_data = self.parser.parse_medicine_detail(soup, url, title)
+            # 의약품 정보 파싱 및 데이터 검증
+            medicine_data, validation_result = self.parse_page(html_content, url, title)
             if not medicine_data:
                 self.logger.warning(f"약품 정보를 파싱할 수 없음: {title}")
-                return False
+                return None
             
-            # 데이터 검증
-            validation_result = self.parser.validate_medicine_data(medicine_data)
             if not validation_result['is_valid']:
                 self.logger.warning(f"약품 데이터 유효성 검사 실패: {title}, 이유: {validation_result['reason']}")
-                return False
+                return None
             
             # 이미지가 있으면 다운로드
             if medicine_data.get('item_image'):
@@ -1013,19 +1253,42 @@ class SearchManager:
             
             # 데이터 해시 생성
             medicine_data['data_hash'] = generate_data_hash(medicine_data)
-            
-            # 데이터베이스에 저장
-            result = self.db_manager.save_medicine_to_db(medicine_data)
-            if result:
-                self.logger.info(f"약품 정보 저장 완료: {title}")
-                return True
-            else:
-                self.logger.warning(f"약품 정보 저장 실패: {title}")
-                return False
+            return medicine_data
                 
         except Exception as e:
             self.logger.error(f"검색 항목 처리 중 오류 발생: {str(e)}", exc_info=True)
+            return None
+    
+    def save_search_item(self, medicine_data):
+        """
+        준비된 약품 정보 저장 (호출 스레드 하나에서만 실행)
+        
+        Returns:
+            bool: 성공적으로 저장되면 True, 아니면 False
+        """
+        title = medicine_data['item_name']
+        result = self.db_manager.save_medicine_to_db(medicine_data)
+        if result:
+            self.logger.info(f"약품 정보 저장 완료: {title}")
+            return True
+        else:
+            self.logger.warning(f"약품 정보 저장 실패: {title}")
+            return False
+    
+    def process_search_item(self, item):
+        """
+        하나의 검색 결과 항목 처리
+        
+        Args:
+            item: 처리할 검색 결과 항목
+            
+        Returns:
+            bool: 성공적으로 처리되면 True, 아니면 False
+        """
+        medicine_data = self.prepare_search_item(item)
+        if not medicine_data:
             return False
+        return self.save_search_item(medicine_data)
     
     def process_search_results(self, search_results):
         """
@@ -1051,12 +1314,20 @@ class SearchManager:
         # 중복 항목 필터링
         filtered_items = self.filter_duplicates(medicine_items)
         
-        # 결과 처리
+        # 결과 처리: 상세 페이지 요청/파싱/이미지는 동시에, 저장은 이 스레드에서 완료 순서대로
         processed_count = 0
-        for item in filtered_items:
-            success = self.process_search_item(item)
-            if success:
-                processed_count += 1
+        if len(filtered_items) > 1 and Config.MAX_WORKERS > 1:
+            fetch_pool, _ = self._get_pools()
+            futures = [fetch_pool.submit(self.prepare_search_item, item) for item in filtered_items]
+            for future in concurrent.futures.as_completed(futures):
+                medicine_data = future.result()
+                if medicine_data and self.save_search_item(medicine_data):
+                    processed_count += 1
+        else:
+            for item in filtered_items:
+                success = self.process_search_item(item)
+                if success:
+                    processed_count += 1
         
         return processed_count, len(medicine_items), len(medicine_items) - len(filtered_items)
     
@@ -1092,9 +1363,6 @@ class SearchManager:
         display = Config.DEFAULT_SEARCH_DISPLAY
         
         while start <= max_results and not self.api_client.check_api_limit():
-            # API 호출 간 딜레이
-            time.sleep(Config.API_DELAY)
-            
             self.logger.info(f"'{keyword}' 검색 결과 {start}~{start+display-1} 요청 중...")
             result = self.api_client.search_medicine(keyword, display=display, start=start)
             api_calls += 1
@@ -1121,88 +1389,6 @@ class SearchManager:
         self.logger.info(f"키워드 '{keyword}' 검색 완료: {fetched_items}개 수집, API 호출 {api_calls}회")
         return fetched_items, api_calls
     
-    async def fetch_keyword_data_async(self, keyword, max_results=1000):
-        """
-        특정 키워드에 대한 데이터 수집 (비동기 버전)
-        
-        Args:
-            keyword: 검색 키워드
-            max_results: 최대 결과 수
-            
-        Returns:
-            tuple: (수집된 항목 수, API 호출 횟수)
-        """
-        fetched_items = 0
-        api_calls = 0
-        
-        self.logger.info(f"[Async] 키워드 '{keyword}' 검색 시작")
-        
-        # 예상 결과 수 확인 (API 호출 1회)
-        initial_result = await self.api_client.search_medicine_async(keyword, display=1, start=1)
-        api_calls += 1
-        
-        if not initial_result or 'total' not in initial_result:
-            self.logger.warning(f"[Async] 키워드 '{keyword}'에 대한 검색 결과가 없거나 API 응답 오류")
-            return 0, api_calls
-        
-        keyword_total = min(int(initial_result['total']), max_results)
-        self.logger.info(f"[Async] 키워드 '{keyword}'에 대한 예상 결과 수: {keyword_total}")
-        
-        # 결과 페이지네이션
-        tasks = []
-        for start in range(1, min(keyword_total + 1, max_results + 1), Config.DEFAULT_SEARCH_DISPLAY):
-            # API 한도 체크
-            if self.api_client.check_api_limit():
-                break
-                
-            # 작업 추가
-            tasks.append(self.api_client.search_medicine_async(
-                keyword, 
-                display=Config.DEFAULT_SEARCH_DISPLAY, 
-                start=start
-            ))
-            
-            # API 호출 횟수 업데이트
-            api_calls += 1
-            
-            # 동시 요청이 너무 많지 않도록 작업 배치 처리
-            if len(tasks) >= 5:  # 최대 5개 요청 동시 처리
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in results:
-                    if isinstance(result, Exception):
-                        self.logger.error(f"[Async] API 요청 실패: {result}")
-                        continue
-                        
-                    if not result or 'items' not in result or not result['items']:
-                        continue
-                        
-                    # 검색 결과 처리 (비동기 함수에서는 동기 함수 호출에 주의)
-                    processed, medicine_count, duplicate_count = self.process_search_results(result)
-                    fetched_items += processed
-                
-                # 작업 목록 초기화
-                tasks = []
-                
-                # API 딜레이
-                await asyncio.sleep(Config.API_DELAY)
-        
-        # 남은 작업 처리
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.error(f"[Async] API 요청 실패: {result}")
-                    continue
-                    
-                if not result or 'items' not in result or not result['items']:
-                    continue
-                    
-                processed, medicine_count, duplicate_count = self.process_search_results(result)
-                fetched_items += processed
-        
-        self.logger.info(f"[Async] 키워드 '{keyword}' 검색 완료: {fetched_items}개 수집, API 호출 {api_calls}회")
-        return fetched_items, api_calls
-    
 class MedicineParser:
     """
     의약품 정보 파싱을 담당하는 클래스
@@ -1722,6 +1908,236 @@ class MedicineParser:
         
         return result
     
+# 파싱 프로세스마다 한 번 만드는 파서
+_process_parser = None
+
+def parse_medicine_page(html_content, url, title):
+    """
+    상세 페이지 HTML 파싱 및 검증 (프로세스 풀에서 실행)
+    
+    Returns:
+        tuple: (약품 정보 또는 None, 검증 결과 또는 None)
+    """
+    global _process_parser
+    if _process_parser is None:
+        _process_parser = MedicineParser(logging.getLogger('medicine_crawler'))
+    
+    soup = BeautifulSoup(html_content, 'html.parser')
+    medicine_data = _process_parser.parse_medicine_detail(soup, url, title)
+    if not medicine_data:
+        return None, None
+    return medicine_data, _process_parser.validate_medicine_data(medicine_data)
+
+class DedupIndex:
+    """
+    api_medicine 의 URL, 정규화한 제목, 데이터 해시를 메모리에 둔 중복 검사 색인
+    
+    값마다 8바이트 blake2b 요약을 정수로 저장하여 (문자열 대신) 메모리를 줄인다.
+    충돌 확률은 수십만 건 기준 10^-8 이하로, 중복 검사에 DB 확인 없이 사용한다.
+    시작 시 테이블 전체를 한 번 읽고, 이후 저장 요청마다 add() 로 갱신한다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.urls = set()
+        self.titles = set()
+        self.hashes = set()
+    
+    @staticmethod
+    def digest(value):
+        """문자열 → 8바이트 정수 요약"""
+        return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+    
+    @staticmethod
+    def normalize_title(title):
+        """대괄호/소괄호 내용과 공백을 제거하고 소문자로 변환한 제목"""
+        title = re.sub(r'\[.*?\]|\(.*?\)', '', title)
+        return re.sub(r'\s+', '', title).lower()
+    
+    def load(self, conn):
+        """DB 의 기존 약품으로 색인 생성"""
+        urls, titles, hashes = set(), set(), set()
+        for url, item_name, data_hash in conn.execute("SELECT url, item_name, data_hash FROM api_medicine"):
+            if url:
+                urls.add(self.digest(url))
+            if item_name:
+                titles.add(self.digest(self.normalize_title(item_name)))
+            if data_hash:
+                hashes.add(self.digest(data_hash))
+        with self._lock:
+            self.urls, self.titles, self.hashes = urls, titles, hashes
+        return len(urls)
+    
+    def add(self, medicine_data):
+        """새로 저장하는 약품을 색인에 추가"""
+        url = medicine_data.get('url')
+        item_name = medicine_data.get('item_name')
+        data_hash = medicine_data.get('data_hash')
+        with self._lock:
+            if url:
+                self.urls.add(self.digest(url))
+            if item_name:
+                self.titles.add(self.digest(self.normalize_title(item_name)))
+            if data_hash:
+                self.hashes.add(self.digest(data_hash))
+    
+    def discard(self, medicine_data):
+        """기록에 실패한 약품을 색인에서 제거 (이후 다시 수집할 수 있도록)"""
+        url = medicine_data.get('url')
+        item_name = medicine_data.get('item_name')
+        data_hash = medicine_data.get('data_hash')
+        with self._lock:
+            if url:
+                self.urls.discard(self.digest(url))
+            if item_name:
+                self.titles.discard(self.digest(self.normalize_title(item_name)))
+            if data_hash:
+                self.hashes.discard(self.digest(data_hash))
+    
+    def has_url(self, url):
+        return bool(url) and self.digest(url) in self.urls
+    
+    def has_title(self, title):
+        if not title:
+            return False
+        normalized = self.normalize_title(title)
+        return bool(normalized) and self.digest(normalized) in self.titles
+    
+    def has_hash(self, data_hash):
+        return bool(data_hash) and self.digest(data_hash) in self.hashes
+    
+    def stats(self):
+        return {'urls': len(self.urls), 'titles': len(self.titles), 'hashes': len(self.hashes)}
+
+class MedicineWriter:
+    """
+    api_medicine 저장 전용 쓰기 스레드
+    
+    저장 요청을 대기열에 모아 DB_WRITE_BATCH_SIZE 개 또는 DB_WRITE_INTERVAL 초마다
+    한 트랜잭션(executemany)으로 기록한다. 쓰기 연결은 이 스레드만 사용한다.
+    배치 기록이 실패하면 항목별로 다시 기록하고, 그래도 실패한 항목은 on_failed 로 알린다.
+    """
+    def __init__(self, connect, columns, logger,
+                 batch_size=Config.DB_WRITE_BATCH_SIZE, interval=Config.DB_WRITE_INTERVAL, on_failed=None):
+        """
+        쓰기 스레드 초기화
+        
+        Args:
+            connect: 쓰기 연결을 만드는 함수
+            columns: 저장할 api_medicine 컬럼 목록
+            logger: 로깅 객체
+            batch_size: 한 트랜잭션의 최대 항목 수
+            interval: 모인 항목을 저장하는 최대 간격 (초)
+            on_failed: 기록하지 못한 항목마다 호출할 함수 (약품 정보를 인자로 받음)
+        """
+        self.connect = connect
+        self.on_failed = on_failed
+        self.columns = list(columns)
+        self.logger = logger
+        self.batch_size = batch_size
+        self.interval = interval
+        
+        # 컬럼 순서가 고정된 단일 SQL 이므로 sqlite3 문장 캐시로 한 번만 준비됨
+        # (URL 이 이미 있는 항목은 기존 동작처럼 저장하지 않음)
+        self.insert_sql = (
+            f"INSERT OR IGNORE INTO api_medicine ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join(['?'] * len(self.columns))})"
+        )
+        
+        self._queue = queue.Queue()
+        self.stats = {'saved': 0, 'ignored': 0, 'failed': 0, 'transactions': 0}
+        
+        self._thread = threading.Thread(target=self._run, name='medicine-writer', daemon=True)
+        self._thread.start()
+    
+    def submit(self, medicine_data):
+        """저장 요청 (기록은 쓰기 스레드에서 비동기로 수행)"""
+        self._queue.put(medicine_data)
+    
+    def flush(self, timeout=None):
+        """대기 중인 항목을 모두 기록할 때까지 대기"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout=None):
+        """남은 항목 기록 후 쓰기 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+    
+    def _run(self):
+        conn = self.connect()
+        try:
+            while True:
+                batch = []
+                markers = []
+                stop = False
+                deadline = time.monotonic() + self.interval
+                
+                # 첫 항목은 계속 대기, 이후 항목은 배치가 차거나 간격이 지날 때까지 모음
+                entry = self._queue.get()
+                while True:
+                    if entry is None:
+                        stop = True
+                        break
+                    if isinstance(entry, threading.Event):
+                        markers.append(entry)
+                        break
+                    batch.append(entry)
+                    if len(batch) >= self.batch_size:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                
+                if batch:
+                    self._write(conn, batch)
+                for marker in markers:
+                    marker.set()
+                if stop:
+                    break
+        finally:
+            conn.close()
+    
+    def _write(self, conn, batch):
+        rows = [tuple(medicine_data.get(column) for column in self.columns) for medicine_data in batch]
+        try:
+            before = conn.total_changes
+            with conn:
+                conn.executemany(self.insert_sql, rows)
+            saved = conn.total_changes - before
+            self.stats['saved'] += saved
+            self.stats['ignored'] += len(rows) - saved
+            self.stats['transactions'] += 1
+            self.logger.debug(f"약품 정보 일괄 저장: {saved}/{len(rows)}개")
+            if saved < len(rows):
+                self.logger.info(f"URL 중복으로 저장하지 않은 항목: {len(rows) - saved}개")
+        except sqlite3.Error as e:
+            self.logger.error(f"약품 정보 일괄 저장 중 오류, 항목별로 다시 저장: {e}", exc_info=True)
+            self._write_each(conn, batch, rows)
+    
+    def _write_each(self, conn, batch, rows):
+        """배치 실패 시 항목별 저장 (문제 있는 항목만 실패 처리)"""
+        for medicine_data, row in zip(batch, rows):
+            try:
+                before = conn.total_changes
+                with conn:
+                    conn.execute(self.insert_sql, row)
+                if conn.total_changes > before:
+                    self.stats['saved'] += 1
+                else:
+                    self.stats['ignored'] += 1
+            except sqlite3.Error as e:
+                self.stats['failed'] += 1
+                self.logger.error(f"약품 정보 저장 실패: {medicine_data.get('item_name')} - {e}")
+                if self.on_failed is not None:
+                    self.on_failed(medicine_data)
+        self.stats['transactions'] += len(rows)
+
 class DatabaseManager:
     """
     데이터베이스 관리를 담당하는 클래스
@@ -1737,14 +2153,35 @@ class DatabaseManager:
         self.db_path = db_path
         self.logger = logger
         self.init_db()
+        
+        # 중복 검사용 읽기 연결 (WAL 모드라 쓰기 스레드와 서로 막지 않음)
+        self._read_conn = self.get_connection(check_same_thread=False)
+        self._read_lock = threading.Lock()
+        
+        # 중복 검사 색인 (URL/제목/해시)
+        self.dedup = DedupIndex()
+        started = time.perf_counter()
+        with self._read_lock:
+            loaded = self.dedup.load(self._read_conn)
+        self.logger.info(f"중복 검사 색인 생성: {loaded}개 약품, {time.perf_counter() - started:.2f}초")
+        
+        # 저장 전용 쓰기 스레드
+        # 기록에 실패한 항목은 색인에서 빼서 다시 수집할 수 있게 함
+        self.writer = MedicineWriter(
+            self.get_connection, self.medicine_columns, self.logger, on_failed=self.dedup.discard
+        )
     
     def init_db(self):
         """
         데이터베이스 초기화 및 테이블 생성
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
+        # WAL 모드는 DB 파일에 유지되므로 한 번만 설정
+        journal_mode = cursor.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        self.logger.info(f"저널 모드: {journal_mode}")
+        
         self.logger.info(f"데이터베이스 연결 완료: {self.db_path}")
         
         # 테이블 정보 확인 로깅
@@ -1819,18 +2256,43 @@ class DatabaseManager:
             self.logger.error(f"인덱스 생성 중 오류 발생: {e}")
         
         conn.commit()
+        
+        # 저장할 컬럼 목록 (자동 생성 컬럼 제외)
+        cursor.execute("PRAGMA table_info(api_medicine)")
+        self.medicine_columns = [
+            col[1] for col in cursor.fetchall()
+            if col[1] not in ('id', 'created_at', 'updated_at')
+        ]
         conn.close()
         
         self.logger.info("데이터베이스 초기화 완료")
     
-    def get_connection(self):
+    def get_connection(self, check_same_thread=True):
         """
         데이터베이스 연결 객체 반환
         
+        WAL 모드에서는 synchronous=NORMAL 로도 충돌 시 DB 가 손상되지 않으며,
+        커밋마다 fsync 하지 않고 체크포인트 시에만 동기화한다.
+        
+        Args:
+            check_same_thread: False 면 다른 스레드에서도 사용 가능 (호출자가 잠금 관리)
+        
         Returns:
             sqlite3.Connection: SQLite 연결 객체
         """
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=Config.DB_BUSY_TIMEOUT, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def flush(self, timeout=None):
+        """쓰기 스레드에 대기 중인 항목을 모두 기록"""
+        return self.writer.flush(timeout)
+    
+    def close(self):
+        """쓰기 스레드 종료 및 연결 정리"""
+        self.writer.close()
+        with self._read_lock:
+            self._read_conn.close()
     
     def get_tables_info(self):
         """
@@ -1839,6 +2301,7 @@ class DatabaseManager:
         Returns:
             dict: 테이블별 레코드 수
         """
+        self.flush()
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -1878,40 +2341,14 @@ class DatabaseManager:
         Returns:
             bool: 중복이면 True, 아니면 False
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # URL로 중복 검사
-        cursor.execute("SELECT id FROM api_medicine WHERE url = ?", (url,))
-        url_match = cursor.fetchone()
-        
-        # URL 매치가 있으면 바로 중복으로 판단
-        if url_match:
-            conn.close()
+        # 메모리 색인 조회 (저장 요청 시점에 갱신되므로 아직 기록 중인 항목도 포함)
+        if self.dedup.has_url(url):
             return True
         
-        # 제목이 제공된 경우, 제목으로 중복 검사
-        if title:
-            # 정확히 일치하는 경우
-            cursor.execute("SELECT id FROM api_medicine WHERE item_name = ?", (title,))
-            exact_title_match = cursor.fetchone()
-            
-            if exact_title_match:
-                conn.close()
-                return True
-            
-            # 유사 제목 검사 (제목에 대괄호나 소괄호가 포함된 경우)
-            base_title = re.sub(r'\[.*?\]|\(.*?\)', '', title).strip()
-            if base_title != title and len(base_title) > 3:  # 기본 제목이 최소 4자 이상인 경우만
-                # LIKE 연산자를 사용한 유사 검색
-                cursor.execute("SELECT id FROM api_medicine WHERE item_name LIKE ?", (f"%{base_title}%",))
-                similar_title_match = cursor.fetchone()
-                
-                if similar_title_match:
-                    conn.close()
-                    return True
+        # 제목이 제공된 경우, 정규화한 제목(괄호 내용, 공백 제거)으로 중복 검사
+        if title and self.dedup.has_title(title):
+            return True
         
-        conn.close()
         return False
     
     def is_content_duplicate(self, data_hash):
@@ -1924,24 +2361,19 @@ class DatabaseManager:
         Returns:
             bool: 중복이면 True, 아니면 False
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT id FROM api_medicine WHERE data_hash = ?", (data_hash,))
-        hash_match = cursor.fetchone()
-        
-        conn.close()
-        return bool(hash_match)
+        return self.dedup.has_hash(data_hash)
     
     def save_medicine_to_db(self, medicine_data):
         """
         약품 정보를 데이터베이스에 저장
         
+        중복 검사 후 쓰기 스레드에 넘기며, 실제 기록은 다음 배치 트랜잭션에서 이루어진다.
+        
         Args:
             medicine_data: 약품 정보 딕셔너리
             
         Returns:
-            bool: 성공적으로 저장되면 True, 아니면 False
+            bool: 저장 요청이 접수되면 True, 중복이거나 오류면 False
         """
         try:
             # 데이터 해시 확인 (해시가 없으면 새로 생성)
@@ -1953,30 +2385,16 @@ class DatabaseManager:
                 self.logger.info(f"콘텐츠 중복으로 건너뜀: {medicine_data['item_name']}")
                 return False
             
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # 컬럼 이름 목록
-            columns = [key for key in medicine_data.keys()]
-            placeholders = ', '.join(['?' for _ in columns])
-            column_str = ', '.join(columns)
-            
-            # 데이터 준비
-            values = tuple(medicine_data.get(col, '') for col in columns)
-            
-            # 삽입 쿼리 실행
-            cursor.execute(f"""
-            INSERT INTO api_medicine ({column_str}) 
-            VALUES ({placeholders})
-            """, values)
-            
-            conn.commit()
+            # 테이블에 없는 키는 기록하지 않음
+            unknown_columns = set(medicine_data) - set(self.medicine_columns)
+            if unknown_columns:
+                self.logger.debug(f"저장하지 않는 필드: {sorted(unknown_columns)}")
             
-            # 삽입된 row ID 확인
-            inserted_id = cursor.lastrowid
-            conn.close()
+            # 색인은 바로 갱신하여 기록 전에도 같은 약품을 중복으로 판단
+            self.dedup.add(medicine_data)
+            self.writer.submit(medicine_data)
             
-            self.logger.info(f"약품 정보 저장 완료 (ID: {inserted_id}): {medicine_data['item_name']}")
+            self.logger.info(f"약품 정보 저장 요청: {medicine_data['item_name']}")
             return True
             
         except Exception as e:
@@ -2101,6 +2519,7 @@ class DatabaseManager:
             dict: 통계 정보
         """
         try:
+            self.flush()
             conn = self.get_connection()
             cursor = conn.cursor()
             
@@ -2212,6 +2631,7 @@ class DatabaseManager:
             bool: 성공적으로 최적화되면 True, 아니면 False
         """
         try:
+            self.flush()
             conn = self.get_connection()
             cursor = conn.cursor()
             
@@ -2227,6 +2647,231 @@ class DatabaseManager:
             self.logger.error(f"데이터베이스 최적화 중 오류: {str(e)}", exc_info=True)
             return False
         
+class AsyncCrawlEngine:
+    """
+    비동기 크롤링 엔진 (--async)
+    
+    - 연결 수가 제한된 aiohttp 세션 하나를 검색 API, 상세 페이지, 이미지 요청에 재사용
+    - BeautifulSoup 파싱은 파싱 프로세스 풀(없으면 기본 스레드 풀)에서 실행하여 이벤트 루프를 막지 않음
+    - 저장은 asyncio.Queue 를 소비하는 저장 태스크 하나가 순서대로 처리 (쓰기 스레드로 전달)
+    
+    사용법:
+        async with AsyncCrawlEngine(api_client, search_manager, db_manager, logger) as engine:
+            fetched, api_calls = await engine.fetch_keyword_data(keyword)
+    """
+    def __init__(self, api_client, search_manager, db_manager, logger, concurrency=None):
+        """
+        비동기 크롤링 엔진 초기화
+        
+        Args:
+            api_client: NaverAPIClient 인스턴스 (검색 API 호출, 호출 횟수 관리)
+            search_manager: SearchManager 인스턴스 (의약품/중복 필터, 파싱 프로세스 풀)
+            db_manager: DatabaseManager 인스턴스
+            logger: 로깅 객체
+            concurrency: 동시 상세 페이지/이미지 요청 수 (기본값: Config.MAX_WORKERS)
+        """
+        self.api_client = api_client
+        self.search_manager = search_manager
+        self.db_manager = db_manager
+        self.logger = logger
+        self.concurrency = concurrency or Config.MAX_WORKERS
+        self.session = None
+        self.queue = None
+        self._persister = None
+        self._request_semaphore = None
+        self._parse_pool = None
+    
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency * 2, limit_per_host=self.concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15),
+            headers={'User-Agent': self.api_client.session.headers.get('User-Agent', '')}
+        )
+        self.queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        self._request_semaphore = asyncio.Semaphore(self.concurrency)
+        _, self._parse_pool = self.search_manager._get_pools()
+        self._persister = asyncio.create_task(self._persist())
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            # 남은 저장 요청 처리 후 종료
+            await self.queue.join()
+        finally:
+            self._persister.cancel()
+            await asyncio.gather(self._persister, return_exceptions=True)
+            await self.session.close()
+    
+    async def _persist(self):
+        """저장 태스크: 대기열의 약품 정보를 하나씩 저장"""
+        while True:
+            medicine_data, result = await self.queue.get()
+            try:
+                saved = self.search_manager.save_search_item(medicine_data)
+                if not result.done():
+                    result.set_result(saved)
+            except Exception as e:
+                self.logger.error(f"[Async] 약품 정보 저장 중 오류: {e}", exc_info=True)
+                if not result.done():
+                    result.set_result(False)
+            finally:
+                self.queue.task_done()
+    
+    async def fetch_html(self, url, max_tries=3):
+        """상세 페이지 HTML 요청 (실패 시 지수 백오프로 재시도)"""
+        delay = 1
+        for attempt in range(max_tries):
+            try:
+                async with self._request_semaphore:
+                    async with self.session.get(url) as response:
+                        response.raise_for_status()
+                        return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"[Async] URL 접속 중 오류 발생 ({attempt+1}/{max_tries}): {url} - {e}")
+                if attempt < max_tries - 1:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+        return None
+    
+    async def download_image(self, image_url, medicine_name):
+        """이미지 다운로드 (NaverAPIClient.download_image 의 비동기 버전)"""
+        if not Config.ENABLE_IMAGE_DOWNLOAD:
+            return image_url
+        if not image_url:
+            return None
+        
+        file_path = self.api_client.image_file_path(image_url, medicine_name)
+        if os.path.exists(file_path):
+            return file_path
+        
+        try:
+            async with self._request_semaphore:
+                async with self.session.get(image_url) as response:
+                    response.raise_for_status()
+                    if (response.content_length or 0) > Config.MAX_IMAGE_SIZE:
+                        self.logger.warning(f"이미지 크기가 너무 큼: {response.content_length} bytes, 최대 허용: {Config.MAX_IMAGE_SIZE} bytes")
+                        return image_url
+                    content = await response.read()
+            
+            # 파일 쓰기는 스레드 풀에서
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_file, file_path, content)
+            self.logger.info(f"이미지 다운로드 완료: {file_path}")
+            return file_path
+        except Exception as e:
+            self.logger.error(f"[Async] 이미지 다운로드 중 오류 발생: {e}")
+            return image_url
+    
+    @staticmethod
+    def _write_file(file_path, content):
+        with open(file_path, 'wb') as f:
+            f.write(content)
+    
+    async def process_item(self, item):
+        """
+        검색 결과 항목 하나 처리 (요청 → 파싱 → 이미지 → 저장 대기열)
+        
+        Returns:
+            bool: 저장되면 True
+        """
+        try:
+            title = BeautifulSoup(item['title'], 'html.parser').get_text()
+            url = item['link']
+            self.logger.info(f"[Async] 약품 정보 수집 중: {title} ({url})")
+            
+            html_content = await self.fetch_html(url)
+            if not html_content:
+                self.logger.warning(f"HTML 내용을 가져올 수 없음: {url}")
+                return False
+            
+            # CPU 작업은 이벤트 루프 밖에서
+            loop = asyncio.get_running_loop()
+            medicine_data, validation_result = await loop.run_in_executor(
+                self._parse_pool, parse_medicine_page, html_content, url, title
+            )
+            if not medicine_data:
+                self.logger.warning(f"약품 정보를 파싱할 수 없음: {title}")
+                return False
+            if not validation_result['is_valid']:
+                self.logger.warning(f"약품 데이터 유효성 검사 실패: {title}, 이유: {validation_result['reason']}")
+                return False
+            
+            if medicine_data.get('item_image'):
+                local_image_path = await self.download_image(medicine_data['item_image'], medicine_data['item_name'])
+                if local_image_path:
+                    medicine_data['item_image'] = local_image_path
+            
+            medicine_data['data_hash'] = generate_data_hash(medicine_data)
+            
+            result = loop.create_future()
+            await self.queue.put((medicine_data, result))
+            return await result
+        except Exception as e:
+            self.logger.error(f"[Async] 검색 항목 처리 중 오류 발생: {e}", exc_info=True)
+            return False
+    
+    async def process_search_results(self, search_results):
+        """
+        검색 결과 처리 (SearchManager.process_search_results 의 비동기 버전)
+        
+        Returns:
+            tuple: (처리된 항목 수, 의약품 항목 수, 중복 항목 수)
+        """
+        if not search_results or not search_results.get('items'):
+            return 0, 0, 0
+        
+        medicine_items = [item for item in search_results['items'] if self.search_manager.is_medicine_item(item)]
+        # 중복 검사는 메모리 색인 조회라 이벤트 루프에서 바로 실행
+        filtered_items = self.search_manager.filter_duplicates(medicine_items)
+        
+        results = await asyncio.gather(*(self.process_item(item) for item in filtered_items))
+        return sum(1 for saved in results if saved), len(medicine_items), len(medicine_items) - len(filtered_items)
+    
+    async def fetch_keyword_data(self, keyword, max_results=1000):
+        """
+        특정 키워드에 대한 데이터 수집 (검색 페이지를 넘기는 동안 이전 페이지 항목을 동시에 처리)
+        
+        Returns:
+            tuple: (수집된 항목 수, API 호출 횟수)
+        """
+        api_calls = 0
+        self.logger.info(f"[Async] 키워드 '{keyword}' 검색 시작")
+        
+        # 예상 결과 수 확인 (API 호출 1회)
+        initial_result = await self.api_client.search_medicine_async(keyword, display=1, start=1, session=self.session)
+        api_calls += 1
+        
+        if not initial_result or 'total' not in initial_result:
+            self.logger.warning(f"[Async] 키워드 '{keyword}'에 대한 검색 결과가 없거나 API 응답 오류")
+            return 0, api_calls
+        
+        keyword_total = min(int(initial_result['total']), max_results)
+        self.logger.info(f"[Async] 키워드 '{keyword}'에 대한 예상 결과 수: {keyword_total}")
+        
+        display = Config.DEFAULT_SEARCH_DISPLAY
+        page_tasks = []
+        for start in range(1, keyword_total + 1, display):
+            if self.api_client.check_api_limit():
+                break
+            
+            result = await self.api_client.search_medicine_async(keyword, display=display, start=start, session=self.session)
+            api_calls += 1
+            if not result or not result.get('items'):
+                self.logger.info(f"[Async] '{keyword}'에 대한 추가 결과 없음 또는 마지막 페이지 도달")
+                break
+            
+            page_tasks.append(asyncio.create_task(self.process_search_results(result)))
+            if len(result['items']) < display:
+                break
+        
+        fetched_items = 0
+        for processed, medicine_count, duplicate_count in await asyncio.gather(*page_tasks):
+            fetched_items += processed
+        
+        self.logger.info(f"[Async] 키워드 '{keyword}' 검색 완료: {fetched_items}개 수집, API 호출 {api_calls}회")
+        return fetched_items, api_calls
+
 class NaverMedicineCrawler:
     """
     네이버 의약품 크롤링을 총괄하는 클래스
@@ -2248,8 +2893,7 @@ class NaverMedicineCrawler:
         
         # 컴포넌트 초기화
         self.db_manager = DatabaseManager(self.db_path, self.logger)
-        self.db_conn = self.db_manager.get_connection()
-        self.api_client = NaverAPIClient(client_id, client_secret, self.db_conn, self.logger)
+        self.api_client = NaverAPIClient(client_id, client_secret, self.db_manager.get_connection, self.logger)
         self.parser = MedicineParser(self.logger)
         self.search_manager = SearchManager(self.api_client, self.db_manager, self.parser, self.logger)
         
@@ -2264,11 +2908,19 @@ class NaverMedicineCrawler:
         
         self.logger.info("네이버 의약품 크롤러 초기화 완료")
     
+    def close(self):
+        """대기 중인 저장 요청 기록 후 연결 정리"""
+        if hasattr(self, 'search_manager'):
+            self.search_manager.close()
+        if hasattr(self, 'api_client'):
+            self.api_client.close()
+        if hasattr(self, 'db_manager'):
+            self.db_manager.close()
+    
     def __del__(self):
         """소멸자: 리소스 정리"""
         try:
-            if hasattr(self, 'db_conn') and self.db_conn:
-                self.db_conn.close()
+            self.close()
         except Exception:
             pass
     
@@ -2323,11 +2975,12 @@ class NaverMedicineCrawler:
                             bar_format="{l_bar}%s{bar}%s{r_bar}" % (Fore.GREEN, Style.RESET_ALL))
         
         # 키워드별 데이터 수집
+        self.stats['mode'] = 'async' if use_async else 'sync'
+        self.stats['started_at'] = time.perf_counter()
         try:
             if use_async:
                 # 비동기 실행이 요청된 경우 asyncio 이벤트 루프 생성
-                loop = asyncio.get_event_loop()
-                loop.run_until_complete(self._process_keywords_async(remaining_keywords, max_results_per_keyword, main_progress))
+                asyncio.run(self._process_keywords_async(remaining_keywords, max_results_per_keyword, main_progress))
             else:
                 # 동기 방식 실행
                 self._process_keywords(remaining_keywords, max_results_per_keyword, main_progress)
@@ -2439,6 +3092,7 @@ class NaverMedicineCrawler:
         """
         # 병렬 처리 수 제한
         semaphore = asyncio.Semaphore(Config.MAX_WORKERS)
+        engine = AsyncCrawlEngine(self.api_client, self.search_manager, self.db_manager, self.logger)
         
         async def process_keyword(keyword):
             async with semaphore:
@@ -2446,7 +3100,7 @@ class NaverMedicineCrawler:
                 
                 try:
                     # 이 키워드에 대한 결과 수집
-                    fetched_count, api_calls = await self.search_manager.fetch_keyword_data_async(keyword, max_results_per_keyword)
+                    fetched_count, api_calls = await engine.fetch_keyword_data(keyword, max_results_per_keyword)
                     
                     # 통계 업데이트
                     self.stats['fetched_items'] += fetched_count
@@ -2477,18 +3131,19 @@ class NaverMedicineCrawler:
         if keywords:
             save_in_progress_keyword(keywords[0])
         
-        # 태스크 생성 및 실행
-        tasks = []
-        for keyword in keywords:
-            if self.api_client.check_api_limit():
-                self.logger.warning(f"[Async] 일일 API 호출 한도에 도달: {self.api_client.today_api_calls}회. 추가 태스크 생성 중단.")
-                break
-                
-            task = asyncio.create_task(process_keyword(keyword))
-            tasks.append(task)
-        
-        # 모든 태스크 완료 대기
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 태스크 생성 및 실행 (세션, 저장 태스크는 모든 키워드가 공유)
+        async with engine:
+            tasks = []
+            for keyword in keywords:
+                if self.api_client.check_api_limit():
+                    self.logger.warning(f"[Async] 일일 API 호출 한도에 도달: {self.api_client.today_api_calls}회. 추가 태스크 생성 중단.")
+                    break
+                    
+                task = asyncio.create_task(process_keyword(keyword))
+                tasks.append(task)
+            
+            # 모든 태스크 완료 대기
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # 진행 중인 키워드 표시 제거
         clear_in_progress_keyword()
@@ -2503,12 +3158,22 @@ class NaverMedicineCrawler:
         크롤링 결과 요약 출력
         """
         print(f"{Fore.CYAN}{'='*80}")
+        # 저장 요청 후 DB 기록에 실패한 항목은 수집이 아닌 실패로 집계
+        self.db_manager.flush()
+        write_failed = self.db_manager.writer.stats['failed']
+        
         print(f"{Fore.CYAN}크롤링 결과 요약")
         print(f"{Fore.CYAN}{'='*80}")
-        print(f"총 수집 항목: {Fore.GREEN}{self.stats['fetched_items']}개{Style.RESET_ALL}")
+        print(f"총 수집 항목: {Fore.GREEN}{self.stats['fetched_items'] - write_failed}개{Style.RESET_ALL}")
         print(f"총 API 호출: {Fore.YELLOW}{self.stats['api_calls']}회{Style.RESET_ALL}")
         print(f"건너뛴 항목: {Fore.BLUE}{self.stats['skipped_items']}개{Style.RESET_ALL}")
-        print(f"실패한 항목: {Fore.RED}{self.stats['failed_items']}개{Style.RESET_ALL}")
+        print(f"실패한 항목: {Fore.RED}{self.stats['failed_items'] + write_failed}개{Style.RESET_ALL} (DB 기록 실패 {write_failed}개)")
+        
+        # 처리 속도 (동기/비동기 방식 비교용)
+        if 'started_at' in self.stats:
+            elapsed = time.perf_counter() - self.stats['started_at']
+            rate = self.stats['fetched_items'] / elapsed * 60 if elapsed > 0 else 0
+            print(f"실행 방식: {self.stats['mode']}, 소요 시간: {elapsed:.1f}초, 처리 속도: {Fore.GREEN}{rate:.1f}개/분{Style.RESET_ALL}")
         
         # 데이터베이스 통계 출력
         db_stats = self.db_manager.get_tables_info()
@@ -2604,6 +3269,7 @@ class NaverMedicineCrawler:
         import csv
         
         try:
+            self.db_manager.flush()
             conn = self.db_manager.get_connection()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
@@ -2684,6 +3350,7 @@ def main():
     args = parser.parse_args()
     logger.info(f"명령줄 인자: {vars(args)}")
     
+    crawler = None
     try:
         # 크롤러 인스턴스 생성
         logger.info("크롤러 인스턴스 생성 시작")
@@ -2744,6 +3411,10 @@ def main():
     except Exception as e:
         logger.critical(f"프로그램 실행 중 심각한 오류 발생: {e}", exc_info=True)
         print(f"{Fore.RED}오류 발생: {e}{Style.RESET_ALL}")
+    finally:
+        # 쓰기 스레드에 남은 저장 요청 기록
+        if crawler is not None:
+            crawler.close()
     
     # 실행 종료 시간
     end_time = datetime.now()
@@ -0,0 +1,150 @@
+"""검색 결과 처리 방식 비교 (순차 vs 스레드 풀 vs 비동기 엔진)
+
+사용법:
+    python benchmark_crawl_engine.py [--items N] [--latency 초] [--workers N]
+
+로컬 HTTP 서버가 지연 시간을 두고 약품 상세 페이지를 돌려주고, 각 방식이
+임시 SQLite DB 에 저장할 때까지의 처리 속도(개/초)를 측정한다.
+네이버 API 는 호출하지 않는다.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import API_medicine_crawler_v2 as crawler_module
+from API_medicine_crawler_v2 import AsyncCrawlEngine, Config, NaverMedicineCrawler
+
+DETAIL_PAGE = """<html><body>
+<h2>테스트{label}정{index}밀리그램</h2>
+<table>
+<tr><th>업체명</th><td>테스트제약(주)</td></tr>
+<tr><th>분류</th><td>[01140]해열.진통.소염제</td></tr>
+<tr><th>구분</th><td>일반의약품</td></tr>
+<tr><th>성상</th><td>흰색의 원형 정제</td></tr>
+</table>
+<h3>효능효과</h3><p>두통, 치통, 생리통의 진통 및 해열</p>
+<h3>용법용량</h3><p>성인 1회 1정, 1일 3회 복용합니다.</p>
+<h3>사용상의주의사항</h3><p>1. 다음 환자는 복용하지 말 것. 이 약에 과민증 환자</p>
+</body></html>"""
+
+
+class DetailPageHandler(BaseHTTPRequestHandler):
+    """지연 시간 후 상세 페이지를 돌려주는 핸들러"""
+    latency = 0.1
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        label, index = self.path.rsplit('/', 2)[-2:]
+        body = DETAIL_PAGE.format(label=label, index=index).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def search_result(base_url, label, num_items):
+    """네이버 백과 검색 API 형식의 응답 (URL 은 로컬 서버, 제목/URL 은 방식마다 다르게)"""
+    return {
+        'total': num_items,
+        'items': [
+            {
+                'title': f'<b>테스트</b>{label}정{i}밀리그램',
+                'link': f'{base_url}/medicinedic/{label}/{i}',
+                'description': '효능, 용법, 성분'
+            }
+            for i in range(num_items)
+        ]
+    }
+
+
+def run_threaded(db_path, result, workers):
+    """SearchManager.process_search_results (workers=1 이면 순차 처리)"""
+    Config.MAX_WORKERS = workers
+    crawler = NaverMedicineCrawler('benchmark', 'benchmark', db_path)
+    try:
+        started = time.perf_counter()
+        processed, _, _ = crawler.search_manager.process_search_results(result)
+        crawler.db_manager.flush()
+        return processed, time.perf_counter() - started
+    finally:
+        crawler.close()
+
+
+def run_async(db_path, result, workers):
+    """AsyncCrawlEngine.process_search_results"""
+    Config.MAX_WORKERS = workers
+    crawler = NaverMedicineCrawler('benchmark', 'benchmark', db_path)
+
+    async def process():
+        async with AsyncCrawlEngine(crawler.api_client, crawler.search_manager, crawler.db_manager, crawler.logger) as engine:
+            processed, _, _ = await engine.process_search_results(result)
+        return processed
+
+    try:
+        started = time.perf_counter()
+        processed = asyncio.run(process())
+        crawler.db_manager.flush()
+        return processed, time.perf_counter() - started
+    finally:
+        crawler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검색 결과 처리 방식 벤치마크')
+    parser.add_argument('--items', type=int, default=100, help='검색 결과 항목 수')
+    parser.add_argument('--latency', type=float, default=0.1, help='상세 페이지 응답 지연 (초)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 요청 수 (스레드/비동기)')
+    args = parser.parse_args()
+
+    # 로컬 상세 페이지 서버
+    DetailPageHandler.latency = args.latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DetailPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    Config.ENABLE_IMAGE_DOWNLOAD = False
+    # 항목마다 남는 크롤러 로그는 측정에서 제외
+    crawler_module.setup_logging = lambda *args, **kwargs: logging.getLogger('benchmark_crawl_engine')
+
+    modes = (
+        ('sequential', run_threaded, 1),
+        ('threads', run_threaded, args.workers),
+        ('async', run_async, args.workers)
+    )
+    rows = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            # 방식마다 빈 DB 에서 시작 (앞 방식이 저장한 약품이 중복 검사 색인에 들어가지 않도록)
+            for label, run, workers in modes:
+                db_path = os.path.join(directory, f'{label}.db')
+                result = search_result(base_url, label, args.items)
+                processed, elapsed = run(db_path, result, workers)
+                rows.append((label, workers, processed, elapsed))
+    finally:
+        server.shutdown()
+
+    # 모든 항목을 저장하지 못한 방식이 있으면 속도 비교가 의미 없음
+    incomplete = [f"{label}({processed}/{args.items})" for label, _, processed, _ in rows if processed != args.items]
+    if incomplete:
+        print(f"저장 건수가 항목 수와 다릅니다: {', '.join(incomplete)}")
+        sys.exit(1)
+
+    print(f"{'방식':<12}{'동시 요청':>10}{'저장':>8}{'시간(초)':>10}{'속도(개/초)':>14}")
+    for label, workers, processed, elapsed in rows:
+        print(f"{label:<12}{workers:>10}{processed:>8}{elapsed:>10.2f}{processed / elapsed:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import base64
+import json
+import logging
+
+from result_cache import LRUCache, register_cache
+
+logger = logging.getLogger('app')
+
+
+#---------------------------------------------------
+# 키셋 커서 (item_name, id)
+#---------------------------------------------------
+def encode_cursor(sort_value, row_id):
+    """(정렬값, id) 를 URL 에 사용할 수 있는 커서 문자열로 변환"""
+    raw = json.dumps([sort_value, row_id], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """커서 문자열을 (정렬값, id) 로 변환, 잘못된 값이면 None"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded).decode('utf-8'))
+        return sort_value, int(row_id)
+    except Exception as e:
+        logger.warning(f"잘못된 페이지 커서: {token} ({e})")
+        return None
+
+def keyset_condition(after, sort_column='item_name', id_column='id'):
+    """커서 이후 행을 선택하는 WHERE 조건 (ORDER BY sort_column, id_column 기준)"""
+    sort_value, row_id = after
+    if sort_value is None:
+        # NULL 은 오름차순에서 가장 앞에 위치
+        return (
+            f"({sort_column} IS NOT NULL OR ({sort_column} IS NULL AND {id_column} > %s))",
+            [row_id]
+        )
+    return (
+        f"({sort_column} > %s OR ({sort_column} = %s AND {id_column} > %s))",
+        [sort_value, sort_value, row_id]
+    )
+
+def keyset_slice(sorted_ids, key_func, after, per_page):
+    """정렬된 id 목록에서 커서 이후 한 페이지를 잘라냄 (이진 탐색)
+
+    Returns:
+        (페이지 id 목록, 다음 페이지 존재 여부)
+    """
+    start = 0
+    if after is not None:
+        after_key = (after[0] or '', after[1])
+        lo, hi = 0, len(sorted_ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_func(sorted_ids[mid]) <= after_key:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+    page_ids = sorted_ids[start:start + per_page]
+    return page_ids, start + per_page < len(sorted_ids)
+
+
+#---------------------------------------------------
+# 검색 결과 수 캐시
+#---------------------------------------------------
+count_cache = register_cache('search_count', LRUCache(max_entries=1024, ttl=300))
+
+def estimate_count(cursor, table, where_clause, params):
+    """EXPLAIN 의 예상 행 수로 결과 수 추정"""
+    try:
+        cursor.execute(f"EXPLAIN SELECT id FROM {table} WHERE {where_clause}", params)
+        plan = cursor.fetchone()
+        if not plan or plan.get('rows') is None:
+            return None
+        filtered = float(plan.get('filtered') or 100.0)
+        return int(plan['rows'] * filtered / 100.0)
+    except Exception as e:
+        logger.warning(f"결과 수 추정 실패: {e}")
+        return None
+
+def exact_count(cursor, table, where_clause, params):
+    """COUNT(*) 로 정확한 결과 수 계산"""
+    cursor.execute(f"SELECT COUNT(*) AS total FROM {table} WHERE {where_clause}", params)
+    return cursor.fetchone()['total']
+
+
+#---------------------------------------------------
+# 페이지 조회
+#---------------------------------------------------
+def fetch_page(cursor, columns, table, where_clause, params, per_page,
+               page=1, after=None, exact=False, sort_column='item_name', id_column='id'):
+    """한 페이지 조회 및 전체 결과 수 계산
+
+    after 커서가 있으면 OFFSET 없이 키셋 조건으로 조회하므로 페이지 깊이와
+    무관하게 비용이 일정하다. 전체 결과 수는 캐시 값을 우선 사용하고,
+    exact=True 인 경우에만 정확한 값을 계산한다 (첫 페이지는 COUNT(*) OVER()
+    로 페이지 조회와 한 번에 계산). 그 외에는 EXPLAIN 추정치를 사용한다.
+
+    Returns:
+        {'rows', 'total_count', 'count_is_estimate', 'next_cursor'}
+    """
+    count_key = (table, where_clause, tuple(params))
+    cached_total = count_cache.get(count_key)
+
+    page_where = where_clause
+    page_params = list(params)
+    if after is not None:
+        condition, condition_params = keyset_condition(after, sort_column, id_column)
+        page_where = f"({where_clause}) AND {condition}"
+        page_params.extend(condition_params)
+
+    offset = 0 if after is not None else (page - 1) * per_page
+    single_pass = exact and cached_total is None and after is None
+
+    select_columns = columns
+    if single_pass:
+        select_columns += ", COUNT(*) OVER() AS _total_count"
+
+    query = (
+        f"SELECT {select_columns} FROM {table} WHERE {page_where} "
+        f"ORDER BY {sort_column}, {id_column} LIMIT %s"
+    )
+    page_params.append(per_page + 1)
+    if after is None:
+        query += " OFFSET %s"
+        page_params.append(offset)
+
+    cursor.execute(query, page_params)
+    rows = list(cursor.fetchall())
+
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+
+    count_is_estimate = False
+    if single_pass and rows:
+        total_count = rows[0]['_total_count']
+        for row in rows:
+            row.pop('_total_count', None)
+        count_cache.set(count_key, total_count)
+    elif cached_total is not None:
+        total_count = cached_total
+    elif exact:
+        total_count = exact_count(cursor, table, where_clause, params)
+        count_cache.set(count_key, total_count)
+    else:
+        total_count = estimate_count(cursor, table, where_clause, params)
+        if total_count is None:
+            total_count = exact_count(cursor, table, where_clause, params)
+            count_cache.set(count_key, total_count)
+        else:
+            count_is_estimate = True
+
+    # 추정치를 실제로 확인된 행 수로 보정 (다음 페이지가 없으면 확인된 행 수가 전체 결과 수)
+    seen = (page - 1) * per_page + len(rows) + (1 if has_next else 0)
+    if count_is_estimate and (total_count < seen or not has_next):
+        total_count = seen
+        if not has_next and after is None:
+            # OFFSET 조회의 마지막 페이지이면 정확한 값
+            count_is_estimate = False
+            count_cache.set(count_key, total_count)
+
+    next_cursor = None
+    if has_next and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(last.get(sort_column), last[id_column])
+
+    return {
+        'rows': rows,
+        'total_count': total_count,
+        'count_is_estimate': count_is_estimate,
+        'next_cursor': next_cursor
+    }
@@ -0,0 +1,225 @@
+import threading
+import time
+import logging
+
+logger = logging.getLogger('app')
+
+# 비트맵으로 색인하는 낱알 속성 (모두 값의 종류가 적은 컬럼)
+BITMAP_ATTRIBUTES = ('drug_shape', 'color_class1', 'line_front', 'line_back')
+
+# 비트맵 인덱스 생성에 필요한 컬럼
+INDEX_COLUMNS = "id, item_name, drug_shape, color_class1, line_front, line_back"
+
+
+def bitmap_from_positions(positions, size):
+    """위치 목록을 정수 비트맵으로 변환 (O(size))"""
+    bits = bytearray(b'0' * size)
+    for position in positions:
+        bits[position] = 0x31  # '1'
+    bits.reverse()
+    return int(bits, 2) if size else 0
+
+
+class PillAttributeIndex:
+    """drug_identification 낱알 속성별 비트맵 인덱스
+
+    각 행은 (item_name, id) 정렬 순서의 위치(비트)로 표현되고, 속성 값마다
+    해당 행들의 비트를 모은 정수 비트맵을 가진다. 모양/색상/분할선 조합은
+    비트맵 AND/OR 로 계산하며, 비트 순서가 곧 정렬 순서이므로 페이지 추출 시
+    별도 정렬이 필요 없다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids = []
+        self._sort_keys = []
+        self._positions = {}
+        self._bitmaps = {}
+        self._line_cross = {}
+        self._line_other = {}
+        self._all = 0
+        self.built_at = None
+        self.stale = False
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    def build(self, rows):
+        """DB 행 목록으로 비트맵 생성"""
+        started = time.perf_counter()
+        rows = sorted(rows, key=lambda row: (row.get('item_name') or '', row['id']))
+
+        ids = []
+        sort_keys = []
+        positions = {}
+        # 속성 값별 위치 목록을 모은 뒤 한 번에 비트맵으로 변환
+        value_positions = {attribute: {} for attribute in BITMAP_ATTRIBUTES}
+        line_cross = {'line_front': [], 'line_back': []}
+        line_other = {'line_front': [], 'line_back': []}
+
+        for position, row in enumerate(rows):
+            ids.append(row['id'])
+            sort_keys.append((row.get('item_name') or '', row['id']))
+            positions[row['id']] = position
+
+            for attribute in BITMAP_ATTRIBUTES:
+                value = row.get(attribute)
+                if value is None:
+                    continue
+                value = value.strip()
+                value_positions[attribute].setdefault(value, []).append(position)
+
+                if attribute in line_cross:
+                    # '+' 검색은 '십자분할선' 등도 포함, '기타'는 +, - 이외의 값
+                    if value == '+' or '십자' in value:
+                        line_cross[attribute].append(position)
+                    if value not in ('+', '-'):
+                        line_other[attribute].append(position)
+
+        size = len(ids)
+        bitmaps = {
+            attribute: {
+                value: bitmap_from_positions(value_list, size)
+                for value, value_list in values.items()
+            }
+            for attribute, values in value_positions.items()
+        }
+        line_cross = {key: bitmap_from_positions(value, size) for key, value in line_cross.items()}
+        line_other = {key: bitmap_from_positions(value, size) for key, value in line_other.items()}
+
+        with self._lock:
+            self._ids = ids
+            self._sort_keys = sort_keys
+            self._positions = positions
+            self._bitmaps = bitmaps
+            self._line_cross = line_cross
+            self._line_other = line_other
+            self._all = (1 << len(ids)) - 1
+            self.built_at = time.time()
+            self.stale = False
+
+        logger.info(
+            f"낱알 속성 비트맵 인덱스 생성 완료: {len(ids)}개 행, "
+            f"{time.perf_counter() - started:.2f}초"
+        )
+
+    def _any_of(self, attribute, values):
+        """속성 값 중 하나라도 일치하는 행의 비트맵 (OR)"""
+        attribute_bitmaps = self._bitmaps[attribute]
+        bitmap = 0
+        for value in values:
+            bitmap |= attribute_bitmaps.get(value, 0)
+        return bitmap
+
+    def _line(self, attribute, value):
+        """분할선 검색 조건 비트맵"""
+        if value == '+':
+            return self._line_cross[attribute]
+        if value == '기타':
+            return self._line_other[attribute]
+        return self._bitmaps[attribute].get(value, 0)
+
+    def query(self, filters):
+        """모양/색상/분할선 조건에 맞는 행의 비트맵"""
+        with self._lock:
+            bitmap = self._all
+            if filters.get('drug_shape'):
+                bitmap &= self._any_of('drug_shape', filters['drug_shape'])
+            if filters.get('colors'):
+                bitmap &= self._any_of('color_class1', filters['colors'])
+            if filters.get('line_front'):
+                bitmap &= self._line('line_front', filters['line_front'])
+            if filters.get('line_back'):
+                bitmap &= self._line('line_back', filters['line_back'])
+            return bitmap
+
+    def contains(self, bitmap, row_id):
+        """비트맵에 해당 행이 포함되어 있는지 확인"""
+        position = self._positions.get(row_id)
+        return position is not None and (bitmap >> position) & 1 == 1
+
+    @staticmethod
+    def count(bitmap):
+        return bin(bitmap).count('1')
+
+    def page(self, bitmap, per_page, offset=0, after=None):
+        """비트맵에서 한 페이지의 id 추출
+
+        Args:
+            offset: 건너뛸 행 수 (after 가 없을 때)
+            after: (item_name, id) 키셋 커서
+
+        Returns:
+            (id 목록, 다음 페이지 존재 여부, 마지막 행의 정렬 키)
+        """
+        with self._lock:
+            if after is not None:
+                # 커서 이후 위치의 비트만 남김 (이진 탐색)
+                after_key = (after[0] or '', after[1])
+                lo, hi = 0, len(self._sort_keys)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self._sort_keys[mid] <= after_key:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                bitmap = (bitmap >> lo) << lo
+                offset = 0
+
+            # 낮은 비트(정렬 앞쪽)부터 순서대로 탐색
+            bits = format(bitmap, 'b')[::-1]
+            position = bits.find('1')
+            skipped = 0
+            while position != -1 and skipped < offset:
+                position = bits.find('1', position + 1)
+                skipped += 1
+
+            ids = []
+            last_key = None
+            while position != -1 and len(ids) < per_page:
+                ids.append(self._ids[position])
+                last_key = self._sort_keys[position]
+                position = bits.find('1', position + 1)
+
+            return ids, position != -1, last_key
+
+
+# 애플리케이션 전역 인덱스 (최초 검색 시 생성, 데이터 변경 시 재생성)
+_pill_index = PillAttributeIndex()
+_build_lock = threading.Lock()
+_last_failure = 0.0
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+BUILD_RETRY_DELAY = 60
+
+
+def invalidate_pill_index():
+    """다음 사용 시 인덱스를 다시 생성하도록 표시"""
+    _pill_index.stale = True
+
+
+def get_pill_index(load_rows):
+    """전역 비트맵 인덱스 반환, 없거나 데이터가 변경된 경우 load_rows()로 재생성
+
+    Returns:
+        PillAttributeIndex 또는 생성 실패 시 None
+    """
+    global _last_failure
+    index = _pill_index
+    if index.is_ready and not index.stale:
+        return index
+
+    if time.time() - _last_failure < BUILD_RETRY_DELAY:
+        return None
+
+    with _build_lock:
+        if index.is_ready and not index.stale:
+            return index
+        try:
+            index.build(load_rows())
+        except Exception as e:
+            _last_failure = time.time()
+            logger.error(f"낱알 속성 비트맵 인덱스 생성 실패: {e}")
+            return None
+    return index
@@ -0,0 +1,164 @@
+import os
+import pickle
+import threading
+import time
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger('app')
+
+
+class LRUCache:
+    """스레드 안전 인메모리 LRU 캐시 (항목별 TTL, 적중/실패 지표 포함)"""
+
+    def __init__(self, max_entries=1024, ttl=300, name=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.name = name
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._entries[key] = (value, time.time() + (ttl or self.ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+
+class RedisBackend:
+    """여러 워커 프로세스가 공유하는 Redis 캐시 백엔드 (redis 패키지 필요)"""
+
+    def __init__(self, url, prefix='medicine_app:'):
+        import redis  # 선택적 의존성
+        self.client = redis.Redis.from_url(url, socket_timeout=0.2)
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key, value, ttl):
+        self.client.setex(self.prefix + key, int(ttl), pickle.dumps(value))
+
+
+def create_shared_backend():
+    """REDIS_URL 이 설정된 경우 공유 캐시 백엔드 생성 (사용 불가 시 None)"""
+    url = os.getenv('REDIS_URL')
+    if not url:
+        return None
+    try:
+        return RedisBackend(url)
+    except Exception as e:
+        logger.warning(f"공유 캐시 백엔드 사용 불가, 인메모리 캐시만 사용: {e}")
+        return None
+
+
+class TieredCache:
+    """인메모리 LRU(1차) + 선택적 공유 백엔드(2차) 캐시
+
+    키는 문자열이어야 하며, 공유 백엔드 오류는 캐시 실패로 처리한다.
+    """
+
+    def __init__(self, name, max_entries=1024, ttl=300, shared_backend=None):
+        self.name = name
+        self.local = LRUCache(max_entries=max_entries, ttl=ttl, name=name)
+        self.shared = shared_backend
+        self.shared_hits = 0
+        self.shared_errors = 0
+
+    def get(self, key):
+        value = self.local.get(key)
+        if value is not None or self.shared is None:
+            return value
+        try:
+            value = self.shared.get(f"{self.name}:{key}")
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"공유 캐시 조회 실패 ({self.name}): {e}")
+            return None
+        if value is not None:
+            self.shared_hits += 1
+            self.local.set(key, value)
+        return value
+
+    def set(self, key, value):
+        self.local.set(key, value)
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(f"{self.name}:{key}", value, self.local.ttl)
+        except Exception as e:
+            self.shared_errors += 1
+            logger.warning(f"공유 캐시 저장 실패 ({self.name}): {e}")
+
+    def clear(self):
+        """인메모리 캐시 비우기 (공유 백엔드는 키에 포함된 데이터 버전으로 무효화)"""
+        self.local.clear()
+
+    def stats(self):
+        stats = self.local.stats()
+        stats['shared_backend'] = type(self.shared).__name__ if self.shared else None
+        stats['shared_hits'] = self.shared_hits
+        stats['shared_errors'] = self.shared_errors
+        return stats
+
+
+# 지표 노출을 위한 캐시 레지스트리
+_registry = {}
+
+
+def register_cache(name, cache):
+    """캐시를 지표 레지스트리에 등록"""
+    _registry[name] = cache
+    return cache
+
+
+def all_cache_stats():
+    """등록된 모든 캐시의 지표"""
+    return {name: cache.stats() for name, cache in _registry.items()}
@@ -0,0 +1,221 @@
+import heapq
+import math
+import threading
+import time
+import logging
+from array import array
+
+from search_index import normalize_text, extract_ngrams
+
+logger = logging.getLogger('app')
+
+# 색인 대상 필드와 가중치 (약품명 일치를 효능 설명 일치보다 높게 평가)
+FIELD_WEIGHTS = {
+    'item_name': 3.0,
+    'class_name': 2.0,
+    'chart': 1.0,
+    'efcy_qesitm': 1.5
+}
+
+# BM25 매개변수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 최고 점수 대비 이 비율 미만인 문서는 결과에서 제외 (일부 바이그램만 우연히 일치한 문서)
+MIN_SCORE_RATIO = 0.3
+
+# 효능 설명 조인 (unified_medicines 는 item_seq 별 한 행으로 묶어 한 번만 읽음,
+# 행마다 상관 서브쿼리를 실행하면 item_seq 색인이 없는 테이블을 매번 전체 조회함)
+EFFICACY_JOIN = """
+    LEFT JOIN (SELECT item_seq, MAX(efcy_qesitm) AS efcy_qesitm
+               FROM unified_medicines GROUP BY item_seq) u
+           ON u.item_seq = d.item_seq
+"""
+
+# 색인 생성용 조회
+RETRIEVAL_INDEX_QUERY = f"""
+    SELECT d.id, d.item_name, d.class_name, d.chart, u.efcy_qesitm
+    FROM drug_identification d
+    {EFFICACY_JOIN}
+"""
+
+
+def tokenize(text):
+    """BM25 색인/검색용 토큰 목록 (어절별 바이그램, 한 글자 어절은 그대로)"""
+    tokens = []
+    for word in normalize_text(text).split():
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def query_tokens(terms):
+    """검색어 목록 → 중복 없는 토큰 집합 (모든 확장 검색어를 한 번에 평가하기 위함)"""
+    tokens = set()
+    for term in terms:
+        for word in normalize_text(term).split():
+            if len(word) == 1:
+                tokens.add(word)
+            else:
+                tokens.update(extract_ngrams(word, 2))
+    return tokens
+
+
+class BM25Index:
+    """item_name / class_name / chart / efcy_qesitm 에 대한 BM25 점수 역색인
+
+    필드별로 토큰 → (문서 위치, 빈도) 포스팅을 두고, 필드 가중치를 곱한
+    BM25 점수의 합으로 문서를 평가한다. 검색 시 모든 검색어의 토큰을 한 번에
+    모아 포스팅을 한 번씩만 순회하며, 상위 k 개는 힙으로 추출한다.
+    """
+
+    def __init__(self, k1=BM25_K1, b=BM25_B, field_weights=None):
+        self.k1 = k1
+        self.b = b
+        self.field_weights = dict(field_weights or FIELD_WEIGHTS)
+        self._lock = threading.RLock()
+        self._ids = array('I')
+        self._postings = {}
+        self._lengths = {}
+        self._avg_lengths = {}
+        self.built_at = None
+        self.doc_count = 0
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    def build(self, rows):
+        """DB 행 목록으로 색인 생성 (rows: id 와 색인 대상 필드를 포함한 dict)"""
+        started = time.perf_counter()
+        ids = array('I')
+        postings = {field: {} for field in self.field_weights}
+        lengths = {field: array('I') for field in self.field_weights}
+
+        for position, row in enumerate(rows):
+            ids.append(row['id'])
+            for field in self.field_weights:
+                tokens = tokenize(row.get(field))
+                lengths[field].append(len(tokens))
+                if not tokens:
+                    continue
+                counts = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                field_postings = postings[field]
+                for token, count in counts.items():
+                    posting = field_postings.get(token)
+                    if posting is None:
+                        posting = field_postings[token] = (array('I'), array('H'))
+                    posting[0].append(position)
+                    posting[1].append(min(count, 0xFFFF))
+
+        doc_count = len(ids)
+        avg_lengths = {
+            field: (sum(field_lengths) / doc_count if doc_count else 0.0)
+            for field, field_lengths in lengths.items()
+        }
+
+        with self._lock:
+            self._ids = ids
+            self._postings = postings
+            self._lengths = lengths
+            self._avg_lengths = avg_lengths
+            self.doc_count = doc_count
+            self.built_at = time.time()
+
+        logger.info(
+            f"BM25 검색 인덱스 생성 완료: 문서 {doc_count}개, "
+            f"{time.perf_counter() - started:.2f}초"
+        )
+
+    def _idf(self, doc_freq):
+        return math.log(1 + (self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def top_k(self, terms, k=10, min_score_ratio=MIN_SCORE_RATIO):
+        """검색어 목록으로 상위 k 개 문서 검색
+
+        Args:
+            min_score_ratio: 최고 점수 대비 최소 점수 비율 (이보다 낮은 문서는 제외)
+
+        Returns:
+            [(id, 점수)] 점수 내림차순
+        """
+        tokens = query_tokens(terms)
+        if not tokens:
+            return []
+
+        with self._lock:
+            k1, b = self.k1, self.b
+            scores = {}
+            for field, weight in self.field_weights.items():
+                field_postings = self._postings[field]
+                lengths = self._lengths[field]
+                avg_length = self._avg_lengths[field] or 1.0
+                for token in tokens:
+                    posting = field_postings.get(token)
+                    if posting is None:
+                        continue
+                    positions, freqs = posting
+                    token_weight = weight * self._idf(len(positions)) * (k1 + 1)
+                    for position, freq in zip(positions, freqs):
+                        norm = k1 * (1 - b + b * lengths[position] / avg_length)
+                        scores[position] = scores.get(position, 0.0) + token_weight * freq / (freq + norm)
+
+            ids = self._ids
+            best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+            if not best:
+                return []
+            cutoff = best[0][1] * min_score_ratio
+            return [(ids[position], score) for position, score in best if score >= cutoff]
+
+
+# 애플리케이션 전역 색인 (최초 검색 시 생성, 데이터 변경 또는 max_age 경과 시 재생성)
+_retrieval_index = BM25Index()
+_build_lock = threading.Lock()
+_last_failure = 0.0
+_stale = False
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+BUILD_RETRY_DELAY = 60
+
+
+def invalidate_retrieval_index():
+    """다음 사용 시 색인을 다시 생성하도록 표시"""
+    global _stale
+    _stale = True
+
+
+def get_retrieval_index(load_rows, max_age=3600):
+    """전역 BM25 색인 반환, 없거나 오래된 경우 load_rows()로 재생성
+
+    Returns:
+        BM25Index 또는 생성 실패 시 None
+    """
+    global _last_failure, _stale
+    index = _retrieval_index
+
+    def is_fresh():
+        return index.is_ready and not _stale and time.time() - index.built_at < max_age
+
+    if is_fresh():
+        return index
+
+    if time.time() - _last_failure < BUILD_RETRY_DELAY:
+        return index if index.is_ready else None
+
+    with _build_lock:
+        if is_fresh():
+            return index
+        try:
+            _stale = False
+            index.build(load_rows())
+        except Exception as e:
+            _last_failure = time.time()
+            _stale = True
+            logger.error(f"BM25 검색 인덱스 생성 실패: {e}")
+            # 기존 색인이 있으면 계속 사용
+            return index if index.is_ready else None
+    return index
@@ -0,0 +1,197 @@
+import threading
+import time
+import logging
+from array import array
+
+logger = logging.getLogger('app')
+
+# 인덱스 대상 필드 (검색 파라미터 키 → unified_medicines 컬럼)
+INDEXED_FIELDS = ('item_name', 'entp_name', 'se_qesitm')
+
+
+def normalize_text(text):
+    """검색/색인용 텍스트 정규화 (소문자 변환, 공백 정리)"""
+    if not text:
+        return ''
+    return ' '.join(str(text).lower().split())
+
+
+def extract_ngrams(text, n=2):
+    """문자 단위 n-gram 집합 추출 (한글은 음절 단위로 분리됨)"""
+    if len(text) < n:
+        return set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class NgramSearchIndex:
+    """item_name / entp_name / se_qesitm 에 대한 인메모리 n-gram 역색인
+
+    색인은 바이그램(2-gram) 포스팅 리스트로 구성하고, 후보 문서는
+    원문 부분 문자열 검사로 최종 확인하므로 LIKE '%x%' 와 같은 결과를 돌려준다.
+    """
+
+    def __init__(self, ngram_size=2):
+        self.ngram_size = ngram_size
+        self._lock = threading.RLock()
+        self._postings = {}
+        self._texts = {}
+        self._sort_keys = {}
+        self._all_ids = frozenset()
+        self.built_at = None
+        self.doc_count = 0
+
+    @property
+    def is_ready(self):
+        return self.built_at is not None
+
+    def build(self, rows):
+        """DB 행 목록으로 색인 생성 (rows: id, item_name, entp_name, se_qesitm 포함 dict)"""
+        started = time.perf_counter()
+        postings = {field: {} for field in INDEXED_FIELDS}
+        texts = {field: {} for field in INDEXED_FIELDS}
+        sort_keys = {}
+
+        for row in rows:
+            doc_id = row['id']
+            sort_keys[doc_id] = (row.get('item_name') or '', doc_id)
+            for field in INDEXED_FIELDS:
+                text = normalize_text(row.get(field))
+                if not text:
+                    continue
+                texts[field][doc_id] = text
+                field_postings = postings[field]
+                for gram in extract_ngrams(text, self.ngram_size):
+                    posting = field_postings.get(gram)
+                    if posting is None:
+                        posting = field_postings[gram] = array('I')
+                    posting.append(doc_id)
+
+        with self._lock:
+            self._postings = postings
+            self._texts = texts
+            self._sort_keys = sort_keys
+            self._all_ids = frozenset(sort_keys)
+            self.doc_count = len(sort_keys)
+            self.built_at = time.time()
+
+        logger.info(
+            f"n-gram 검색 인덱스 생성 완료: 문서 {self.doc_count}개, "
+            f"{time.perf_counter() - started:.2f}초"
+        )
+
+    def sort_key(self, doc_id):
+        """문서의 정렬 키 (item_name, id)"""
+        return self._sort_keys[doc_id]
+
+    def _match_term(self, field, term):
+        """단일 검색어와 일치하는 문서 id 집합"""
+        term = normalize_text(term)
+        if not term:
+            return set()
+
+        field_texts = self._texts[field]
+        grams = extract_ngrams(term, self.ngram_size)
+
+        if grams:
+            field_postings = self._postings[field]
+            posting_lists = []
+            for gram in grams:
+                posting = field_postings.get(gram)
+                if not posting:
+                    return set()
+                posting_lists.append(posting)
+            # 가장 짧은 포스팅 리스트부터 교집합
+            posting_lists.sort(key=len)
+            candidates = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return candidates
+        else:
+            # n-gram 보다 짧은 검색어는 색인된 텍스트 전체에서 확인
+            candidates = field_texts.keys()
+
+        # 바이그램 교집합은 상위집합이므로 실제 포함 여부로 확정
+        return {doc_id for doc_id in candidates if term in field_texts.get(doc_id, '')}
+
+    def search(self, field_terms):
+        """필드별 검색어로 검색 (필드 내부는 OR, 필드 간에는 AND)
+
+        Args:
+            field_terms: {'item_name': [...], 'entp_name': [...], 'se_qesitm': [...]}
+
+        Returns:
+            (item_name, id) 순으로 정렬된 문서 id 리스트
+        """
+        with self._lock:
+            matched = None
+            for field in INDEXED_FIELDS:
+                terms = [t for t in field_terms.get(field, []) if t and t.strip()]
+                if not terms:
+                    continue
+                field_matched = set()
+                for term in terms:
+                    field_matched |= self._match_term(field, term)
+                matched = field_matched if matched is None else matched & field_matched
+                if not matched:
+                    return []
+
+            if matched is None:
+                matched = self._all_ids
+
+            sort_keys = self._sort_keys
+            return sorted(matched, key=sort_keys.__getitem__)
+
+
+# 애플리케이션 전역 인덱스 (최초 검색 시 생성, 데이터 변경 또는 max_age 경과 시 재생성)
+_search_index = NgramSearchIndex()
+_build_lock = threading.Lock()
+_last_failure = 0.0
+_stale = False
+
+# 생성 실패 후 재시도까지 대기 시간 (초)
+BUILD_RETRY_DELAY = 60
+
+
+def invalidate_search_index():
+    """다음 사용 시 인덱스를 다시 생성하도록 표시"""
+    global _stale
+    _stale = True
+
+
+def get_search_index(load_rows, max_age=3600):
+    """전역 n-gram 인덱스 반환, 없거나 오래된 경우 load_rows()로 재생성
+
+    Args:
+        load_rows: 색인할 행 목록을 반환하는 함수
+        max_age: 인덱스 재생성 주기 (초)
+
+    Returns:
+        NgramSearchIndex 또는 생성 실패 시 None
+    """
+    global _last_failure, _stale
+    index = _search_index
+
+    def is_fresh():
+        return index.is_ready and not _stale and time.time() - index.built_at < max_age
+
+    if is_fresh():
+        return index
+
+    if time.time() - _last_failure < BUILD_RETRY_DELAY:
+        return index if index.is_ready else None
+
+    with _build_lock:
+        # 다른 스레드가 먼저 생성한 경우
+        if is_fresh():
+            return index
+        try:
+            _stale = False
+            index.build(load_rows())
+        except Exception as e:
+            _last_failure = time.time()
+            _stale = True
+            logger.error(f"n-gram 검색 인덱스 생성 실패: {e}")
+            # 기존 인덱스가 있으면 계속 사용
+            return index if index.is_ready else None
+    return index